@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""A script that benchmarks the conversion of many objects to numpy arrays
+using the function :func:`czekitout.parallel.convert`, in its serial, threaded,
+and process-parallel modes.
+
+The pool of processes is started by the first call in the process-parallel
+mode, and reused by the subsequent ones, hence the minimum time over several
+repeats excludes the time taken to start said pool. The process-parallel mode
+can only be faster than the serial mode on machines with several CPU cores.
+Even then, nested lists are pickled in order to pass them to the worker
+processes, and valid numpy arrays are copied into shared memory blocks, as
+described in the summary documentation of the module
+:mod:`czekitout.parallel`, which limits the speedup, if any, for such objects.
+
+To run the benchmark, run the following command from the root of the
+repository::
+
+    python benchmarks/benchmark_parallel.py
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For timing code.
+import timeit
+
+
+
+# For general array handling.
+import numpy as np
+
+
+
+# For converting many objects to numpy arrays in parallel.
+import czekitout.parallel
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+_modes = ("serial", "thread", "process")
+
+_num_objs = 32
+
+_matrix_shape = (500, 500)
+
+
+
+def _generate_objs():
+    rng = np.random.default_rng(seed=0)
+    matrices = tuple(rng.random(_matrix_shape) for _ in range(_num_objs))
+
+    objs_of_obj_kinds = {"nested lists": tuple(matrix.tolist()
+                                               for matrix
+                                               in matrices),
+                         "float64 arrays": matrices}
+
+    return objs_of_obj_kinds
+
+
+
+def run_benchmark(num_repeats=3, max_workers=None):
+    objs_of_obj_kinds = _generate_objs()
+
+    print("Converting {} objects of shape {} via "
+          "``to_nonnegative_numpy_matrix``:".format(_num_objs, _matrix_shape))
+
+    for obj_kind, objs in objs_of_obj_kinds.items():
+        print("    {}:".format(obj_kind))
+        for mode in _modes:
+            kwargs = {"objs": objs,
+                      "obj_name": "objs",
+                      "convert_func_name": "to_nonnegative_numpy_matrix",
+                      "mode": mode,
+                      "max_workers": max_workers}
+            stmt = lambda: czekitout.parallel.convert(**kwargs)
+            times = timeit.repeat(stmt, repeat=num_repeats, number=1)
+            print("        {:<10} {:10.2f} ms".format(mode, 1e3*min(times)))
+
+    return None
+
+
+
+if __name__ == "__main__":
+    run_benchmark()
+
+
+
+###########################
+## Define error messages ##
+###########################
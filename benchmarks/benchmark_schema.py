@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""A script that benchmarks the validation and conversion of a dictionary of
+parameters using a :class:`czekitout.schema.Schema` object, against the
+equivalent hand-written sequence of ``czekitout.convert.to_*`` calls. The two
+are expected to take about as long, since the schema calls the same public
+functions, with the same per-call validation of their ``obj_name`` arguments.
+
+To run the benchmark, run the following command from the root of the
+repository::
+
+    python benchmarks/benchmark_schema.py
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For timing code.
+import timeit
+
+
+
+# For converting objects.
+import czekitout.convert
+
+# For validating and converting dictionary-like objects.
+import czekitout.schema
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+_names_of_convert_funcs = ("to_float",
+                           "to_positive_float",
+                           "to_nonnegative_int",
+                           "to_bool",
+                           "to_pair_of_floats")
+
+_sample_values = (2.5, 3, 4, True, (1, 2))
+
+_num_params = 60
+
+
+
+def _generate_specs_and_params():
+    specs = dict()
+    params = dict()
+
+    for param_idx in range(_num_params):
+        choice_idx = param_idx % len(_names_of_convert_funcs)
+        key = "param_{}".format(param_idx)
+        specs[key] = _names_of_convert_funcs[choice_idx]
+        params[key] = _sample_values[choice_idx]
+
+    return specs, params
+
+
+
+def _convert_params_by_hand(params, specs):
+    # The hand-written equivalent of a schema: one convert call per key,
+    # stopping at the first entry that fails validation.
+    result = dict()
+    for key, name_of_convert_func in specs.items():
+        convert_func = getattr(czekitout.convert, name_of_convert_func)
+        result[key] = convert_func(params[key], key)
+
+    return result
+
+
+
+def run_benchmark(num_repeats=5, num_calls_per_repeat=200):
+    specs, params = _generate_specs_and_params()
+    schema = czekitout.schema.Schema(specs)
+
+    assert schema(params, "params") == _convert_params_by_hand(params, specs)
+
+    stmts = {"hand-written calls": \
+             lambda: _convert_params_by_hand(params, specs),
+             "schema": \
+             lambda: schema(params, "params")}
+
+    print("Validating and converting a dictionary of {} "
+          "parameters:".format(_num_params))
+
+    for label, stmt in stmts.items():
+        times = timeit.repeat(stmt,
+                              repeat=num_repeats,
+                              number=num_calls_per_repeat)
+        time_per_call = min(times) / num_calls_per_repeat
+        print("    {:<20} {:10.2f} us per call".format(label,
+                                                       1e6*time_per_call))
+
+    return None
+
+
+
+if __name__ == "__main__":
+    run_benchmark()
+
+
+
+###########################
+## Define error messages ##
+###########################
@@ -23,11 +23,28 @@ when exceptions are thrown.
 ## Load libraries/packages/modules ##
 #####################################
 
+# For importing child modules lazily.
+import importlib
+
+
+
 # Import child modules and packages of current package.
 import czekitout.name
+import czekitout.errors
+import czekitout.config
 import czekitout.isa
 import czekitout.check
 import czekitout.convert
+import czekitout.schema
+import czekitout.annotations
+import czekitout.batch
+import czekitout.decorators
+import czekitout.stream
+import czekitout.incremental
+import czekitout.packed
+
+# Import the argument-validation decorator into the top-level namespace.
+from czekitout.decorators import validated
 
 # Get version of current package.
 from czekitout.version import __version__
@@ -39,10 +56,30 @@ from czekitout.version import __version__
 ##################################
 
 # List of public objects in package.
-__all__ = []
+__all__ = ["validated"]
+
+
+
+# The child modules that are imported only upon first access, since they import
+# modules of the standard library, e.g. ``asyncio``, that are otherwise unused.
+_lazily_imported_child_module_names = ("aio", "parallel", "io")
+
+
+
+def __getattr__(name):
+    if name in _lazily_imported_child_module_names:
+        result = importlib.import_module("czekitout." + name)
+    else:
+        err_msg_args = (__name__, name)
+        raise AttributeError(_getattr_err_msg_1.format(*err_msg_args))
+
+    return result
 
 
 
 ###########################
 ## Define error messages ##
 ###########################
+
+_getattr_err_msg_1 = \
+    ("module '{}' has no attribute '{}'")
@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains coroutine counterparts of the functions that validate and convert
+numpy arrays, and a class for validating and converting the elements of
+asynchronous iterables lazily.
+
+Each coroutine function in the current module has the same name and parameters
+as its synchronous counterpart in the module :mod:`czekitout.check` or
+:mod:`czekitout.convert`, e.g. awaiting
+``czekitout.aio.to_real_numpy_array_3d(obj, obj_name)`` returns the same result,
+or raises the same exception, as calling
+``czekitout.convert.to_real_numpy_array_3d(obj, obj_name)``. The difference
+lies in where the work is done: if ``obj`` is a numpy array with fewer elements
+than the size threshold, then the synchronous counterpart is called inline,
+since the overhead of handing off the call would exceed the call itself.
+Otherwise, the synchronous counterpart is run in an executor, such that the
+event loop is not blocked while large arrays are scanned or converted. Objects
+that are not numpy arrays, e.g. nested lists, are always run in the executor,
+since their sizes cannot be determined without converting them first.
+
+The size threshold can be set via the function
+:func:`czekitout.aio.set_size_threshold`, and the executor via the function
+:func:`czekitout.aio.set_executor`, which accepts pools of threads only. By
+default, the default executor of the running event loop is used. Calls run in
+the executor see the same settings of the module :mod:`czekitout.config` as the
+awaiting task, including settings made within contexts, e.g. via the context
+manager :func:`czekitout.config.local_validation_level`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For running calls in executors.
+import asyncio
+import concurrent.futures
+
+# For propagating the current context to calls run in executors.
+import contextvars
+
+# For binding arguments to functions.
+import functools
+
+
+
+# For general array handling.
+import numpy as np
+
+
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For validating and converting the elements of iterables lazily.
+import czekitout.stream
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["get_executor",
+           "set_executor",
+           "get_size_threshold",
+           "set_size_threshold",
+           "AsyncStream",
+           "if_real_numpy_array",
+           "if_real_numpy_array_1d",
+           "if_real_numpy_matrix",
+           "if_real_two_column_numpy_matrix",
+           "if_real_numpy_array_3d",
+           "if_nonnegative_numpy_array",
+           "if_nonnegative_numpy_matrix",
+           "if_bool_matrix",
+           "if_bool_array_3d",
+           "if_complex_numpy_array",
+           "if_complex_numpy_matrix",
+           "to_real_two_column_numpy_matrix",
+           "to_numpy_array",
+           "to_real_numpy_array",
+           "to_real_numpy_array_1d",
+           "to_real_numpy_matrix",
+           "to_real_numpy_array_3d",
+           "to_nonnegative_numpy_array",
+           "to_nonnegative_numpy_matrix",
+           "to_bool_numpy_matrix",
+           "to_bool_numpy_array_3d",
+           "to_complex_numpy_array",
+           "to_complex_numpy_matrix"]
+
+
+
+_executor = None
+
+_size_threshold = 2**16
+
+
+
+def get_executor():
+    r"""Get the executor in which large validations and conversions are run.
+
+    See the summary documentation of the module :mod:`czekitout.aio` for
+    details.
+
+    Returns
+    -------
+    executor : :class:`concurrent.futures.ThreadPoolExecutor` | `None`
+        The executor. If ``executor`` is set to ``None``, then the default
+        executor of the running event loop is used.
+
+    """
+    executor = _executor
+
+    return executor
+
+
+
+def set_executor(executor):
+    r"""Set the executor in which large validations and conversions are run.
+
+    See the summary documentation of the module :mod:`czekitout.aio` for
+    details.
+
+    If ``executor`` is neither an instance of the class
+    :class:`concurrent.futures.ThreadPoolExecutor` nor ``None``, then a
+    `TypeError` exception is raised.
+
+    Parameters
+    ----------
+    executor : :class:`concurrent.futures.ThreadPoolExecutor` | `None`
+        The new executor. If ``executor`` is set to ``None``, then the default
+        executor of the running event loop is used. Pools of processes, e.g.
+        instances of the class :class:`concurrent.futures.ProcessPoolExecutor`,
+        are not accepted, since the calls run in the executor are run within
+        copies of the context of the awaiting task, which cannot be passed to
+        other processes.
+
+    """
+    global _executor
+
+    # Calls are run in the executor within copies of the current context,
+    # which cannot be pickled, hence only pools of threads are accepted.
+    accepted_types = (concurrent.futures.ThreadPoolExecutor, type(None))
+    if not isinstance(executor, accepted_types):
+        err_msg_args = (_set_executor_err_msg_1,)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    _executor = executor
+
+    return None
+
+
+
+def get_size_threshold():
+    r"""Get the number of elements from which numpy arrays are validated and
+    converted in the executor.
+
+    See the summary documentation of the module :mod:`czekitout.aio` for
+    details.
+
+    Returns
+    -------
+    threshold : `int`
+        The size threshold.
+
+    """
+    threshold = _size_threshold
+
+    return threshold
+
+
+
+def set_size_threshold(threshold):
+    r"""Set the number of elements from which numpy arrays are validated and
+    converted in the executor.
+
+    See the summary documentation of the module :mod:`czekitout.aio` for
+    details. The default size threshold is ``65536``.
+
+    Parameters
+    ----------
+    threshold : `int`
+        The new size threshold. Must be nonnegative. If ``threshold`` is set to
+        ``0``, then every validation and conversion is run in the executor.
+
+    """
+    global _size_threshold
+
+    _size_threshold = czekitout.convert.to_nonnegative_int(threshold,
+                                                           "threshold")
+
+    return None
+
+
+
+async def _run(size, func, *args, **kwargs):
+    # Calls ``func(*args, **kwargs)`` inline if ``size`` is not ``None`` and is
+    # below the size threshold, otherwise runs said call in the executor, within
+    # a copy of the current context.
+    if (size is not None) and (size < _size_threshold):
+        result = func(*args, **kwargs)
+    else:
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        func_call = functools.partial(context.run, func, *args, **kwargs)
+        result = await loop.run_in_executor(_executor, func_call)
+
+    return result
+
+
+
+def _coroutine_func_of(func):
+    async def coroutine_func(obj, obj_name, **kwargs):
+        size = obj.size if isinstance(obj, np.ndarray) else None
+        result = await _run(size, func, obj, obj_name, **kwargs)
+
+        return result
+
+    format_args = (func.__module__, func.__name__)
+    coroutine_func.__name__ = func.__name__
+    coroutine_func.__qualname__ = func.__name__
+    coroutine_func.__doc__ = _coroutine_func_doc_template.format(*format_args)
+
+    return coroutine_func
+
+
+
+_coroutine_func_doc_template = \
+    (r"""Validate or convert an object asynchronously.
+
+    This is the coroutine counterpart of the function :func:`{0}.{1}`. See
+    the summary documentation of the module :mod:`czekitout.aio` for details,
+    and the documentation for the synchronous counterpart for a description of
+    the parameters, the returned object, and the exceptions raised.
+
+    """)
+
+
+
+if_real_numpy_array = \
+    _coroutine_func_of(czekitout.check.if_real_numpy_array)
+if_real_numpy_array_1d = \
+    _coroutine_func_of(czekitout.check.if_real_numpy_array_1d)
+if_real_numpy_matrix = \
+    _coroutine_func_of(czekitout.check.if_real_numpy_matrix)
+if_real_two_column_numpy_matrix = \
+    _coroutine_func_of(czekitout.check.if_real_two_column_numpy_matrix)
+if_real_numpy_array_3d = \
+    _coroutine_func_of(czekitout.check.if_real_numpy_array_3d)
+if_nonnegative_numpy_array = \
+    _coroutine_func_of(czekitout.check.if_nonnegative_numpy_array)
+if_nonnegative_numpy_matrix = \
+    _coroutine_func_of(czekitout.check.if_nonnegative_numpy_matrix)
+if_bool_matrix = \
+    _coroutine_func_of(czekitout.check.if_bool_matrix)
+if_bool_array_3d = \
+    _coroutine_func_of(czekitout.check.if_bool_array_3d)
+if_complex_numpy_array = \
+    _coroutine_func_of(czekitout.check.if_complex_numpy_array)
+if_complex_numpy_matrix = \
+    _coroutine_func_of(czekitout.check.if_complex_numpy_matrix)
+
+to_real_two_column_numpy_matrix = \
+    _coroutine_func_of(czekitout.convert.to_real_two_column_numpy_matrix)
+to_numpy_array = \
+    _coroutine_func_of(czekitout.convert.to_numpy_array)
+to_real_numpy_array = \
+    _coroutine_func_of(czekitout.convert.to_real_numpy_array)
+to_real_numpy_array_1d = \
+    _coroutine_func_of(czekitout.convert.to_real_numpy_array_1d)
+to_real_numpy_matrix = \
+    _coroutine_func_of(czekitout.convert.to_real_numpy_matrix)
+to_real_numpy_array_3d = \
+    _coroutine_func_of(czekitout.convert.to_real_numpy_array_3d)
+to_nonnegative_numpy_array = \
+    _coroutine_func_of(czekitout.convert.to_nonnegative_numpy_array)
+to_nonnegative_numpy_matrix = \
+    _coroutine_func_of(czekitout.convert.to_nonnegative_numpy_matrix)
+to_bool_numpy_matrix = \
+    _coroutine_func_of(czekitout.convert.to_bool_numpy_matrix)
+to_bool_numpy_array_3d = \
+    _coroutine_func_of(czekitout.convert.to_bool_numpy_array_3d)
+to_complex_numpy_array = \
+    _coroutine_func_of(czekitout.convert.to_complex_numpy_array)
+to_complex_numpy_matrix = \
+    _coroutine_func_of(czekitout.convert.to_complex_numpy_matrix)
+
+
+
+class AsyncStream(czekitout.stream._StreamBase):
+    r"""A stream that validates and converts the elements of an asynchronous
+    iterable lazily.
+
+    This is the asynchronous counterpart of the class
+    :class:`czekitout.stream.Stream`: it wraps an asynchronous iterable, e.g.
+    an asynchronous generator, and is itself an asynchronous iterator. See the
+    documentation for the class :class:`czekitout.stream.Stream` for a
+    description of the parameters, and of how elements are validated and
+    converted.
+
+    Elements pulled one by one are validated and converted inline. Chunks of
+    elements pulled via the method :meth:`czekitout.aio.AsyncStream.chunks` are
+    validated and converted in the executor if their sizes are not below the
+    size threshold. See the summary documentation of the module
+    :mod:`czekitout.aio` for details.
+
+    Parameters
+    ----------
+    iterable : asynchronous iterable
+        The asynchronous iterable to wrap. If ``iterable`` is an asynchronous
+        iterator, then it is consumed by the stream.
+    obj_name : `str`
+        The name of ``iterable``.
+    elem_spec : `str` | callable
+        The spec of the elements.
+
+    """
+    def _iterator_of(self, iterable, obj_name):
+        try:
+            iterator = iterable.__aiter__()
+        except:
+            err_msg_args = (_async_stream_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        return iterator
+
+
+
+    def __aiter__(self):
+        result = self
+
+        return result
+
+
+
+    async def __anext__(self):
+        elem = await self._iterator.__anext__()
+        elem_idx = self._num_elems_pulled
+        self._num_elems_pulled += 1
+
+        result = self._validate_and_convert_elem(elem, elem_idx)
+
+        return result
+
+
+
+    def chunks(self, chunk_size):
+        r"""Pull the remaining elements of the stream in chunks.
+
+        This is the asynchronous counterpart of the method
+        :meth:`czekitout.stream.Stream.chunks`, returning an asynchronous
+        generator rather than a generator. See the documentation for said method
+        for details.
+
+        Parameters
+        ----------
+        chunk_size : `int`
+            The number of elements per chunk. Must be positive.
+
+        Returns
+        -------
+        chunks : asynchronous generator
+            The asynchronous generator of the chunks.
+
+        """
+        chunk_size = czekitout.convert.to_positive_int(chunk_size,
+                                                       "chunk_size")
+        chunks = self._generate_chunks(chunk_size)
+
+        return chunks
+
+
+
+    def _push_back_elems(self, elems):
+        self._iterator = _chained_async_iterator(elems, self._iterator)
+
+        return None
+
+
+
+    async def _generate_chunks(self, chunk_size):
+        while True:
+            elems = await self._pull_elems(chunk_size)
+            if len(elems) == 0:
+                break
+
+            first_elem_idx = self._num_elems_pulled
+            self._num_elems_pulled += len(elems)
+
+            yield await _run(len(elems),
+                             self._validate_and_convert_chunk,
+                             elems,
+                             first_elem_idx)
+
+
+
+    async def _pull_elems(self, max_num_elems):
+        elems = []
+
+        try:
+            while len(elems) < max_num_elems:
+                elems.append(await self._iterator.__anext__())
+        except StopAsyncIteration:
+            pass
+
+        elems = tuple(elems)
+
+        return elems
+
+
+
+async def _chained_async_iterator(elems, async_iterator):
+    for elem in elems:
+        yield elem
+    async for elem in async_iterator:
+        yield elem
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_set_executor_err_msg_1 = \
+    ("The object ``executor`` must be an instance of the class "
+     "`concurrent.futures.ThreadPoolExecutor`, or `None`: pools of processes "
+     "cannot run calls within copies of the context of the awaiting task.")
+
+_async_stream_err_msg_1 = \
+    ("The object ``{}`` must be an asynchronous iterable.")
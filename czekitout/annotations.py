@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains functions and constraints for compiling validators from type
+annotations.
+
+Type annotations such as ``float``, ``tuple[int, int]``, or ``list[str]`` are
+mapped onto the existing ``czekitout.convert.to_*`` functions. Additional
+constraints are expressed via ``typing.Annotated``, using the constraint
+objects defined in the current module, e.g. ``Annotated[float, Positive]`` is
+mapped onto :func:`czekitout.convert.to_positive_float`, and
+``Annotated[np.ndarray, RealMatrix]`` is mapped onto
+:func:`czekitout.convert.to_real_numpy_matrix`. Metadata in ``Annotated`` that
+are not constraint objects are ignored.
+
+Furthermore, ``Optional[T]`` accepts ``None`` in addition to whatever ``T``
+accepts, ``typing.Any`` accepts any object, ``Callable`` accepts any callable
+object, and any other class accepts its instances.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For introspecting type annotations.
+import typing
+
+# For checking against the type of unions of the form ``X | Y``.
+import types
+
+# For checking against abstract base classes.
+import collections.abc
+
+
+
+# For general array handling.
+import numpy as np
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["Constraint",
+           "Positive",
+           "Nonnegative",
+           "Real",
+           "Complex",
+           "Bool",
+           "Array1D",
+           "Matrix",
+           "Array3D",
+           "TwoColumnMatrix",
+           "RealArray1D",
+           "RealMatrix",
+           "RealArray3D",
+           "RealTwoColumnMatrix",
+           "NonnegativeMatrix",
+           "ComplexMatrix",
+           "BoolMatrix",
+           "BoolArray3D",
+           "compile_validator"]
+
+
+
+class Constraint():
+    r"""A constraint to be used as metadata in ``typing.Annotated``.
+
+    A constraint is characterized by a set of properties, e.g. ``"positive"``
+    or ``"real"``. The properties of all the constraints in an ``Annotated``
+    annotation are combined to determine the validator of said annotation.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the constraint.
+    properties : `array_like` (`str`, ndim=1)
+        The properties of the constraint.
+
+    """
+    def __init__(self, name, properties):
+        self.name = czekitout.convert.to_str_from_str_like(name, "name")
+        self.properties = \
+            frozenset(czekitout.convert.to_tuple_of_strs(properties,
+                                                         "properties"))
+
+        return None
+
+
+
+    def __repr__(self):
+        result = "{}.{}".format(__name__, self.name)
+
+        return result
+
+
+
+Positive = Constraint("Positive", ("positive",))
+Nonnegative = Constraint("Nonnegative", ("nonnegative",))
+Real = Constraint("Real", ("real",))
+Complex = Constraint("Complex", ("complex",))
+Bool = Constraint("Bool", ("bool",))
+Array1D = Constraint("Array1D", ("1d",))
+Matrix = Constraint("Matrix", ("2d",))
+Array3D = Constraint("Array3D", ("3d",))
+TwoColumnMatrix = Constraint("TwoColumnMatrix", ("2d", "two_column"))
+RealArray1D = Constraint("RealArray1D", ("real", "1d"))
+RealMatrix = Constraint("RealMatrix", ("real", "2d"))
+RealArray3D = Constraint("RealArray3D", ("real", "3d"))
+RealTwoColumnMatrix = Constraint("RealTwoColumnMatrix",
+                                 ("real", "2d", "two_column"))
+NonnegativeMatrix = Constraint("NonnegativeMatrix", ("nonnegative", "2d"))
+ComplexMatrix = Constraint("ComplexMatrix", ("complex", "2d"))
+BoolMatrix = Constraint("BoolMatrix", ("bool", "2d"))
+BoolArray3D = Constraint("BoolArray3D", ("bool", "3d"))
+
+
+
+def _key_of_annotation(annotation):
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if (origin is tuple) and (len(args) == 2) and (args[1] is Ellipsis):
+        key = (tuple, _key_of_annotation(args[0]), Ellipsis)
+    elif (origin is tuple) and (len(args) > 0):
+        key = (tuple,) + tuple(_key_of_annotation(arg) for arg in args)
+    elif (origin is list) and (len(args) == 1):
+        key = (list, _key_of_annotation(args[0]))
+    else:
+        key = annotation
+
+    return key
+
+
+
+def _generate_convert_func_names():
+    Tuple = typing.Tuple  # Alias for readability.
+    List = typing.List  # Alias for readability.
+
+    annotations_and_properties_and_names = \
+        ((float, (), "to_float"),
+         (float, ("positive",), "to_positive_float"),
+         (float, ("nonnegative",), "to_nonnegative_float"),
+         (int, (), "to_int"),
+         (int, ("positive",), "to_positive_int"),
+         (int, ("nonnegative",), "to_nonnegative_int"),
+         (bool, (), "to_bool"),
+         (str, (), "to_str_from_str_like"),
+         (dict, (), "to_dict"),
+         (slice, (), "to_single_dim_slice"),
+         (List[str], (), "to_list_of_strs"),
+         (Tuple[str, ...], (), "to_tuple_of_strs"),
+         (List[bool], (), "to_list_of_bools"),
+         (Tuple[bool, ...], (), "to_tuple_of_bools"),
+         (List[int], (), "to_list_of_ints"),
+         (List[int], ("positive",), "to_list_of_positive_ints"),
+         (List[int], ("nonnegative",), "to_list_of_nonnegative_ints"),
+         (Tuple[int, ...], (), "to_tuple_of_ints"),
+         (Tuple[int, ...], ("positive",), "to_tuple_of_positive_ints"),
+         (Tuple[int, ...], ("nonnegative",), "to_tuple_of_nonnegative_ints"),
+         (List[float], (), "to_list_of_floats"),
+         (List[float], ("positive",), "to_list_of_positive_floats"),
+         (List[float], ("nonnegative",), "to_list_of_nonnegative_floats"),
+         (Tuple[float, ...], (), "to_tuple_of_floats"),
+         (Tuple[float, ...], ("positive",), "to_tuple_of_positive_floats"),
+         (Tuple[float, ...],
+          ("nonnegative",),
+          "to_tuple_of_nonnegative_floats"),
+         (Tuple[float, float], (), "to_pair_of_floats"),
+         (Tuple[float, float], ("positive",), "to_pair_of_positive_floats"),
+         (Tuple[float, float],
+          ("nonnegative",),
+          "to_pair_of_nonnegative_floats"),
+         (Tuple[int, int], (), "to_pair_of_ints"),
+         (Tuple[int, int], ("positive",), "to_pair_of_positive_ints"),
+         (Tuple[int, int], ("nonnegative",), "to_pair_of_nonnegative_ints"),
+         (Tuple[int, int, int, int],
+          ("nonnegative",),
+          "to_quadruplet_of_nonnegative_ints"),
+         (Tuple[float, float, float, float],
+          ("positive",),
+          "to_quadruplet_of_positive_floats"),
+         (Tuple[Tuple[float, float], ...], (), "to_pairs_of_floats"),
+         (Tuple[Tuple[int, int], ...], (), "to_pairs_of_ints"),
+         (Tuple[Tuple[int, int], ...],
+          ("nonnegative",),
+          "to_pairs_of_nonnegative_ints"),
+         (np.ndarray, (), "to_numpy_array"),
+         (np.ndarray, ("real",), "to_real_numpy_array"),
+         (np.ndarray, ("real", "1d"), "to_real_numpy_array_1d"),
+         (np.ndarray, ("real", "2d"), "to_real_numpy_matrix"),
+         (np.ndarray, ("real", "3d"), "to_real_numpy_array_3d"),
+         (np.ndarray,
+          ("real", "2d", "two_column"),
+          "to_real_two_column_numpy_matrix"),
+         (np.ndarray, ("nonnegative",), "to_nonnegative_numpy_array"),
+         (np.ndarray, ("nonnegative", "2d"), "to_nonnegative_numpy_matrix"),
+         (np.ndarray, ("complex",), "to_complex_numpy_array"),
+         (np.ndarray, ("complex", "2d"), "to_complex_numpy_matrix"),
+         (np.ndarray, ("bool", "2d"), "to_bool_numpy_matrix"),
+         (np.ndarray, ("bool", "3d"), "to_bool_numpy_array_3d"))
+
+    convert_func_names = dict()
+    for annotation, properties, name in annotations_and_properties_and_names:
+        key = (_key_of_annotation(annotation), frozenset(properties))
+        convert_func_names[key] = name
+
+    return convert_func_names
+
+
+
+_convert_func_names = _generate_convert_func_names()
+
+# The origins of union annotations, where unions of the form ``X | Y`` are only
+# supported in Python 3.10 and later.
+_union_types = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+
+def _validator_from_check_func(check_func):
+    def validator(obj, obj_name):
+        check_func(obj, obj_name)
+
+        return obj
+
+    return validator
+
+
+
+def _validator_from_type_guard(type_guard):
+    def validator(obj, obj_name):
+        type_guard.check(obj, obj_name)
+
+        return obj
+
+    return validator
+
+
+
+def _validator_of_optional(validator):
+    def validator_of_optional(obj, obj_name):
+        result = None if (obj is None) else validator(obj, obj_name)
+
+        return result
+
+    return validator_of_optional
+
+
+
+def _validator_of_any(obj, obj_name):
+    return obj
+
+
+
+def _is_optional(annotation):
+    args = typing.get_args(annotation)
+    result = ((typing.get_origin(annotation) in _union_types)
+              and (len(args) == 2)
+              and (type(None) in args))
+
+    return result
+
+
+
+def _compile_validator(annotation, properties):
+    if hasattr(annotation, "__metadata__"):
+        # ``annotation`` is of the form ``Annotated[T, *metadata]``.
+        for metadata in annotation.__metadata__:
+            if isinstance(metadata, Constraint):
+                properties = properties.union(metadata.properties)
+        validator = _compile_validator(annotation.__origin__, properties)
+    elif _is_optional(annotation):
+        args = typing.get_args(annotation)
+        arg = args[0] if (args[1] is type(None)) else args[1]
+        validator = _validator_of_optional(_compile_validator(arg, properties))
+    else:
+        validator = _compile_validator_of_non_optional(annotation, properties)
+
+    return validator
+
+
+
+def _compile_validator_of_non_optional(annotation, properties):
+    key = (_key_of_annotation(annotation), properties)
+    convert_func_name = _convert_func_names.get(key, None)
+
+    if convert_func_name is not None:
+        validator = getattr(czekitout.convert, convert_func_name)
+    elif len(properties) > 0:
+        err_msg_args = (_compile_validator_of_non_optional_err_msg_1,
+                        annotation,
+                        sorted(properties))
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+    elif annotation is typing.Any:
+        validator = _validator_of_any
+    elif ((annotation is collections.abc.Callable)
+          or (typing.get_origin(annotation) is collections.abc.Callable)):
+        validator = _validator_from_check_func(czekitout.check.if_callable)
+    elif isinstance(annotation, type):
+        type_guard = czekitout.check.TypeGuard(accepted_types=(annotation,))
+        validator = _validator_from_type_guard(type_guard)
+    else:
+        err_msg_args = (_compile_validator_of_non_optional_err_msg_2,
+                        annotation)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    return validator
+
+
+
+_validator_cache = dict()
+
+_max_num_cached_validators = 1024
+
+
+
+def compile_validator(annotation):
+    r"""Compile a validator from a type annotation.
+
+    See the summary documentation of the module :mod:`czekitout.annotations`
+    for a description of the supported type annotations.
+
+    The validator is of the form ``validator(obj, obj_name)``, and returns the
+    object resulting from the validation and conversion of ``obj``. Wherever
+    possible, the validator is the matching ``czekitout.convert.to_*``
+    function itself, e.g. the validator of ``Annotated[float, Positive]`` is
+    :func:`czekitout.convert.to_positive_float`. Validators of annotations that
+    only validate, e.g. ``Callable``, return ``obj`` unconverted.
+
+    Compiled validators are cached, keyed on the annotation, such that the
+    introspection of any given annotation is performed only once. Unhashable
+    annotations are compiled anew upon each call.
+
+    If the annotation is not supported, then a `ValueError` exception is
+    raised.
+
+    Parameters
+    ----------
+    annotation : any type
+        The type annotation.
+
+    Returns
+    -------
+    validator : callable
+        The compiled validator.
+
+    """
+    try:
+        validator = _validator_cache[annotation]
+    except KeyError:
+        validator = _compile_validator(annotation, frozenset())
+        if len(_validator_cache) >= _max_num_cached_validators:
+            _validator_cache.clear()
+        _validator_cache[annotation] = validator
+    except TypeError:
+        validator = _compile_validator(annotation, frozenset())
+
+    return validator
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_compile_validator_of_non_optional_err_msg_1 = \
+    ("The type annotation ``{}`` with the constraint properties ``{}`` is not "
+     "supported.")
+
+_compile_validator_of_non_optional_err_msg_2 = \
+    ("The type annotation ``{}`` is not supported.")
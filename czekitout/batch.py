@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains functions that validate and convert batches of independent scalars,
+returning validity masks rather than raising exceptions.
+
+Each function in the current module is the batched counterpart of a scalar
+``czekitout.check.if_*`` function, e.g. :func:`czekitout.batch.positive_float`
+is the batched counterpart of :func:`czekitout.check.if_positive_float`: the
+element of the validity mask returned by the former is ``True`` if and only if
+the latter would not raise an exception for the corresponding element of the
+batch. Functions whose names would shadow builtins have a trailing underscore,
+e.g. :func:`czekitout.batch.float_`.
+
+If the batch is a numpy array, or a sequence that numpy can convert to a 1D
+numeric array, then the validation and conversion are vectorized. Otherwise,
+e.g. for sequences of mixed types, each element is first converted to a
+complex number individually, after which the remaining steps are vectorized.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For general array handling.
+import numpy as np
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["float_",
+           "positive_float",
+           "nonnegative_float",
+           "int_",
+           "positive_int",
+           "nonnegative_int",
+           "bool_"]
+
+
+
+# The tolerance used by the scalar ``czekitout.check.if_*`` functions for
+# deciding whether a number is real-valued or integer-valued.
+_tol = 1.0e-14
+
+# The bound on the magnitudes of the integers that can be stored in the 64-bit
+# integer arrays returned by the integer functions of the current module.
+_int64_bound = 2.0**63
+
+
+
+def _array_of_batch(batch):
+    if isinstance(batch, np.ndarray):
+        array = batch
+    elif isinstance(batch, (str, bytes)):
+        err_msg_args = (_array_of_batch_err_msg_1,)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+    else:
+        try:
+            batch = tuple(batch)
+        except:
+            err_msg_args = (_array_of_batch_err_msg_1,)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        try:
+            array = np.asarray(batch)
+            if (array.ndim != 1) or (array.dtype.kind not in "biufc"):
+                raise
+        except:
+            array = np.empty((len(batch),), dtype=object)
+            for elem_idx, elem in enumerate(batch):
+                array[elem_idx] = elem
+
+    return array
+
+
+
+def _scalar_mask_and_parts_of_array(array):
+    # Returns the mask of the elements of ``array`` that are scalars, along with
+    # the real and imaginary parts of said elements. The imaginary parts are
+    # returned as ``None`` if ``array`` is real-valued.
+    dtype_kind = array.dtype.kind
+
+    if dtype_kind in "biuf":
+        scalar_mask = np.ones(array.shape, dtype=bool)
+        real_parts = array.astype(np.float64, copy=False)
+        imag_parts = None
+    elif dtype_kind == "c":
+        scalar_mask = np.ones(array.shape, dtype=bool)
+        real_parts = array.real.astype(np.float64, copy=False)
+        imag_parts = array.imag.astype(np.float64, copy=False)
+    elif dtype_kind == "O":
+        scalar_mask, real_parts, imag_parts = \
+            _scalar_mask_and_parts_of_object_array(array)
+    else:
+        scalar_mask = np.zeros(array.shape, dtype=bool)
+        real_parts = np.zeros(array.shape, dtype=np.float64)
+        imag_parts = None
+
+    return scalar_mask, real_parts, imag_parts
+
+
+
+def _scalar_mask_and_parts_of_object_array(array):
+    scalar_mask = np.zeros(array.shape, dtype=bool)
+    real_parts = np.zeros(array.shape, dtype=np.float64)
+    imag_parts = np.zeros(array.shape, dtype=np.float64)
+
+    flat_scalar_mask = scalar_mask.reshape(-1)
+    flat_real_parts = real_parts.reshape(-1)
+    flat_imag_parts = imag_parts.reshape(-1)
+
+    for elem_idx, elem in enumerate(array.flat):
+        try:
+            elem_as_numpy_array = np.array(elem)
+            if elem_as_numpy_array.dtype.kind in "SU":
+                raise
+            elem_as_complex = complex(elem_as_numpy_array.tolist())
+        except:
+            continue
+
+        flat_scalar_mask[elem_idx] = True
+        flat_real_parts[elem_idx] = elem_as_complex.real
+        flat_imag_parts[elem_idx] = elem_as_complex.imag
+
+    return scalar_mask, real_parts, imag_parts
+
+
+
+def _float_mask_and_real_parts(batch):
+    array = _array_of_batch(batch)
+    mask, real_parts, imag_parts = _scalar_mask_and_parts_of_array(array)
+
+    if imag_parts is not None:
+        mask &= ~(np.abs(imag_parts) > _tol)
+
+    return mask, real_parts
+
+
+
+def _int_mask_and_rounded_real_parts(batch):
+    array = _array_of_batch(batch)
+
+    if array.dtype.kind in "bi":
+        mask = np.ones(array.shape, dtype=bool)
+        rounded_real_parts = array
+    elif array.dtype.kind == "u":
+        mask = (array < np.uint64(2**63))
+        rounded_real_parts = array
+    else:
+        mask, real_parts = _float_mask_and_real_parts(array)
+        with np.errstate(invalid="ignore"):
+            rounded_real_parts = np.round(real_parts)
+            mask &= np.isfinite(real_parts)
+            mask &= ~(np.abs(rounded_real_parts - real_parts) > _tol)
+            mask &= (np.abs(rounded_real_parts) < _int64_bound)
+
+    return mask, rounded_real_parts
+
+
+
+def _float_mask_and_values(batch, lower_bound_type):
+    mask, real_parts = _float_mask_and_real_parts(batch)
+
+    if lower_bound_type == "positive":
+        mask &= ~(real_parts <= 0)
+    elif lower_bound_type == "nonnegative":
+        mask &= ~(real_parts < 0)
+
+    values = np.where(mask, real_parts, np.nan)
+
+    return mask, values
+
+
+
+def _int_mask_and_values(batch, lower_bound):
+    mask, rounded_real_parts = _int_mask_and_rounded_real_parts(batch)
+
+    if lower_bound is not None:
+        mask &= (rounded_real_parts >= lower_bound)
+
+    values = np.where(mask, rounded_real_parts, 0).astype(np.int64)
+
+    return mask, values
+
+
+
+def float_(batch):
+    r"""Validate and convert a batch of real numbers.
+
+    This is the batched counterpart of :func:`czekitout.check.if_float` and
+    :func:`czekitout.convert.to_float`. See the summary documentation of the
+    module :mod:`czekitout.batch` for further details.
+
+    If ``batch`` is not a numpy array or a sequence, then a `TypeError`
+    exception is raised.
+
+    Parameters
+    ----------
+    batch : `array_like`
+        The batch of objects to validate and convert. If ``batch`` is a numpy
+        array, then each of its elements is treated as an object of the batch,
+        otherwise ``batch`` is treated as a sequence of objects.
+
+    Returns
+    -------
+    mask : `numpy.ndarray` (`bool`)
+        The validity mask: ``mask[i]`` is set to ``True`` if the ``i`` th object
+        of the batch is a real number, otherwise it is set to ``False``. If
+        ``batch`` is a numpy array, then ``mask`` is of the same shape as
+        ``batch``, otherwise ``mask`` is 1D.
+    values : `numpy.ndarray` (`float`)
+        The converted values, of the same shape as ``mask``, where ``values[i]``
+        is set to NaN if ``mask[i]`` is set to ``False``.
+
+    """
+    mask, values = _float_mask_and_values(batch, lower_bound_type=None)
+
+    return mask, values
+
+
+
+def positive_float(batch):
+    r"""Validate and convert a batch of positive real numbers.
+
+    This is the batched counterpart of :func:`czekitout.check.if_positive_float`
+    and :func:`czekitout.convert.to_positive_float`. See the documentation for
+    the function :func:`czekitout.batch.float_` for a description of the
+    parameters and the returned objects.
+
+    """
+    mask, values = _float_mask_and_values(batch, lower_bound_type="positive")
+
+    return mask, values
+
+
+
+def nonnegative_float(batch):
+    r"""Validate and convert a batch of nonnegative real numbers.
+
+    This is the batched counterpart of
+    :func:`czekitout.check.if_nonnegative_float` and
+    :func:`czekitout.convert.to_nonnegative_float`. See the documentation for
+    the function :func:`czekitout.batch.float_` for a description of the
+    parameters and the returned objects.
+
+    """
+    mask, values = _float_mask_and_values(batch,
+                                          lower_bound_type="nonnegative")
+
+    return mask, values
+
+
+
+def int_(batch):
+    r"""Validate and convert a batch of integers.
+
+    This is the batched counterpart of :func:`czekitout.check.if_int` and
+    :func:`czekitout.convert.to_int`. See the summary documentation of the
+    module :mod:`czekitout.batch` for further details.
+
+    Unlike :func:`czekitout.convert.to_int`, which returns arbitrary-precision
+    Python integers, the current function returns 64-bit integers. As such,
+    integers that cannot be represented as 64-bit integers are treated as
+    invalid.
+
+    If ``batch`` is not a numpy array or a sequence, then a `TypeError`
+    exception is raised.
+
+    Parameters
+    ----------
+    batch : `array_like`
+        The batch of objects to validate and convert. If ``batch`` is a numpy
+        array, then each of its elements is treated as an object of the batch,
+        otherwise ``batch`` is treated as a sequence of objects.
+
+    Returns
+    -------
+    mask : `numpy.ndarray` (`bool`)
+        The validity mask: ``mask[i]`` is set to ``True`` if the ``i`` th object
+        of the batch is an integer, otherwise it is set to ``False``. If
+        ``batch`` is a numpy array, then ``mask`` is of the same shape as
+        ``batch``, otherwise ``mask`` is 1D.
+    values : `numpy.ndarray` (`int`)
+        The converted values, of the same shape as ``mask``, where ``values[i]``
+        is set to ``0`` if ``mask[i]`` is set to ``False``.
+
+    """
+    mask, values = _int_mask_and_values(batch, lower_bound=None)
+
+    return mask, values
+
+
+
+def positive_int(batch):
+    r"""Validate and convert a batch of positive integers.
+
+    This is the batched counterpart of :func:`czekitout.check.if_positive_int`
+    and :func:`czekitout.convert.to_positive_int`. See the documentation for the
+    function :func:`czekitout.batch.int_` for a description of the parameters
+    and the returned objects.
+
+    """
+    mask, values = _int_mask_and_values(batch, lower_bound=1)
+
+    return mask, values
+
+
+
+def nonnegative_int(batch):
+    r"""Validate and convert a batch of nonnegative integers.
+
+    This is the batched counterpart of
+    :func:`czekitout.check.if_nonnegative_int` and
+    :func:`czekitout.convert.to_nonnegative_int`. See the documentation for the
+    function :func:`czekitout.batch.int_` for a description of the parameters
+    and the returned objects.
+
+    """
+    mask, values = _int_mask_and_values(batch, lower_bound=0)
+
+    return mask, values
+
+
+
+def bool_(batch):
+    r"""Validate and convert a batch of booleans.
+
+    This is the batched counterpart of :func:`czekitout.check.if_bool` and
+    :func:`czekitout.convert.to_bool`, i.e. an object of the batch is valid if
+    it is a boolean, or an integer equal to either ``0`` or ``1``. See the
+    documentation for the function :func:`czekitout.batch.int_` for a
+    description of the parameters, and the summary documentation of the module
+    :mod:`czekitout.batch` for further details.
+
+    Returns
+    -------
+    mask : `numpy.ndarray` (`bool`)
+        The validity mask: ``mask[i]`` is set to ``True`` if the ``i`` th object
+        of the batch is a boolean, otherwise it is set to ``False``.
+    values : `numpy.ndarray` (`bool`)
+        The converted values, of the same shape as ``mask``, where ``values[i]``
+        is set to ``False`` if ``mask[i]`` is set to ``False``.
+
+    """
+    mask, rounded_real_parts = _int_mask_and_rounded_real_parts(batch)
+    mask &= (rounded_real_parts >= 0) & (rounded_real_parts <= 1)
+    values = mask & (rounded_real_parts == 1)
+
+    return mask, values
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_array_of_batch_err_msg_1 = \
+    ("The object ``batch`` must be a numpy array or a sequence, other than a "
+     "string.")
@@ -26,6 +26,12 @@ when exceptions are thrown.
 import os.path
 import pathlib
 
+# For checking whether classes are abstract base classes.
+import abc
+
+# For caching results without keeping classes alive.
+import weakref
+
 
 
 # For general array handling.
@@ -33,12 +39,21 @@ import numpy as np
 
 
 
+# For getting the validation level.
+import czekitout.config
+
 # For getting fully qualified class names.
 import czekitout.name
 
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
 # For type-checking objects.
 import czekitout.isa
 
+# For determining the invalid elements of sequences in a vectorized manner.
+import czekitout.batch
+
 
 
 ##################################
@@ -46,7 +61,8 @@ import czekitout.isa
 ##################################
 
 # List of public objects in objects.
-__all__ = ["if_instance_of_any_accepted_types",
+__all__ = ["TypeGuard",
+           "if_instance_of_any_accepted_types",
            "if_dict_like",
            "if_str_like",
            "if_str_like_seq",
@@ -93,6 +109,63 @@ __all__ = ["if_instance_of_any_accepted_types",
 
 
 
+# Flags indicating the validation level of the current context.
+_validation_level_flags = czekitout.config._validation_level_flags
+
+# For each function in the module :mod:`czekitout.isa` that scans the elements
+# of numpy arrays, e.g. for NaNs or negative numbers, the function in said
+# module that validates the dimensions and shapes of numpy arrays in the same
+# way, paired with the dtype kinds of the numpy arrays for which the former
+# function returns ``True`` for every valid dimension and shape unless elements
+# are scanned.
+_unscanned_isa_funcs_and_dtype_kinds = \
+    {czekitout.isa.scalar_numpy_array:
+     (czekitout.isa.numpy_array, "biufc"),
+     czekitout.isa.real_numpy_array:
+     (czekitout.isa.numpy_array, "biuf"),
+     czekitout.isa.real_numpy_array_1d:
+     (czekitout.isa.numpy_array_1d, "biuf"),
+     czekitout.isa.real_numpy_matrix:
+     (czekitout.isa.numpy_matrix, "biuf"),
+     czekitout.isa.real_numpy_array_3d:
+     (czekitout.isa.numpy_array_3d, "biuf"),
+     czekitout.isa.real_two_column_numpy_matrix:
+     (czekitout.isa.two_column_numpy_matrix, "biuf"),
+     czekitout.isa.nonnegative_numpy_array:
+     (czekitout.isa.numpy_array, "biuf"),
+     czekitout.isa.nonnegative_numpy_matrix:
+     (czekitout.isa.numpy_matrix, "biuf"),
+     czekitout.isa.complex_numpy_array:
+     (czekitout.isa.numpy_array, "c"),
+     czekitout.isa.complex_numpy_matrix:
+     (czekitout.isa.numpy_matrix, "c")}
+
+# The dtype kinds of numeric numpy arrays, whose elements need only be scanned
+# for NaNs or negative numbers.
+_numeric_dtype_kinds = "biufc"
+
+
+
+def _isa_at_validation_level(isa_func, obj):
+    # Returns ``isa_func(obj)``, unless the validation level of the current
+    # context is not "full", in which case the elements of numeric numpy arrays
+    # are not scanned, i.e. only the dimensions, the shape, and the dtype of
+    # ``obj`` are validated. The functions in the module ``czekitout.isa`` are
+    # themselves unaffected by the validation level.
+    if ((not _validation_level_flags.is_full)
+        and (isa_func in _unscanned_isa_funcs_and_dtype_kinds)
+        and isinstance(obj, np.ndarray)
+        and (obj.dtype.kind in _numeric_dtype_kinds)):
+        unscanned_isa_func, dtype_kinds = \
+            _unscanned_isa_funcs_and_dtype_kinds[isa_func]
+        result = (unscanned_isa_func(obj) and (obj.dtype.kind in dtype_kinds))
+    else:
+        result = isa_func(obj)
+
+    return result
+
+
+
 def _check_obj_name(obj_name):
     accepted_type = str
     
@@ -101,20 +174,120 @@ def _check_obj_name(obj_name):
             czekitout.name.fully_qualified_class_name # Alias for readability.
         name_of_accepted_type = \
             fully_qualified_class_name(accepted_type)
-        err_msg = \
-            _check_obj_name_err_msg_1.format("obj_name", name_of_accepted_type)
+        err_msg_args = \
+            (_check_obj_name_err_msg_1, "obj_name", name_of_accepted_type)
 
-        raise TypeError(err_msg)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
 
 
-def _check_accepted_types(accepted_types):
+def _attach_invalid_elems(exception, elems, invalid_elem_mask):
+    # Attaches the indices and values of the invalid elements of ``elems`` to
+    # ``exception``, where ``elems`` is either a tuple or a numpy array, and
+    # ``invalid_elem_mask`` is a 1D boolean numpy array.
+    invalid_elem_indices = np.flatnonzero(invalid_elem_mask)
+    num_invalid_elems = len(invalid_elem_indices)
+
+    if num_invalid_elems > 0:
+        max_num = czekitout.config.get_max_num_reported_invalid_elems()
+        invalid_elem_indices = invalid_elem_indices[:max_num]
+
+        exception.num_invalid_elems = num_invalid_elems
+        exception.invalid_elem_indices = invalid_elem_indices
+        if isinstance(elems, np.ndarray):
+            invalid_elems = tuple(elems[invalid_elem_indices].tolist())
+        else:
+            invalid_elems = tuple(elems[elem_idx]
+                                  for elem_idx
+                                  in invalid_elem_indices.tolist())
+        exception.invalid_elems = invalid_elems
+
+    return None
+
+
+
+def _attach_invalid_elems_of_seq(exception,
+                                 seq,
+                                 elem_check_func,
+                                 batch_func=None,
+                                 elems_are_pairs=False):
+    # Attaches the indices and values of the invalid elements of the sequence
+    # ``seq`` to ``exception`` if error aggregation is enabled. The validity of
+    # the elements is determined in a vectorized manner via ``batch_func`` if
+    # possible, otherwise by calling ``elem_check_func`` element by element. If
+    # ``seq`` is not iterable, then its invalid elements cannot be determined,
+    # hence nothing is attached.
+    if czekitout.config.get_error_aggregation():
+        if isinstance(seq, np.ndarray) and (seq.ndim >= 1):
+            elems = seq
+        else:
+            try:
+                elems = tuple(seq)
+            except TypeError:
+                elems = None
+
+        if elems is not None:
+            validity_mask = _vectorized_validity_mask_of_seq(elems,
+                                                             batch_func,
+                                                             elems_are_pairs)
+            if validity_mask is None:
+                validity_mask = np.ones((len(elems),), dtype=bool)
+                for elem_idx, elem in enumerate(elems):
+                    try:
+                        elem_check_func(elem, "elem_of_obj")
+                    except (TypeError, ValueError):
+                        validity_mask[elem_idx] = False
+
+            _attach_invalid_elems(exception, elems, ~validity_mask)
+
+    return None
+
+
+
+def _attach_negative_elems(exception, real_numpy_array):
+    # Attaches the flat indices and values of the negative elements of
+    # ``real_numpy_array`` to ``exception`` if error aggregation is enabled.
+    if czekitout.config.get_error_aggregation():
+        # The masked elements of masked arrays are not reported.
+        elems = real_numpy_array.reshape(-1)
+        invalidity_mask = np.ma.filled(elems < 0, False)
+        _attach_invalid_elems(exception, np.ma.getdata(elems), invalidity_mask)
+
+    return None
+
+
+
+def _vectorized_validity_mask_of_seq(elems, batch_func, elems_are_pairs):
+    validity_mask = None
+
+    if batch_func is not None:
+        try:
+            array = np.asarray(elems)
+        except:
+            array = None
+
+        expected_ndim = 2 if elems_are_pairs else 1
+
+        if ((array is not None)
+            and (array.dtype.kind in "biufc")
+            and (array.ndim == expected_ndim)
+            and ((not elems_are_pairs) or (array.shape[1] == 2))):
+            validity_mask = batch_func(array)[0]
+            if elems_are_pairs:
+                validity_mask = validity_mask.all(axis=1)
+
+    return validity_mask
+
+
+
+def _check_and_convert_accepted_types(accepted_types):
     try:
-        if len(tuple(accepted_types)) == 0:
+        accepted_types = tuple(accepted_types)
+        if len(accepted_types) == 0:
             raise
-        isinstance(None, tuple(accepted_types))
+        isinstance(None, accepted_types)
     except:
         fully_qualified_class_name = \
             czekitout.name.fully_qualified_class_name # Alias for readability.
@@ -122,12 +295,178 @@ def _check_accepted_types(accepted_types):
             fully_qualified_class_name(type)
         unformatted_err_msg = \
             _check_accepted_types_err_msg_1
-        err_msg = \
-            unformatted_err_msg.format("accepted_types", name_of_accepted_type)
+        err_msg_args = \
+            (unformatted_err_msg, "accepted_types", name_of_accepted_type)
 
-        raise TypeError(err_msg)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
-    return None
+    return accepted_types
+
+
+
+class TypeGuard():
+    r"""A reusable guard that checks whether objects are instances of any given
+    accepted types.
+
+    All of the work that does not depend on the object being checked, i.e. the
+    validation of the accepted types, the determination of their fully
+    qualified class names, and the rendering of the error message, is done once
+    upon construction of the guard, rather than upon every check.
+
+    If any of the accepted types is an abstract base class, for which
+    `isinstance` can be comparatively slow, then the guard also caches the
+    result of each ``isinstance`` call per concrete type of the objects being
+    checked. Said cache is invalidated whenever a class is registered as a
+    virtual subclass of any abstract base class.
+
+    Parameters
+    ----------
+    accepted_types : `array_like` (`type`, ndim=1)
+        Accepted types.
+
+    Attributes
+    ----------
+    accepted_types : `tuple` (`type`)
+        Accepted types.
+    names_of_accepted_types : `tuple` (`str`)
+        The fully qualified class names of the accepted types.
+
+    """
+    def __init__(self, accepted_types):
+        accepted_types = _check_and_convert_accepted_types(accepted_types)
+
+        fully_qualified_class_names = \
+            czekitout.name.fully_qualified_class_names # Alias for readability.
+        names_of_accepted_types = \
+            fully_qualified_class_names(accepted_types)
+
+        if len(names_of_accepted_types) == 1:
+            unformatted_err_msg = _if_instance_of_any_accepted_types_err_msg_1
+            arg = names_of_accepted_types[0]
+        else:
+            unformatted_err_msg = _if_instance_of_any_accepted_types_err_msg_2
+            arg = str(names_of_accepted_types).replace("\'", "`")
+
+        # Escape any braces in the class names so that only the placeholder for
+        # the name of the object being checked remains.
+        arg = arg.replace("{", "{{").replace("}", "}}")
+
+        self.accepted_types = accepted_types
+        self.names_of_accepted_types = names_of_accepted_types
+        self._unformatted_err_msg = unformatted_err_msg.format("{}", arg)
+
+        instancecheck_methods_that_depend_only_on_cls = \
+            (type.__instancecheck__, abc.ABCMeta.__instancecheck__)
+        self._caches_isinstance_results = \
+            (any(type(accepted_type) is not type
+                 for accepted_type in accepted_types)
+             and all(type(accepted_type).__instancecheck__
+                     in instancecheck_methods_that_depend_only_on_cls
+                     for accepted_type in accepted_types))
+        self._isinstance_results = weakref.WeakKeyDictionary()
+        self._abc_cache_token = abc.get_cache_token()
+
+        return None
+
+
+
+    def is_instance(self, obj):
+        r"""Returns ``True`` if input object is an instance of any of the 
+        accepted types.
+
+        Parameters
+        ----------
+        obj : any type
+            Input object.
+
+        Returns
+        -------
+        result : `bool`
+            ``result`` is set to ``True`` if ``obj`` is an instance of any of
+            the accepted types, otherwise it is set to ``False``.
+
+        """
+        cls = type(obj)
+        
+        if (not self._caches_isinstance_results) or (obj.__class__ is not cls):
+            result = isinstance(obj, self.accepted_types)
+        else:
+            abc_cache_token = abc.get_cache_token()
+            if self._abc_cache_token != abc_cache_token:
+                self._isinstance_results.clear()
+                self._abc_cache_token = abc_cache_token
+            
+            try:
+                result = self._isinstance_results[cls]
+            except KeyError:
+                result = isinstance(obj, self.accepted_types)
+                self._isinstance_results[cls] = result
+
+        return result
+
+
+
+    def check(self, obj, obj_name):
+        r"""Check whether input object is an instance of any of the accepted
+        types.
+
+        See the documentation for the function
+        :func:`czekitout.check.if_instance_of_any_accepted_types` for a
+        description of the exception raised if the input object is not an
+        instance of any of the accepted types.
+
+        Parameters
+        ----------
+        obj : any type
+            Input object.
+        obj_name : `str`
+            Name of the input object.
+
+        """
+        if _validation_level_flags.is_off:
+            return None
+
+        _check_obj_name(obj_name)
+        self._check(obj, obj_name)
+
+        return None
+
+
+
+    def _check(self, obj, obj_name):
+        if not self.is_instance(obj):
+            err_msg_args = (self._unformatted_err_msg, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        return None
+
+
+
+# Cache of type guards, keyed on the identities of the tuples of accepted types
+# from which they were constructed.
+_type_guard_cache = dict()
+_max_num_cached_type_guards = 1024
+
+
+
+def _type_guard_of(accepted_types):
+    key = id(accepted_types)
+    cache_entry = _type_guard_cache.get(key)
+
+    if (cache_entry is not None) and (cache_entry[0] is accepted_types):
+        type_guard = cache_entry[1]
+    else:
+        type_guard = TypeGuard(accepted_types)
+
+        # Only tuples are cached since they cannot be modified in place. The
+        # cache entries store the tuples themselves so that their identities
+        # cannot be reused by other objects while they are cached.
+        if type(accepted_types) is tuple:
+            if len(_type_guard_cache) >= _max_num_cached_type_guards:
+                _type_guard_cache.clear()
+            _type_guard_cache[key] = (accepted_types, type_guard)
+
+    return type_guard
 
 
 
@@ -155,6 +494,11 @@ def if_instance_of_any_accepted_types(obj, obj_name, accepted_types):
     <accepted_types>  by the sequence of the fully qualified class names of the
     accepted types stored in ``accepted_types``.
 
+    If ``accepted_types`` is a `tuple`, then the
+    :class:`czekitout.check.TypeGuard` object constructed from it is cached,
+    keyed on the identity of said tuple, such that subsequent calls with the
+    same tuple reuse said object.
+
     Parameters
     ----------
     obj : any type
@@ -165,28 +509,11 @@ def if_instance_of_any_accepted_types(obj, obj_name, accepted_types):
         Accepted types.
 
     """
-    _check_obj_name(obj_name)
-    _check_accepted_types(accepted_types)
+    if _validation_level_flags.is_off:
+        return None
 
-    if not isinstance(obj, tuple(accepted_types)):
-        fully_qualified_class_name = \
-            czekitout.name.fully_qualified_class_name # Alias for readability.
-        names_of_accepted_types = \
-            tuple(fully_qualified_class_name(accepted_type)
-                  for accepted_type in accepted_types)
-                
-        if len(names_of_accepted_types) == 1:
-            unformatted_err_msg = _if_instance_of_any_accepted_types_err_msg_1
-            err_msg = unformatted_err_msg.format(obj_name,
-                                                 names_of_accepted_types[0])
-        else:
-            names_of_accepted_types = \
-                str(names_of_accepted_types).replace("\'", "`")
-            unformatted_err_msg = _if_instance_of_any_accepted_types_err_msg_2
-            err_msg = unformatted_err_msg.format(obj_name,
-                                                 names_of_accepted_types)
-            
-        raise TypeError(err_msg)
+    _check_obj_name(obj_name)
+    _type_guard_of(accepted_types)._check(obj, obj_name)
 
     return None
 
@@ -210,13 +537,16 @@ def if_dict_like(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
         dict(obj)
     except:
-        err_msg = _if_dict_like_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_dict_like_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -240,6 +570,9 @@ def if_str_like(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -248,8 +581,8 @@ def if_str_like(obj, obj_name):
             and (obj_as_numpy_array.dtype.type is not np.bytes_)):
             obj_as_path = pathlib.Path(obj)
     except:
-        err_msg = _if_str_like_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_str_like_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
     
     return None
 
@@ -274,6 +607,9 @@ def if_str_like_seq(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
     try:
@@ -281,8 +617,12 @@ def if_str_like_seq(obj, obj_name):
             check_if_str_like = if_str_like  # Alias for readability.
             check_if_str_like(elem_of_obj, "elem_of_obj")
     except:
-        err_msg = _if_str_like_seq_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_str_like_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_str_like)
+        raise exception
 
     return None
 
@@ -324,6 +664,9 @@ def if_one_of_any_accepted_strings(obj, obj_name, accepted_strings):
         Accepted strings.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     check_if_str_like = if_str_like  # Alias for readability.
     check_if_str_like_seq = if_str_like_seq  # Alias for readability.
 
@@ -354,8 +697,8 @@ def if_one_of_any_accepted_strings(obj, obj_name, accepted_strings):
             unformatted_err_msg = _if_one_of_any_accepted_strings_err_msg_3
             args = (obj_name, str(accepted_strings_converted_to_std_types))
             
-        err_msg = unformatted_err_msg.format(*args)            
-        raise ValueError(err_msg)
+        err_msg_args = (unformatted_err_msg,) + args
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
 
     return None
 
@@ -382,6 +725,9 @@ def if_scalar(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -392,8 +738,8 @@ def if_scalar(obj, obj_name):
         else:
             raise
     except:
-        err_msg = _if_scalar_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_scalar_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -417,6 +763,9 @@ def if_float(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -427,8 +776,8 @@ def if_float(obj, obj_name):
         if abs(obj_as_complex.real - obj_as_complex) > 1.0e-14:
             raise
     except:
-        err_msg = _if_float_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_float_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -452,6 +801,9 @@ def if_float_seq(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -459,8 +811,13 @@ def if_float_seq(obj, obj_name):
             check_if_float = if_float  # Alias for readability.
             check_if_float(elem_of_obj, "elem_of_obj")
     except:
-        err_msg = _if_float_seq_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_float_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_float,
+                                     czekitout.batch.float_)
+        raise exception
 
     return None
 
@@ -487,14 +844,17 @@ def if_positive_float(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     check_if_float = if_float  # Alias for readability.
     check_if_float(obj, obj_name)
 
     real_part_of_obj = complex(np.array(obj).tolist()).real
     
     if real_part_of_obj <= 0:
-        err_msg = _if_positive_float_err_msg_1.format(obj_name)
-        raise ValueError(err_msg)
+        err_msg_args = (_if_positive_float_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
 
     return None
 
@@ -521,11 +881,12 @@ def if_positive_float_seq(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_positive_float_seq_err_msg_1.format(obj_name)
-
         check_if_float_seq = if_float_seq  # Alias for readability.
         check_if_float_seq(obj, obj_name)
 
@@ -536,9 +897,21 @@ def if_positive_float_seq(obj, obj_name):
             check_if_positive_float(elem_of_obj, "elem_of_obj")
             
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_positive_float_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationValueError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_positive_float,
+                                     czekitout.batch.positive_float)
+        raise exception
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_positive_float_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_positive_float,
+                                     czekitout.batch.positive_float)
+        raise exception
 
     return None
 
@@ -565,14 +938,17 @@ def if_nonnegative_float(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     check_if_float = if_float  # Alias for readability.
     check_if_float(obj, obj_name)
 
     real_part_of_obj = complex(np.array(obj).tolist()).real
     
     if real_part_of_obj < 0:
-        err_msg = _if_nonnegative_float_err_msg_1.format(obj_name)
-        raise ValueError(err_msg)
+        err_msg_args = (_if_nonnegative_float_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
 
     return None
 
@@ -600,11 +976,12 @@ def if_nonnegative_float_seq(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_nonnegative_float_seq_err_msg_1.format(obj_name)
-
         check_if_float_seq = if_float_seq  # Alias for readability.
         check_if_float_seq(obj, obj_name)
 
@@ -615,9 +992,21 @@ def if_nonnegative_float_seq(obj, obj_name):
             check_if_nonnegative_float(elem_of_obj, "elem_of_obj")
             
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_nonnegative_float_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationValueError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_nonnegative_float,
+                                     czekitout.batch.nonnegative_float)
+        raise exception
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_nonnegative_float_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_nonnegative_float,
+                                     czekitout.batch.nonnegative_float)
+        raise exception
 
     return None
 
@@ -641,6 +1030,9 @@ def if_int(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -652,8 +1044,8 @@ def if_int(obj, obj_name):
         if abs(round(real_part_of_obj) - real_part_of_obj) > 1.0e-14:
             raise
     except:
-        err_msg = _if_int_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_int_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -677,6 +1069,9 @@ def if_int_seq(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
     try:
@@ -684,8 +1079,13 @@ def if_int_seq(obj, obj_name):
             check_if_int = if_int  # Alias for readability.
             check_if_int(elem_of_obj, "elem_of_obj")
     except:
-        err_msg = _if_int_seq_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_int_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_int,
+                                     czekitout.batch.int_)
+        raise exception
 
     return None
 
@@ -712,6 +1112,9 @@ def if_positive_int(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     check_if_int = if_int  # Alias for readability.
     check_if_int(obj, obj_name)
     
@@ -720,8 +1123,8 @@ def if_positive_int(obj, obj_name):
         if round(real_part_of_obj) < 1:
             raise
     except:
-        err_msg = _if_positive_int_err_msg_1.format(obj_name)
-        raise ValueError(err_msg)
+        err_msg_args = (_if_positive_int_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
 
     return None
 
@@ -748,11 +1151,12 @@ def if_positive_int_seq(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_positive_int_seq_err_msg_1.format(obj_name)
-
         check_if_int_seq = if_int_seq  # Alias for readability.
         check_if_int_seq(obj, obj_name)
 
@@ -761,9 +1165,21 @@ def if_positive_int_seq(obj, obj_name):
             check_if_positive_int(elem_of_obj, "elem_of_obj")
             
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_positive_int_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationValueError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_positive_int,
+                                     czekitout.batch.positive_int)
+        raise exception
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_positive_int_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_positive_int,
+                                     czekitout.batch.positive_int)
+        raise exception
 
     return None
 
@@ -790,6 +1206,9 @@ def if_nonnegative_int(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     check_if_int = if_int  # Alias for readability.
     check_if_int(obj, obj_name)
     
@@ -798,8 +1217,8 @@ def if_nonnegative_int(obj, obj_name):
         if round(real_part_of_obj) < 0:
             raise
     except:
-        err_msg = _if_nonnegative_int_err_msg_1.format(obj_name)
-        raise ValueError(err_msg)
+        err_msg_args = (_if_nonnegative_int_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
 
     return None
 
@@ -826,11 +1245,12 @@ def if_nonnegative_int_seq(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
     try:
-        err_msg = _if_nonnegative_int_seq_err_msg_1.format(obj_name)
-
         check_if_int_seq = if_int_seq  # Alias for readability.
         check_if_int_seq(obj, obj_name)
 
@@ -841,9 +1261,21 @@ def if_nonnegative_int_seq(obj, obj_name):
             check_if_nonnegative_int(elem_of_obj, "elem_of_obj")
             
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_nonnegative_int_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationValueError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_nonnegative_int,
+                                     czekitout.batch.nonnegative_int)
+        raise exception
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_nonnegative_int_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_nonnegative_int,
+                                     czekitout.batch.nonnegative_int)
+        raise exception
 
     return None
 
@@ -871,6 +1303,9 @@ def if_single_dim_slice_like(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     try:    
         try:
             check_if_int_seq = if_int_seq  # Alias for readability.
@@ -880,8 +1315,8 @@ def if_single_dim_slice_like(obj, obj_name):
                 check_if_int = if_int  # Alias for readability.
                 check_if_int(obj, obj_name)
     except:
-        err_msg = _if_single_dim_slice_like_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_single_dim_slice_like_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -911,6 +1346,9 @@ def if_multi_dim_slice_like(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     num_single_dim_slices_as_lists = 0
@@ -933,8 +1371,8 @@ def if_multi_dim_slice_like(obj, obj_name):
             raise
 
     except:
-        err_msg = _if_multi_dim_slice_like_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_multi_dim_slice_like_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -958,6 +1396,9 @@ def if_pair_of_floats(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -969,8 +1410,8 @@ def if_pair_of_floats(obj, obj_name):
         if count != 2:
             raise
     except:
-        err_msg = _if_pair_of_floats_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pair_of_floats_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -997,11 +1438,12 @@ def if_pair_of_positive_floats(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_pair_of_positive_floats_err_msg_1.format(obj_name)
-
         count = 0
         for elem_of_obj in obj:
             count += 1
@@ -1018,9 +1460,11 @@ def if_pair_of_positive_floats(obj, obj_name):
             check_if_positive_float(elem_of_obj, "elem_of_obj")
         
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_pair_of_positive_floats_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pair_of_positive_floats_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1047,11 +1491,12 @@ def if_pair_of_nonnegative_floats(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
     try:
-        err_msg = _if_pair_of_nonnegative_floats_err_msg_1.format(obj_name)
-
         count = 0
         for elem_of_obj in obj:
             count += 1
@@ -1068,9 +1513,11 @@ def if_pair_of_nonnegative_floats(obj, obj_name):
             check_if_nonnegative_float(elem_of_obj, "elem_of_obj")
         
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_pair_of_nonnegative_floats_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pair_of_nonnegative_floats_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1094,6 +1541,9 @@ def if_pair_of_ints(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -1105,8 +1555,8 @@ def if_pair_of_ints(obj, obj_name):
         if count != 2:
             raise
     except:
-        err_msg = _if_pair_of_ints_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pair_of_ints_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1133,11 +1583,12 @@ def if_pair_of_positive_ints(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_pair_of_positive_ints_err_msg_1.format(obj_name)
-
         count = 0
         for elem_of_obj in obj:
             count += 1
@@ -1152,9 +1603,11 @@ def if_pair_of_positive_ints(obj, obj_name):
             check_if_positive_int(elem_of_obj, "elem_of_obj")
         
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_pair_of_positive_ints_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pair_of_positive_ints_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1181,11 +1634,12 @@ def if_pair_of_nonnegative_ints(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_pair_of_nonnegative_ints_err_msg_1.format(obj_name)
-
         count = 0
         for elem_of_obj in obj:
             count += 1
@@ -1201,9 +1655,11 @@ def if_pair_of_nonnegative_ints(obj, obj_name):
             check_if_nonnegative_int(elem_of_obj, "elem_of_obj")
         
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_pair_of_nonnegative_ints_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pair_of_nonnegative_ints_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1230,11 +1686,12 @@ def if_quadruplet_of_nonnegative_ints(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_quadruplet_of_nonnegative_ints_err_msg_1.format(obj_name)
-
         count = 0
         for elem_of_obj in obj:
             count += 1
@@ -1250,9 +1707,11 @@ def if_quadruplet_of_nonnegative_ints(obj, obj_name):
             check_if_nonnegative_int(elem_of_obj, "elem_of_obj")
         
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_quadruplet_of_nonnegative_ints_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_quadruplet_of_nonnegative_ints_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1279,11 +1738,12 @@ def if_quadruplet_of_positive_floats(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_quadruplet_of_positive_floats_err_msg_1.format(obj_name)
-
         count = 0
         for elem_of_obj in obj:
             count += 1
@@ -1299,9 +1759,11 @@ def if_quadruplet_of_positive_floats(obj, obj_name):
             check_if_positive_float(elem_of_obj, "elem_of_obj")
         
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_quadruplet_of_positive_floats_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_quadruplet_of_positive_floats_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1325,6 +1787,9 @@ def if_pairs_of_floats(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -1335,8 +1800,14 @@ def if_pairs_of_floats(obj, obj_name):
             check_if_pair_of_floats(elem_of_obj, "elem_of_obj")
             
     except:
-        err_msg = _if_pairs_of_floats_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pairs_of_floats_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_pair_of_floats,
+                                     czekitout.batch.float_,
+                                     elems_are_pairs=True)
+        raise exception
 
     return None
 
@@ -1360,6 +1831,9 @@ def if_pairs_of_ints(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
     try:
@@ -1370,8 +1844,14 @@ def if_pairs_of_ints(obj, obj_name):
             check_if_pair_of_ints(elem_of_obj, "elem_of_obj")
             
     except:
-        err_msg = _if_pairs_of_ints_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pairs_of_ints_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_pair_of_ints,
+                                     czekitout.batch.int_,
+                                     elems_are_pairs=True)
+        raise exception
 
     return None
 
@@ -1400,11 +1880,12 @@ def if_pairs_of_nonnegative_ints(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
-        err_msg = _if_pairs_of_nonnegative_ints_err_msg_1.format(obj_name)
-
         check_if_pairs_of_ints = if_pairs_of_ints  # Alias for readability.
         check_if_pairs_of_ints(obj, obj_name)
 
@@ -1415,9 +1896,23 @@ def if_pairs_of_nonnegative_ints(obj, obj_name):
             check_if_pair_of_nonnegative_ints(elem_of_obj, "elem_of_obj")
             
     except ValueError:
-        raise ValueError(err_msg)
+        err_msg_args = (_if_pairs_of_nonnegative_ints_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationValueError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_pair_of_nonnegative_ints,
+                                     czekitout.batch.nonnegative_int,
+                                     elems_are_pairs=True)
+        raise exception
     except BaseException:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_pairs_of_nonnegative_ints_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_pair_of_nonnegative_ints,
+                                     czekitout.batch.nonnegative_int,
+                                     elems_are_pairs=True)
+        raise exception
 
     return None
 
@@ -1441,11 +1936,14 @@ def if_real_numpy_array(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
-    if not czekitout.isa.real_numpy_array(obj):
-        err_msg = _if_real_numpy_array_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+    if not _isa_at_validation_level(czekitout.isa.real_numpy_array, obj):
+        err_msg_args = (_if_real_numpy_array_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1469,11 +1967,14 @@ def if_real_numpy_array_1d(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
-    if not czekitout.isa.real_numpy_array_1d(obj):
-        err_msg = _if_real_numpy_array_1d_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+    if not _isa_at_validation_level(czekitout.isa.real_numpy_array_1d, obj):
+        err_msg_args = (_if_real_numpy_array_1d_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1497,11 +1998,14 @@ def if_real_numpy_matrix(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
-    if not czekitout.isa.real_numpy_matrix(obj):
-        err_msg = _if_real_numpy_matrix_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+    if not _isa_at_validation_level(czekitout.isa.real_numpy_matrix, obj):
+        err_msg_args = (_if_real_numpy_matrix_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1526,11 +2030,15 @@ def if_real_two_column_numpy_matrix(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
-    if not czekitout.isa.real_two_column_numpy_matrix(obj):
-        err_msg = _if_real_two_column_numpy_matrix_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+    if not _isa_at_validation_level(czekitout.isa.real_two_column_numpy_matrix,
+                                    obj):
+        err_msg_args = (_if_real_two_column_numpy_matrix_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1554,11 +2062,14 @@ def if_real_numpy_array_3d(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
-    if not czekitout.isa.real_numpy_array_3d(obj):
-        err_msg = _if_real_numpy_array_3d_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+    if not _isa_at_validation_level(czekitout.isa.real_numpy_array_3d, obj):
+        err_msg_args = (_if_real_numpy_array_3d_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1585,13 +2096,18 @@ def if_nonnegative_numpy_array(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
-    if not czekitout.isa.nonnegative_numpy_array(obj):
-        err_msg = _if_nonnegative_numpy_array_err_msg_1.format(obj_name)
+    if not _isa_at_validation_level(czekitout.isa.nonnegative_numpy_array, obj):
+        err_msg_args = (_if_nonnegative_numpy_array_err_msg_1, obj_name)
         if czekitout.isa.real_numpy_array(obj):
-            raise ValueError(err_msg)
-        raise TypeError(err_msg)
+            exception = czekitout.errors.ValidationValueError(*err_msg_args)
+            _attach_negative_elems(exception, obj)
+            raise exception
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1618,13 +2134,19 @@ def if_nonnegative_numpy_matrix(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
-    if not czekitout.isa.nonnegative_numpy_matrix(obj):
-        err_msg = _if_nonnegative_numpy_matrix_err_msg_1.format(obj_name)
+    if not _isa_at_validation_level(czekitout.isa.nonnegative_numpy_matrix,
+                                    obj):
+        err_msg_args = (_if_nonnegative_numpy_matrix_err_msg_1, obj_name)
         if czekitout.isa.real_numpy_matrix(obj):
-            raise ValueError(err_msg)
-        raise TypeError(err_msg)
+            exception = czekitout.errors.ValidationValueError(*err_msg_args)
+            _attach_negative_elems(exception, obj)
+            raise exception
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1648,6 +2170,9 @@ def if_bool(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     try:
@@ -1658,9 +2183,8 @@ def if_bool(obj, obj_name):
             if obj_after_rounding not in (0, 1):
                 raise
     except:
-        unformatted_err_msg = _if_bool_err_msg_1
-        err_msg = unformatted_err_msg.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_bool_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1684,6 +2208,9 @@ def if_bool_seq(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
     try:
@@ -1691,8 +2218,13 @@ def if_bool_seq(obj, obj_name):
             check_if_bool = if_bool  # Alias for readability.
             check_if_bool(elem_of_obj, "elem_of_obj")
     except:
-        err_msg = _if_bool_seq_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_bool_seq_err_msg_1, obj_name)
+        exception = czekitout.errors.ValidationTypeError(*err_msg_args)
+        _attach_invalid_elems_of_seq(exception,
+                                     obj,
+                                     if_bool,
+                                     czekitout.batch.bool_)
+        raise exception
 
     return None
 
@@ -1716,9 +2248,10 @@ def if_bool_matrix(obj, obj_name):
         Name of the input object.
 
     """
-    _check_obj_name(obj_name)
+    if _validation_level_flags.is_off:
+        return None
 
-    err_msg = _if_bool_matrix_err_msg_1.format(obj_name)
+    _check_obj_name(obj_name)
 
     try:
         for elem_of_obj in obj:
@@ -1726,7 +2259,8 @@ def if_bool_matrix(obj, obj_name):
                 check_if_bool = if_bool  # Alias for readability.
                 check_if_bool(elem_of_elem_of_obj, "elem_of_elem_of_obj")
     except:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_bool_matrix_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1750,16 +2284,18 @@ def if_bool_array_3d(obj, obj_name):
         Name of the input object.
 
     """
-    _check_obj_name(obj_name)
+    if _validation_level_flags.is_off:
+        return None
 
-    err_msg = _if_bool_array_3d_err_msg_1.format(obj_name)
+    _check_obj_name(obj_name)
 
     try:
         for elem_of_obj in obj:
             check_if_bool_matrix = if_bool_matrix  # Alias for readability.
             check_if_bool_matrix(elem_of_obj, "elem_of_obj")
     except:
-        raise TypeError(err_msg)
+        err_msg_args = (_if_bool_array_3d_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1783,11 +2319,14 @@ def if_complex_numpy_array(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
-    if not czekitout.isa.complex_numpy_array(obj):
-        err_msg = _if_complex_numpy_array_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+    if not _isa_at_validation_level(czekitout.isa.complex_numpy_array, obj):
+        err_msg_args = (_if_complex_numpy_array_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1811,11 +2350,14 @@ def if_complex_numpy_matrix(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
     
-    if not czekitout.isa.complex_numpy_matrix(obj):
-        err_msg = _if_complex_numpy_matrix_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+    if not _isa_at_validation_level(czekitout.isa.complex_numpy_matrix, obj):
+        err_msg_args = (_if_complex_numpy_matrix_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -1839,11 +2381,14 @@ def if_callable(obj, obj_name):
         Name of the input object.
 
     """
+    if _validation_level_flags.is_off:
+        return None
+
     _check_obj_name(obj_name)
 
     if not callable(obj):
-        err_msg = _if_callable_err_msg_1.format(obj_name)
-        raise TypeError(err_msg)
+        err_msg_args = (_if_callable_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
     return None
 
@@ -0,0 +1,729 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains functions that get and set the global and context-local settings of
+``czekitout``.
+
+The validation level determines how thoroughly the functions in the modules
+:mod:`czekitout.check` and :mod:`czekitout.convert` validate objects. The
+functions in the module :mod:`czekitout.isa` are unaffected by the validation
+level, i.e. they always perform all validations. There are three validation
+levels:
+
+* ``"full"``: All validations are performed. This is the default level.
+* ``"fast"``: All validations are performed, except those that require scanning
+  the elements of numpy arrays, e.g. checking for NaNs or negative numbers.
+  Only the metadata of numpy arrays, i.e. their types, dimensions, shapes, and
+  dtypes, is validated.
+* ``"off"``: No validations are performed: the ``check.if_*`` functions return
+  immediately, and the ``convert.to_*`` functions only perform type coercions,
+  i.e. they assume that the input objects are valid.
+
+The global validation level can be set at startup via the environment variable
+``CZEKITOUT_VALIDATION_LEVEL``, or anytime thereafter via the function
+:func:`czekitout.config.set_validation_level`. The validation level can also be
+overridden locally, i.e. within a given context, via the context manager
+:func:`czekitout.config.local_validation_level`. Context-local validation levels
+apply only to the thread or asynchronous task that set them.
+
+Functions decorated with :func:`czekitout.validated` validate and convert their
+arguments before being called. If validation stripping is enabled, then said
+functions skip said validations and conversions altogether, and simply call the
+undecorated function, such that the decorator adds almost no overhead.
+Validation stripping is a process-wide setting, which can be enabled at startup
+by setting the environment variable ``CZEKITOUT_STRIP_VALIDATION`` to ``"1"``,
+or anytime thereafter via the function
+:func:`czekitout.config.set_validation_stripping`.
+
+If error aggregation is enabled, then the ``czekitout.check.if_*`` functions
+that validate sequences or arrays element by element, upon failing, determine
+all the invalid elements of the object being validated, rather than only the
+first. The indices and values of said invalid elements, capped to a
+configurable maximum number, are then attached to the exception raised. See the
+documentation for the class :class:`czekitout.errors.ValidationError` for
+details. Error aggregation can be enabled globally via the function
+:func:`czekitout.config.set_error_aggregation`, or within a given context via
+the context manager :func:`czekitout.config.local_error_aggregation`. Since
+error aggregation only takes effect upon failed validations, it adds no
+overhead to successful ones.
+
+The dtype policy determines the dtypes of the numpy arrays returned by the
+real-valued numpy array converters of the module :mod:`czekitout.convert`, e.g.
+:func:`czekitout.convert.to_real_numpy_matrix`. There are four dtype policies:
+
+* ``"preserve"``: Numpy arrays that are already valid keep their dtypes, and are
+  passed through as is. Likewise, objects that expose their data via the buffer
+  protocol, the array interface, or DLPack, keep their dtypes, and are viewed
+  without copying. All other objects are converted to arrays of the dtype
+  ``numpy.float64``. This is the default policy.
+* ``"float64"``: The returned arrays are always of the dtype ``numpy.float64``.
+* ``"float32"``: The returned arrays are always of the dtype ``numpy.float32``,
+  which halves the memory occupied by the arrays, at the cost of precision.
+* ``"minimal_lossless"``: The returned arrays are of the smallest dtype, of the
+  same kind as the dtype inferred for the input object, that represents every
+  element exactly, e.g. an array of integers between ``0`` and ``255`` is
+  returned as an array of the dtype ``numpy.uint8``, and an array of floats
+  that are all exactly representable as half-precision floats is returned as an
+  array of the dtype ``numpy.float16``.
+
+Under every policy, the returned array is allocated at most once, and not at
+all if the input object is a valid numpy array already of the dtype determined
+by the policy. Under every policy except ``"minimal_lossless"``, lists and
+tuples are converted directly to arrays of the dtype determined by the policy,
+a block of elements at a time, such that no intermediate array of another dtype
+is allocated. Under the policy ``"minimal_lossless"``, the dtype of the returned
+array depends on the elements of the input object, hence lists and tuples are
+first converted to intermediate arrays of the dtypes inferred by numpy. The
+global dtype policy can be set via the function
+:func:`czekitout.config.set_dtype_policy`, or overridden within a given context
+via the context manager :func:`czekitout.config.local_dtype_policy`. The
+converters also accept the dtype policy as an optional argument, which takes
+precedence over the policy of the current context.
+
+The validation cache is an opt-in, persistent, on-disk record of which
+validations the arrays stored in files have passed, as validated by the
+functions and classes of the module :mod:`czekitout.io`. See the summary
+documentation of said module for details. The validation cache is enabled by
+setting the path of the file in which to store it, which can be done at startup
+via the environment variable ``CZEKITOUT_VALIDATION_CACHE_PATH``, or anytime
+thereafter via the function :func:`czekitout.config.set_validation_cache_path`.
+The validation cache is disabled by default.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For reading environment variables.
+import os
+
+# For creating context managers.
+import contextlib
+
+# For storing context-local settings.
+import contextvars
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["get_validation_level",
+           "set_validation_level",
+           "local_validation_level",
+           "get_validation_stripping",
+           "set_validation_stripping",
+           "get_error_aggregation",
+           "set_error_aggregation",
+           "local_error_aggregation",
+           "get_max_num_reported_invalid_elems",
+           "set_max_num_reported_invalid_elems",
+           "get_dtype_policy",
+           "set_dtype_policy",
+           "local_dtype_policy",
+           "get_validation_cache_path",
+           "set_validation_cache_path"]
+
+
+
+_accepted_validation_levels = ("full", "fast", "off")
+
+_accepted_dtype_policies = ("preserve",
+                            "float64",
+                            "float32",
+                            "minimal_lossless")
+
+
+
+def _check_validation_level(level):
+    if ((not isinstance(level, str))
+        or (level not in _accepted_validation_levels)):
+        err_msg_args = (_check_validation_level_err_msg_1,
+                        str(_accepted_validation_levels))
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    return None
+
+
+
+def _check_bool(obj, obj_name):
+    if not isinstance(obj, bool):
+        err_msg_args = (_check_bool_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    return None
+
+
+
+class _ValidationLevelFlags():
+    # The flags ``is_off`` and ``is_full`` of the global validation level,
+    # stored as plain instance attributes, such that reading either flag costs
+    # a single attribute lookup. Upon setting a context-local validation level
+    # for the first time, the class of the instance is switched to the class
+    # below, whose properties take into account the context-local validation
+    # level of the current context, if any. The switch is permanent, since a
+    # context copied within a ``local_validation_level`` block, e.g. by an
+    # asynchronous task, keeps the context-local validation level of said block
+    # after the latter is exited.
+    def __init__(self, level):
+        _update_validation_level_flags(self, level)
+
+        return None
+
+
+
+class _ContextDependentValidationLevelFlags():
+    # The flags ``is_off`` and ``is_full`` take into account the context-local
+    # validation level of the current context, if any, which is stored in a
+    # context variable, such that a context-local validation level set in one
+    # thread or asynchronous task does not affect any other.
+    @property
+    def is_off(self):
+        result = (_current_validation_level() == "off")
+
+        return result
+
+
+
+    @property
+    def is_full(self):
+        result = (_current_validation_level() == "full")
+
+        return result
+
+
+
+def _update_validation_level_flags(flags, level):
+    # The instance dictionary is updated directly, since the class of
+    # ``flags`` may have been switched to one whose flags are properties.
+    vars(flags).update({"is_off": (level == "off"),
+                        "is_full": (level == "full")})
+
+    return None
+
+
+
+def _validation_level_from_env():
+    env_var_name = "CZEKITOUT_VALIDATION_LEVEL"
+    level = os.environ.get(env_var_name, "full")
+
+    if level not in _accepted_validation_levels:
+        err_msg_args = (_validation_level_from_env_err_msg_1,
+                        env_var_name,
+                        str(_accepted_validation_levels))
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    return level
+
+
+
+_global_validation_level = _validation_level_from_env()
+
+_local_validation_level = contextvars.ContextVar("local_validation_level",
+                                                 default=None)
+
+_validation_level_flags = _ValidationLevelFlags(_global_validation_level)
+
+
+
+def _current_validation_level():
+    level = _local_validation_level.get()
+    result = _global_validation_level if (level is None) else level
+
+    return result
+
+
+
+def get_validation_level():
+    r"""Get the validation level of the current context.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of the validation levels.
+
+    Returns
+    -------
+    level : "full" | "fast" | "off"
+        The validation level of the current context, which is the context-local
+        validation level if one is active, otherwise it is the global validation
+        level.
+
+    """
+    level = _current_validation_level()
+
+    return level
+
+
+
+def set_validation_level(level):
+    r"""Set the global validation level.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of the validation levels.
+
+    If ``level`` is not one of the accepted validation levels, then a
+    `ValueError` exception is raised.
+
+    Parameters
+    ----------
+    level : "full" | "fast" | "off"
+        The new global validation level.
+
+    """
+    global _global_validation_level
+
+    _check_validation_level(level)
+    _global_validation_level = level
+    _update_validation_level_flags(_validation_level_flags, level)
+
+    return None
+
+
+
+@contextlib.contextmanager
+def local_validation_level(level):
+    r"""Override the validation level within a context.
+
+    This function returns a context manager that sets the validation level of
+    the current context, i.e. of the current thread or asynchronous task, upon
+    entering the ``with`` block, and restores the previous validation level upon
+    exiting said block. Context managers of this kind can be nested.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of the validation levels.
+
+    If ``level`` is not one of the accepted validation levels, then a
+    `ValueError` exception is raised.
+
+    Parameters
+    ----------
+    level : "full" | "fast" | "off"
+        The validation level to use within the context.
+
+    """
+    _check_validation_level(level)
+
+    _validation_level_flags.__class__ = _ContextDependentValidationLevelFlags
+    token = _local_validation_level.set(level)
+    try:
+        yield
+    finally:
+        _local_validation_level.reset(token)
+
+    return None
+
+
+
+class _ValidationStrippingFlags():
+    def __init__(self, is_enabled):
+        self.is_enabled = is_enabled
+
+        return None
+
+
+
+def _validation_stripping_from_env():
+    env_var_name = "CZEKITOUT_STRIP_VALIDATION"
+    env_var_value = os.environ.get(env_var_name, "0")
+
+    if env_var_value not in ("0", "1"):
+        err_msg_args = (_validation_stripping_from_env_err_msg_1, env_var_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    is_enabled = (env_var_value == "1")
+
+    return is_enabled
+
+
+
+_validation_stripping_flags = \
+    _ValidationStrippingFlags(_validation_stripping_from_env())
+
+
+
+def get_validation_stripping():
+    r"""Get whether validation stripping is enabled.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of validation stripping.
+
+    Returns
+    -------
+    enabled : `bool`
+        ``enabled`` is set to ``True`` if validation stripping is enabled,
+        otherwise it is set to ``False``.
+
+    """
+    enabled = _validation_stripping_flags.is_enabled
+
+    return enabled
+
+
+
+def set_validation_stripping(enabled):
+    r"""Enable or disable validation stripping.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of validation stripping.
+
+    If ``enabled`` is not boolean, then a `TypeError` exception is raised.
+
+    Parameters
+    ----------
+    enabled : `bool`
+        Validation stripping is enabled if ``enabled`` is set to ``True``, and
+        disabled otherwise.
+
+    """
+    _check_bool(enabled, "enabled")
+    _validation_stripping_flags.is_enabled = enabled
+
+    return None
+
+
+
+_global_error_aggregation = False
+
+_local_error_aggregation = contextvars.ContextVar("local_error_aggregation",
+                                                  default=None)
+
+_max_num_reported_invalid_elems = 100
+
+
+
+def get_error_aggregation():
+    r"""Get whether error aggregation is enabled in the current context.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of error aggregation.
+
+    Returns
+    -------
+    enabled : `bool`
+        ``enabled`` is set to ``True`` if error aggregation is enabled in the
+        current context, otherwise it is set to ``False``.
+
+    """
+    enabled = _local_error_aggregation.get()
+    if enabled is None:
+        enabled = _global_error_aggregation
+
+    return enabled
+
+
+
+def set_error_aggregation(enabled):
+    r"""Enable or disable error aggregation globally.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of error aggregation.
+
+    If ``enabled`` is not boolean, then a `TypeError` exception is raised.
+
+    Parameters
+    ----------
+    enabled : `bool`
+        Error aggregation is enabled globally if ``enabled`` is set to ``True``,
+        and disabled otherwise.
+
+    """
+    global _global_error_aggregation
+
+    _check_bool(enabled, "enabled")
+    _global_error_aggregation = enabled
+
+    return None
+
+
+
+@contextlib.contextmanager
+def local_error_aggregation(enabled=True):
+    r"""Enable or disable error aggregation within a context.
+
+    This function returns a context manager that enables or disables error
+    aggregation in the current context, i.e. in the current thread or
+    asynchronous task, upon entering the ``with`` block, and restores the
+    previous setting upon exiting said block.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of error aggregation.
+
+    If ``enabled`` is not boolean, then a `TypeError` exception is raised.
+
+    Parameters
+    ----------
+    enabled : `bool`, optional
+        Error aggregation is enabled within the context if ``enabled`` is set to
+        ``True``, and disabled otherwise.
+
+    """
+    _check_bool(enabled, "enabled")
+
+    token = _local_error_aggregation.set(enabled)
+    try:
+        yield
+    finally:
+        _local_error_aggregation.reset(token)
+
+    return None
+
+
+
+def get_max_num_reported_invalid_elems():
+    r"""Get the maximum number of invalid elements reported upon error
+    aggregation.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of error aggregation.
+
+    Returns
+    -------
+    max_num : `int`
+        The maximum number of invalid elements reported upon error aggregation.
+
+    """
+    max_num = _max_num_reported_invalid_elems
+
+    return max_num
+
+
+
+def set_max_num_reported_invalid_elems(max_num):
+    r"""Set the maximum number of invalid elements reported upon error
+    aggregation.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of error aggregation. The default maximum number is ``100``.
+
+    If ``max_num`` is not an integer, then a `TypeError` exception is raised. If
+    ``max_num`` is an integer that is not positive, then a `ValueError`
+    exception is raised.
+
+    Parameters
+    ----------
+    max_num : `int`
+        The new maximum number of invalid elements reported upon error
+        aggregation.
+
+    """
+    global _max_num_reported_invalid_elems
+
+    err_msg_args = (_set_max_num_reported_invalid_elems_err_msg_1,)
+    if (not isinstance(max_num, int)) or isinstance(max_num, bool):
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+    if max_num < 1:
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    _max_num_reported_invalid_elems = max_num
+
+    return None
+
+
+
+_global_dtype_policy = "preserve"
+
+_local_dtype_policy = contextvars.ContextVar("local_dtype_policy", default=None)
+
+
+
+def _check_dtype_policy(dtype_policy):
+    if ((not isinstance(dtype_policy, str))
+        or (dtype_policy not in _accepted_dtype_policies)):
+        err_msg_args = (_check_dtype_policy_err_msg_1,
+                        str(_accepted_dtype_policies))
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    return None
+
+
+
+def get_dtype_policy():
+    r"""Get the dtype policy of the current context.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of the dtype policies.
+
+    Returns
+    -------
+    dtype_policy : "preserve" | "float64" | "float32" | "minimal_lossless"
+        The dtype policy of the current context, which is the context-local
+        dtype policy if one is active, otherwise it is the global dtype policy.
+
+    """
+    dtype_policy = _local_dtype_policy.get()
+    if dtype_policy is None:
+        dtype_policy = _global_dtype_policy
+
+    return dtype_policy
+
+
+
+def set_dtype_policy(dtype_policy):
+    r"""Set the global dtype policy.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of the dtype policies.
+
+    If ``dtype_policy`` is not one of the accepted dtype policies, then a
+    `ValueError` exception is raised.
+
+    Parameters
+    ----------
+    dtype_policy : "preserve" | "float64" | "float32" | "minimal_lossless"
+        The new global dtype policy.
+
+    """
+    global _global_dtype_policy
+
+    _check_dtype_policy(dtype_policy)
+    _global_dtype_policy = dtype_policy
+
+    return None
+
+
+
+@contextlib.contextmanager
+def local_dtype_policy(dtype_policy):
+    r"""Override the dtype policy within a context.
+
+    This function returns a context manager that sets the dtype policy of the
+    current context, i.e. of the current thread or asynchronous task, upon
+    entering the ``with`` block, and restores the previous dtype policy upon
+    exiting said block. Context managers of this kind can be nested.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of the dtype policies.
+
+    If ``dtype_policy`` is not one of the accepted dtype policies, then a
+    `ValueError` exception is raised.
+
+    Parameters
+    ----------
+    dtype_policy : "preserve" | "float64" | "float32" | "minimal_lossless"
+        The dtype policy to use within the context.
+
+    """
+    _check_dtype_policy(dtype_policy)
+
+    token = _local_dtype_policy.set(dtype_policy)
+    try:
+        yield
+    finally:
+        _local_dtype_policy.reset(token)
+
+    return None
+
+
+
+def _validation_cache_path_from_env():
+    env_var_name = "CZEKITOUT_VALIDATION_CACHE_PATH"
+    path = os.environ.get(env_var_name, "")
+    path = None if (path == "") else path
+
+    return path
+
+
+
+_validation_cache_path = _validation_cache_path_from_env()
+
+
+
+def get_validation_cache_path():
+    r"""Get the path of the file storing the validation cache.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of the validation cache.
+
+    Returns
+    -------
+    path : `str` | `None`
+        The path of the file storing the validation cache if the validation
+        cache is enabled, otherwise ``None``.
+
+    """
+    path = _validation_cache_path
+
+    return path
+
+
+
+def set_validation_cache_path(path):
+    r"""Set the path of the file storing the validation cache.
+
+    See the summary documentation of the module :mod:`czekitout.config` for a
+    description of the validation cache.
+
+    If ``path`` is neither ``None`` nor a path-like object, then a `TypeError`
+    exception is raised.
+
+    Parameters
+    ----------
+    path : `str` | path-like object | `None`
+        The path of the file storing the validation cache, which is created
+        upon first use if it does not exist. If ``path`` is set to ``None``,
+        then the validation cache is disabled.
+
+    """
+    global _validation_cache_path
+
+    if path is not None:
+        try:
+            path = os.fspath(path)
+        except:
+            err_msg_args = (_set_validation_cache_path_err_msg_1,)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    _validation_cache_path = path
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_check_validation_level_err_msg_1 = \
+    ("The object ``level`` must be set to one of the following strings: "
+     "``{}``.")
+
+_validation_level_from_env_err_msg_1 = \
+    ("The environment variable ``{}`` must be set to one of the following "
+     "strings: ``{}``.")
+
+_validation_stripping_from_env_err_msg_1 = \
+    ("The environment variable ``{}`` must be set to either ``'0'`` or "
+     "``'1'``.")
+
+_check_bool_err_msg_1 = \
+    ("The object ``{}`` must be boolean.")
+
+_set_max_num_reported_invalid_elems_err_msg_1 = \
+    ("The object ``max_num`` must be a positive integer.")
+
+_check_dtype_policy_err_msg_1 = \
+    ("The object ``dtype_policy`` must be set to one of the following strings: "
+     "``{}``.")
+
+_set_validation_cache_path_err_msg_1 = \
+    ("The object ``path`` must be either set to ``None`` or a path-like "
+     "object.")
@@ -32,12 +32,21 @@ import numpy as np
 
 
 
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For getting the validation level.
+import czekitout.config
+
 # For type-checking objects.
 import czekitout.isa
 
 # For validating objects.
 import czekitout.check
 
+# For storing boolean arrays with one bit per element.
+import czekitout.packed
+
 
 
 ##################################
@@ -98,6 +107,19 @@ __all__ = ["to_dict",
 
 
 
+# Flags indicating the validation level of the current context.
+_validation_level_flags = czekitout.config._validation_level_flags
+
+# Validates objects via the functions in the module :mod:`czekitout.isa`, taking
+# into account the validation level of the current context.
+_isa_at_validation_level = czekitout.check._isa_at_validation_level
+
+# The types of the objects that can be converted directly to `float` objects
+# when validations are turned off.
+_types_directly_convertible_to_float = (int, float, np.integer, np.floating)
+
+
+
 def to_dict(obj, obj_name):
     r"""Convert input object to an instance of the class `dict`.
 
@@ -356,6 +378,17 @@ def to_float(obj, obj_name):
         The object resulting from the conversion.
 
     """
+    if (_validation_level_flags.is_off
+        and isinstance(obj, _types_directly_convertible_to_float)):
+        result = float(obj)
+    else:
+        result = _to_float(obj, obj_name)
+
+    return result
+
+
+
+def _to_float(obj, obj_name):
     try:
         convert_to_str_from_str_like = \
             to_str_from_str_like  # Alias for readability.
@@ -388,6 +421,9 @@ def to_float(obj, obj_name):
             kwargs["obj"] = intermediate_conversion_of_obj
             czekitout.check.if_float(**kwargs)
 
+            # Only reached if validations are turned off.
+            raise
+
     return result
 
 
@@ -1535,7 +1571,310 @@ def to_pairs_of_nonnegative_ints(obj, obj_name):
 
 
 
-def to_real_two_column_numpy_matrix(obj, obj_name):
+_accepted_orders = ("any", "C", "F")
+
+
+
+def _check_and_convert_memory_settings(copy,
+                                       readonly,
+                                       order,
+                                       align,
+                                       out,
+                                       preserve_mask):
+    if copy is not None:
+        copy = to_bool(copy, "copy")
+    readonly = to_bool(readonly, "readonly")
+    preserve_mask = to_bool(preserve_mask, "preserve_mask")
+
+    kwargs = {"obj": order,
+              "obj_name": "order",
+              "accepted_strings": _accepted_orders}
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    if align is not None:
+        align = to_positive_int(align, "align")
+        if (align & (align-1)) != 0:
+            err_msg_args = (_check_and_convert_memory_settings_err_msg_1,)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    if out is not None:
+        if not isinstance(out, np.ndarray):
+            err_msg_args = (_check_and_convert_memory_settings_err_msg_2,)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+        if ((not out.flags.writeable)
+            or (not _layout_is_compliant(out, order, align))):
+            err_msg_args = (_check_and_convert_memory_settings_err_msg_3,)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    # The order in which to allocate intermediate conversions, such that they
+    # already have the required memory layout.
+    numpy_order = "K" if (order == "any") else order
+
+    memory_settings = {"copy": copy,
+                       "readonly": readonly,
+                       "order": order,
+                       "align": align,
+                       "out": out,
+                       "preserve_mask": preserve_mask,
+                       "numpy_order": numpy_order}
+
+    return memory_settings
+
+
+
+def _unmasked_unless_mask_is_preserved(obj, memory_settings):
+    # Discarding the mask of a masked array exposes its masked elements, hence
+    # in that case the data of the masked array, i.e. a view thereof, is
+    # converted instead, such that all of its elements are validated.
+    if ((not memory_settings["preserve_mask"])
+        and isinstance(obj, np.ma.MaskedArray)):
+        result = obj.data
+    else:
+        result = obj
+
+    return result
+
+
+
+def _layout_is_compliant(array, order, align):
+    if order == "C":
+        result = array.flags.c_contiguous
+    elif order == "F":
+        result = array.flags.f_contiguous
+    else:
+        result = True
+
+    if result and (align is not None) and (array.size > 0):
+        result = (array.ctypes.data % align == 0)
+
+    return result
+
+
+
+def _aligned_empty(shape, dtype, order, align):
+    # Numpy does not expose the alignment of its allocations, hence a slightly
+    # larger byte buffer is allocated, and the array is carved out of it at the
+    # first offset that satisfies the alignment.
+    dtype = np.dtype(dtype)
+    num_bytes = int(np.prod(shape)) * dtype.itemsize
+    byte_buffer = np.empty(num_bytes+align, dtype=np.uint8)
+    offset = (-byte_buffer.ctypes.data) % align
+    byte_buffer = byte_buffer[offset:offset+num_bytes]
+    result = byte_buffer.view(dtype).reshape(shape, order=order)
+
+    return result
+
+
+
+def _copy_with_layout(array, dtype, order, align):
+    if order == "any":
+        order = ("F"
+                 if (array.flags.f_contiguous and not array.flags.c_contiguous)
+                 else "C")
+
+    if align is None:
+        result = np.empty(array.shape, dtype=dtype, order=order)
+    else:
+        result = _aligned_empty(array.shape, dtype, order, align)
+    np.copyto(result, array, casting="unsafe")
+
+    return result
+
+
+
+def _zero_copy_view_of(obj):
+    # Returns a numpy array that shares memory with ``obj`` if ``obj`` exposes
+    # its data via the array interface, DLPack, or the buffer protocol,
+    # otherwise ``None`` is returned. Byte strings are excluded, since they are
+    # treated as strings rather than arrays of bytes.
+    try:
+        if (hasattr(obj, "__array_interface__")
+            or hasattr(obj, "__array_struct__")):
+            view = np.asarray(obj)
+        elif hasattr(obj, "__dlpack__"):
+            view = np.from_dlpack(obj)
+        elif isinstance(obj, bytes):
+            view = None
+        else:
+            view = np.asarray(memoryview(obj))
+    except:
+        view = None
+
+    return view
+
+
+
+def _intermediate_conversion_of(obj, numpy_order):
+    view = _zero_copy_view_of(obj)
+    result = np.array(obj, order=numpy_order) if (view is None) else view
+
+    return result
+
+
+
+# The dtypes of the freshly allocated conversions of objects under the dtype
+# policies that determine said dtypes regardless of the elements of the objects.
+_fresh_conversion_dtypes_of_dtype_policies = \
+    {"preserve": np.dtype(np.float64),
+     "float64": np.dtype(np.float64),
+     "float32": np.dtype(np.float32)}
+
+# The maximum number of elements per block of a sequence converted at a time.
+_max_num_elems_per_block = 2**12
+
+
+
+def _real_intermediate_conversion_of(obj, numpy_order, dtype_policy):
+    # Like ``_intermediate_conversion_of``, except that lists and tuples are
+    # converted directly to arrays of the dtype determined by the dtype policy,
+    # if said dtype does not depend on their elements, rather than to
+    # intermediate arrays of the dtypes inferred by numpy, which would then be
+    # converted again. Instances of subclasses of lists and tuples are excluded,
+    # since they may expose their data via the array interface, DLPack, or the
+    # buffer protocol.
+    dtype = _fresh_conversion_dtypes_of_dtype_policies.get(dtype_policy, None)
+
+    if (dtype is not None) and (type(obj) in (list, tuple)) and obj:
+        result = _real_array_of_seq(obj, dtype, numpy_order)
+    else:
+        result = None
+
+    if result is None:
+        result = _intermediate_conversion_of(obj, numpy_order)
+
+    return result
+
+
+
+def _real_array_of_seq(seq, dtype, numpy_order):
+    # Converts the sequence ``seq`` to an array of the dtype ``dtype``, block by
+    # block along its first axis, such that only the result and a single block
+    # are held in memory at a time. Each block is converted to an array of the
+    # dtype inferred by numpy, which only checks the type of the elements of the
+    # block, i.e. each block must be a real-valued array. If any block is not,
+    # or if the blocks are of inconsistent shapes, then ``None`` is returned,
+    # and the sequence is left to be converted and validated as usual.
+    num_elems_per_block = 1
+    result = None
+    start = 0
+
+    try:
+        while start < len(seq):
+            block = np.array(seq[start:start+num_elems_per_block])
+
+            if result is None:
+                shape = (len(seq),) + block.shape[1:]
+                order = "F" if (numpy_order == "F") else "C"
+                result = np.empty(shape, dtype=dtype, order=order)
+                num_elems_per_block = max(_max_num_elems_per_block//block.size,
+                                          1)
+
+            if ((block.dtype.kind not in "biuf")
+                or (block.shape[1:] != result.shape[1:])):
+                raise
+
+            result[start:start+len(block)] = block
+            start += len(block)
+    except:
+        result = None
+
+    return result
+
+
+
+def _is_fresh_conversion(array, obj):
+    # Conversions of ``obj`` that are not ``obj`` itself and that own their
+    # memory have been freshly allocated, hence share no memory with ``obj``.
+    # All other conversions are ``obj`` itself or views of its data.
+    result = ((array is not obj) and (array.base is None))
+
+    return result
+
+
+
+def _finalize_conversion(result, obj, obj_name, result_dtype, memory_settings):
+    # ``result`` is the validated conversion of ``obj``, prior to any change of
+    # dtype or layout. Any change of dtype, any change of layout, and any
+    # requested copy are performed together, in a single allocation, or in
+    # none at all if an output buffer is given.
+    copy = memory_settings["copy"]
+    readonly = memory_settings["readonly"]
+    order = memory_settings["order"]
+    align = memory_settings["align"]
+    out = memory_settings["out"]
+    preserve_mask = memory_settings["preserve_mask"]
+
+    if isinstance(result, np.ma.MaskedArray):
+        # The data of a masked array is a view thereof, hence the conversion
+        # proceeds without copying said data, unless required otherwise.
+        result = result.data
+
+    if out is not None:
+        result = _write_conversion_to_out(result, obj_name, copy, out)
+    else:
+        result_is_fresh = _is_fresh_conversion(result, obj)
+        if result_dtype is None:
+            result_dtype = result.dtype
+
+        copy_is_needed = ((result.dtype != result_dtype)
+                          or (not _layout_is_compliant(result, order, align))
+                          or (copy and (not result_is_fresh)))
+
+        if (result_is_fresh or copy_is_needed) and (copy is False):
+            err_msg_args = (_finalize_conversion_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        if copy_is_needed:
+            result = _copy_with_layout(result, result_dtype, order, align)
+        elif readonly and (not result_is_fresh):
+            result = result.view()
+            result.flags.writeable = False
+
+    if preserve_mask and isinstance(obj, np.ma.MaskedArray):
+        mask = obj.mask
+        if copy and (mask is not np.ma.nomask):
+            mask = mask.copy()
+        result = np.ma.MaskedArray(result, mask=mask, copy=False)
+
+    return result
+
+
+
+def _write_conversion_to_out(result, obj_name, copy, out):
+    if copy is False:
+        err_msg_args = (_finalize_conversion_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    if out.shape != result.shape:
+        err_msg_args = (_write_conversion_to_out_err_msg_1,
+                        obj_name,
+                        str(result.shape),
+                        str(out.shape))
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    try:
+        np.copyto(out, result, casting="same_kind")
+    except:
+        err_msg_args = (_write_conversion_to_out_err_msg_2,
+                        obj_name,
+                        str(result.dtype),
+                        str(out.dtype))
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    result = out
+
+    return result
+
+
+
+def to_real_two_column_numpy_matrix(obj,
+                                    obj_name,
+                                    copy=None,
+                                    readonly=False,
+                                    order="any",
+                                    align=None,
+                                    out=None,
+                                    preserve_mask=False):
     r"""Convert input object to a real-valued 2D two-column numpy array.
 
     If the input object is not a real-valued two-column matrix, then a
@@ -1552,30 +1891,100 @@ def to_real_two_column_numpy_matrix(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``out`` is not set to
+        ``None``, then ``result`` is ``out``.
 
     """
-    err_msg = _to_real_two_column_numpy_matrix_err_msg_1.format(obj_name)
-    
-    if czekitout.isa.real_two_column_numpy_matrix(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+
+    if _isa_at_validation_level(czekitout.isa.real_two_column_numpy_matrix,
+                                obj):
         result = obj
     else:
         try:
-            result = np.array(obj)
+            result = _intermediate_conversion_of(obj, numpy_order)
             kwargs = {"obj": result, "obj_name": obj_name}
             czekitout.check.if_real_two_column_numpy_matrix(**kwargs)
         except:
-            raise TypeError(err_msg)
+            unformatted_err_msg = _to_real_two_column_numpy_matrix_err_msg_1
+            err_msg_args = (unformatted_err_msg, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, None, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_numpy_array(obj, obj_name):
+def to_numpy_array(obj,
+                   obj_name,
+                   copy=None,
+                   readonly=False,
+                   order="any",
+                   align=None,
+                   out=None,
+                   preserve_mask=False):
     r"""Convert input object to a numpy array.
 
     If the input object is not an array, then a `TypeError` exception is raised
@@ -1591,27 +2000,148 @@ def to_numpy_array(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``out`` is not set to
+        ``None``, then ``result`` is ``out``.
 
     """
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+
     if czekitout.isa.numpy_array(obj):
         result = obj
     else:
         try:
-            result = np.array(obj)
+            result = _intermediate_conversion_of(obj, numpy_order)
         except:
-            err_msg = _to_numpy_array_err_msg_1.format(obj_name)
-            raise TypeError(err_msg)
+            err_msg_args = (_to_numpy_array_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, None, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_real_numpy_array(obj, obj_name):
+def _check_and_convert_dtype_policy(dtype_policy):
+    if dtype_policy is None:
+        dtype_policy = czekitout.config.get_dtype_policy()
+    else:
+        czekitout.config._check_dtype_policy(dtype_policy)
+
+    return dtype_policy
+
+
+
+def _minimal_lossless_dtype_of(array):
+    # The masked elements of masked arrays whose masks are preserved are
+    # converted as is, hence they are also required to be represented exactly.
+    array = np.ma.getdata(array)
+    dtype = array.dtype
+
+    if (dtype.kind in "iu") and (array.size > 0):
+        dtype = np.result_type(np.min_scalar_type(array.min()),
+                               np.min_scalar_type(array.max()))
+    elif dtype.kind == "f":
+        for candidate_dtype in (np.float16, np.float32):
+            if np.dtype(candidate_dtype).itemsize >= dtype.itemsize:
+                break
+            with np.errstate(all="ignore"):
+                candidate_array = array.astype(candidate_dtype)
+            if np.array_equal(candidate_array, array, equal_nan=True):
+                dtype = np.dtype(candidate_dtype)
+                break
+
+    return dtype
+
+
+
+def _result_dtype_of(array, obj, dtype_policy):
+    # ``array`` is the validated conversion of ``obj``. Under the policy
+    # ``"preserve"``, fresh conversions are converted to floats, whereas numpy
+    # arrays, and zero-copy views of the data of other objects, keep their
+    # dtypes.
+    if dtype_policy == "preserve":
+        result_dtype = (np.dtype(np.float64)
+                        if _is_fresh_conversion(array, obj)
+                        else array.dtype)
+    elif dtype_policy == "minimal_lossless":
+        result_dtype = _minimal_lossless_dtype_of(array)
+    else:
+        result_dtype = np.dtype(dtype_policy)
+
+    return result_dtype
+
+
+
+def to_real_numpy_array(obj,
+                        obj_name,
+                        dtype_policy=None,
+                        copy=None,
+                        readonly=False,
+                        order="any",
+                        align=None,
+                        out=None,
+                        preserve_mask=False):
     r"""Convert input object to a real-valued numpy array.
 
     If the input object is not a real-valued array, then a `TypeError` exception
@@ -1627,31 +2157,117 @@ def to_real_numpy_array(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    dtype_policy : `None` | `str`, optional
+        The dtype policy that determines the dtype of the result, i.e. one of
+        ``"preserve"``, ``"float64"``, ``"float32"``, or
+        ``"minimal_lossless"``. See the summary documentation of the module
+        :mod:`czekitout.config` for a description of the dtype policies. If
+        ``dtype_policy`` is set to ``None``, then the dtype policy of the
+        current context is used.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``obj`` is already a valid
+        numpy array of the dtype determined by the dtype policy, then ``result``
+        is ``obj`` itself, unless a copy or a read-only view is requested, or
+        ``obj`` does not have the required memory layout. If ``out`` is not set
+        to ``None``, then ``result`` is ``out``.
 
     """
-    if czekitout.isa.real_numpy_array(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+    dtype_policy = _check_and_convert_dtype_policy(dtype_policy)
+
+    if _isa_at_validation_level(czekitout.isa.real_numpy_array, obj):
         result = obj
+        result_dtype = _result_dtype_of(obj, obj, dtype_policy)
     else:
         try:
-            intermediate_conversion_of_obj = np.array(obj)
+            args = (obj, numpy_order, dtype_policy)
+            intermediate_conversion_of_obj = \
+                _real_intermediate_conversion_of(*args)
             kwargs = {"obj": intermediate_conversion_of_obj,
                       "obj_name": obj_name}
             czekitout.check.if_real_numpy_array(**kwargs)
-            result = np.array(intermediate_conversion_of_obj, dtype=float)
+            args = (intermediate_conversion_of_obj, obj, dtype_policy)
+            result_dtype = _result_dtype_of(*args)
+            result = intermediate_conversion_of_obj
         except:
-            err_msg = _to_real_numpy_array_err_msg_1.format(obj_name)
-            raise TypeError(err_msg)
+            err_msg_args = (_to_real_numpy_array_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, result_dtype, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_real_numpy_array_1d(obj, obj_name):
+def to_real_numpy_array_1d(obj,
+                           obj_name,
+                           dtype_policy=None,
+                           copy=None,
+                           readonly=False,
+                           order="any",
+                           align=None,
+                           out=None,
+                           preserve_mask=False):
     r"""Convert input object to a real-valued 1D numpy array.
 
     If the input object is not a real-valued 1D array, then a `TypeError`
@@ -1667,31 +2283,117 @@ def to_real_numpy_array_1d(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    dtype_policy : `None` | `str`, optional
+        The dtype policy that determines the dtype of the result, i.e. one of
+        ``"preserve"``, ``"float64"``, ``"float32"``, or
+        ``"minimal_lossless"``. See the summary documentation of the module
+        :mod:`czekitout.config` for a description of the dtype policies. If
+        ``dtype_policy`` is set to ``None``, then the dtype policy of the
+        current context is used.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``obj`` is already a valid
+        numpy array of the dtype determined by the dtype policy, then ``result``
+        is ``obj`` itself, unless a copy or a read-only view is requested, or
+        ``obj`` does not have the required memory layout. If ``out`` is not set
+        to ``None``, then ``result`` is ``out``.
 
     """
-    if czekitout.isa.real_numpy_array_1d(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+    dtype_policy = _check_and_convert_dtype_policy(dtype_policy)
+
+    if _isa_at_validation_level(czekitout.isa.real_numpy_array_1d, obj):
         result = obj
+        result_dtype = _result_dtype_of(obj, obj, dtype_policy)
     else:
         try:
-            intermediate_conversion_of_obj = np.array(obj)
+            args = (obj, numpy_order, dtype_policy)
+            intermediate_conversion_of_obj = \
+                _real_intermediate_conversion_of(*args)
             kwargs = {"obj": intermediate_conversion_of_obj,
                       "obj_name": obj_name}
             czekitout.check.if_real_numpy_array_1d(**kwargs)
-            result = np.array(intermediate_conversion_of_obj, dtype=float)
+            args = (intermediate_conversion_of_obj, obj, dtype_policy)
+            result_dtype = _result_dtype_of(*args)
+            result = intermediate_conversion_of_obj
         except:
-            err_msg = _to_real_numpy_array_1d_err_msg_1.format(obj_name)
-            raise TypeError(err_msg)
+            err_msg_args = (_to_real_numpy_array_1d_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, result_dtype, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_real_numpy_matrix(obj, obj_name):
+def to_real_numpy_matrix(obj,
+                         obj_name,
+                         dtype_policy=None,
+                         copy=None,
+                         readonly=False,
+                         order="any",
+                         align=None,
+                         out=None,
+                         preserve_mask=False):
     r"""Convert input object to a real-valued numpy array.
 
     If the input object is not a real-valued matrix, then a `TypeError`
@@ -1707,31 +2409,117 @@ def to_real_numpy_matrix(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    dtype_policy : `None` | `str`, optional
+        The dtype policy that determines the dtype of the result, i.e. one of
+        ``"preserve"``, ``"float64"``, ``"float32"``, or
+        ``"minimal_lossless"``. See the summary documentation of the module
+        :mod:`czekitout.config` for a description of the dtype policies. If
+        ``dtype_policy`` is set to ``None``, then the dtype policy of the
+        current context is used.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``obj`` is already a valid
+        numpy array of the dtype determined by the dtype policy, then ``result``
+        is ``obj`` itself, unless a copy or a read-only view is requested, or
+        ``obj`` does not have the required memory layout. If ``out`` is not set
+        to ``None``, then ``result`` is ``out``.
 
     """
-    if czekitout.isa.real_numpy_matrix(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+    dtype_policy = _check_and_convert_dtype_policy(dtype_policy)
+
+    if _isa_at_validation_level(czekitout.isa.real_numpy_matrix, obj):
         result = obj
+        result_dtype = _result_dtype_of(obj, obj, dtype_policy)
     else:
         try:
-            intermediate_conversion_of_obj = np.array(obj)
+            args = (obj, numpy_order, dtype_policy)
+            intermediate_conversion_of_obj = \
+                _real_intermediate_conversion_of(*args)
             kwargs = {"obj": intermediate_conversion_of_obj,
                       "obj_name": obj_name}
             czekitout.check.if_real_numpy_matrix(**kwargs)
-            result = np.array(intermediate_conversion_of_obj, dtype=float)
+            args = (intermediate_conversion_of_obj, obj, dtype_policy)
+            result_dtype = _result_dtype_of(*args)
+            result = intermediate_conversion_of_obj
         except:
-            err_msg = _to_real_numpy_matrix_err_msg_1.format(obj_name)
-            raise TypeError(err_msg)
+            err_msg_args = (_to_real_numpy_matrix_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, result_dtype, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_real_numpy_array_3d(obj, obj_name):
+def to_real_numpy_array_3d(obj,
+                           obj_name,
+                           dtype_policy=None,
+                           copy=None,
+                           readonly=False,
+                           order="any",
+                           align=None,
+                           out=None,
+                           preserve_mask=False):
     r"""Convert input object to a real-valued 3D numpy array.
 
     If the input object is not a real-valued 3D matrix, then a `TypeError`
@@ -1747,31 +2535,117 @@ def to_real_numpy_array_3d(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    dtype_policy : `None` | `str`, optional
+        The dtype policy that determines the dtype of the result, i.e. one of
+        ``"preserve"``, ``"float64"``, ``"float32"``, or
+        ``"minimal_lossless"``. See the summary documentation of the module
+        :mod:`czekitout.config` for a description of the dtype policies. If
+        ``dtype_policy`` is set to ``None``, then the dtype policy of the
+        current context is used.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``obj`` is already a valid
+        numpy array of the dtype determined by the dtype policy, then ``result``
+        is ``obj`` itself, unless a copy or a read-only view is requested, or
+        ``obj`` does not have the required memory layout. If ``out`` is not set
+        to ``None``, then ``result`` is ``out``.
 
     """
-    if czekitout.isa.real_numpy_array_3d(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+    dtype_policy = _check_and_convert_dtype_policy(dtype_policy)
+
+    if _isa_at_validation_level(czekitout.isa.real_numpy_array_3d, obj):
         result = obj
+        result_dtype = _result_dtype_of(obj, obj, dtype_policy)
     else:
         try:
-            intermediate_conversion_of_obj = np.array(obj)
+            args = (obj, numpy_order, dtype_policy)
+            intermediate_conversion_of_obj = \
+                _real_intermediate_conversion_of(*args)
             kwargs = {"obj": intermediate_conversion_of_obj,
                       "obj_name": obj_name}
             czekitout.check.if_real_numpy_array_3d(**kwargs)
-            result = np.array(intermediate_conversion_of_obj, dtype=float)
+            args = (intermediate_conversion_of_obj, obj, dtype_policy)
+            result_dtype = _result_dtype_of(*args)
+            result = intermediate_conversion_of_obj
         except:
-            err_msg = _to_real_numpy_array_3d_err_msg_1.format(obj_name)
-            raise TypeError(err_msg)
+            err_msg_args = (_to_real_numpy_array_3d_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, result_dtype, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_nonnegative_numpy_array(obj, obj_name):
+def to_nonnegative_numpy_array(obj,
+                               obj_name,
+                               dtype_policy=None,
+                               copy=None,
+                               readonly=False,
+                               order="any",
+                               align=None,
+                               out=None,
+                               preserve_mask=False):
     r"""Convert input object to a nonnegative numpy array.
 
     If the input object is not a nonnegative array, then an exception is raised
@@ -1790,38 +2664,125 @@ def to_nonnegative_numpy_array(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    dtype_policy : `None` | `str`, optional
+        The dtype policy that determines the dtype of the result, i.e. one of
+        ``"preserve"``, ``"float64"``, ``"float32"``, or
+        ``"minimal_lossless"``. See the summary documentation of the module
+        :mod:`czekitout.config` for a description of the dtype policies. If
+        ``dtype_policy`` is set to ``None``, then the dtype policy of the
+        current context is used.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``obj`` is already a valid
+        numpy array of the dtype determined by the dtype policy, then ``result``
+        is ``obj`` itself, unless a copy or a read-only view is requested, or
+        ``obj`` does not have the required memory layout. If ``out`` is not set
+        to ``None``, then ``result`` is ``out``.
 
     """
-    if czekitout.isa.nonnegative_numpy_array(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+    dtype_policy = _check_and_convert_dtype_policy(dtype_policy)
+
+    if _isa_at_validation_level(czekitout.isa.nonnegative_numpy_array, obj):
         result = obj
+        result_dtype = _result_dtype_of(obj, obj, dtype_policy)
     else:
-        err_msg = _to_nonnegative_numpy_array_err_msg_1.format(obj_name)
-
         try:
-            intermediate_conversion_of_obj = np.array(obj)
+            args = (obj, numpy_order, dtype_policy)
+            intermediate_conversion_of_obj = \
+                _real_intermediate_conversion_of(*args)
         except:
-            raise TypeError(err_msg)
+            err_msg_args = (_to_nonnegative_numpy_array_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
 
         try:
             kwargs = {"obj": intermediate_conversion_of_obj,
                       "obj_name": obj_name}
             czekitout.check.if_nonnegative_numpy_array(**kwargs)
-            result = np.array(intermediate_conversion_of_obj, dtype=float)
+            args = (intermediate_conversion_of_obj, obj, dtype_policy)
+            result_dtype = _result_dtype_of(*args)
+            result = intermediate_conversion_of_obj
         except ValueError:
-            raise ValueError(err_msg)
+            err_msg_args = (_to_nonnegative_numpy_array_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
         except BaseException:
-            raise TypeError(err_msg)
+            err_msg_args = (_to_nonnegative_numpy_array_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, result_dtype, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_nonnegative_numpy_matrix(obj, obj_name):
+def to_nonnegative_numpy_matrix(obj,
+                                obj_name,
+                                dtype_policy=None,
+                                copy=None,
+                                readonly=False,
+                                order="any",
+                                align=None,
+                                out=None,
+                                preserve_mask=False):
     r"""Convert input object to a nonnegative numpy matrix.
 
     If the input object is not a nonnegative matrix, then an exception is raised
@@ -1840,38 +2801,125 @@ def to_nonnegative_numpy_matrix(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    dtype_policy : `None` | `str`, optional
+        The dtype policy that determines the dtype of the result, i.e. one of
+        ``"preserve"``, ``"float64"``, ``"float32"``, or
+        ``"minimal_lossless"``. See the summary documentation of the module
+        :mod:`czekitout.config` for a description of the dtype policies. If
+        ``dtype_policy`` is set to ``None``, then the dtype policy of the
+        current context is used.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``obj`` is already a valid
+        numpy array of the dtype determined by the dtype policy, then ``result``
+        is ``obj`` itself, unless a copy or a read-only view is requested, or
+        ``obj`` does not have the required memory layout. If ``out`` is not set
+        to ``None``, then ``result`` is ``out``.
 
     """
-    if czekitout.isa.nonnegative_numpy_matrix(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+    dtype_policy = _check_and_convert_dtype_policy(dtype_policy)
+
+    if _isa_at_validation_level(czekitout.isa.nonnegative_numpy_matrix, obj):
         result = obj
+        result_dtype = _result_dtype_of(obj, obj, dtype_policy)
     else:
-        err_msg = _to_nonnegative_numpy_matrix_err_msg_1.format(obj_name)
-
         try:
-            intermediate_conversion_of_obj = np.array(obj)
+            args = (obj, numpy_order, dtype_policy)
+            intermediate_conversion_of_obj = \
+                _real_intermediate_conversion_of(*args)
         except:
-            raise TypeError(err_msg)
+            err_msg_args = (_to_nonnegative_numpy_matrix_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
         
         try:
             kwargs = {"obj": intermediate_conversion_of_obj,
                       "obj_name": obj_name}
             czekitout.check.if_nonnegative_numpy_matrix(**kwargs)
-            result = np.array(intermediate_conversion_of_obj, dtype=float)
+            args = (intermediate_conversion_of_obj, obj, dtype_policy)
+            result_dtype = _result_dtype_of(*args)
+            result = intermediate_conversion_of_obj
         except ValueError:
-            raise ValueError(err_msg)
+            err_msg_args = (_to_nonnegative_numpy_matrix_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
         except BaseException:
-            raise TypeError(err_msg)
+            err_msg_args = (_to_nonnegative_numpy_matrix_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, result_dtype, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_bool_numpy_matrix(obj, obj_name):
+def to_bool_numpy_matrix(obj,
+                         obj_name,
+                         copy=None,
+                         readonly=False,
+                         order="any",
+                         align=None,
+                         out=None,
+                         packed=False,
+                         preserve_mask=False):
     r"""Convert input object to a boolean 2D numpy array.
 
     If the input object is not a boolean 2D matrix, then a `TypeError` exception
@@ -1887,24 +2935,120 @@ def to_bool_numpy_matrix(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    packed : `bool`, optional
+        If ``packed`` is set to ``True``, then the result is packed with eight
+        elements per byte along its last axis, and returned as an instance of
+        the class :class:`czekitout.packed.PackedBoolArray`. The packed result
+        is written directly, such that, if ``obj`` is not already a boolean
+        numpy array, then at most one slice of ``obj`` along its first axis is
+        held unpacked in memory at a time. In this case, the parameters
+        ``copy``, ``readonly``, ``order``, ``align``, and ``out`` apply to the
+        packed data, e.g. ``out`` must be a numpy array of the shape of the
+        packed data, and since the packed data never shares memory with
+        ``obj``, ``copy`` must not be set to ``False``. Moreover,
+        ``preserve_mask`` must not be set to ``True``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`czekitout.packed.PackedBoolArray`
+        The object resulting from the conversion. If ``out`` is not set to
+        ``None``, then ``result`` is ``out``, or the packed array wrapping
+        ``out`` if ``packed`` is set to ``True``.
 
     """
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+
+    packed = to_bool(packed, "packed")
+
     if czekitout.isa.bool_numpy_matrix(obj):
         result = obj
     else:
-        czekitout.check.if_bool_matrix(obj, obj_name)
-        result = np.array(obj, dtype=bool)
+        view = _zero_copy_view_of(obj)
+        if (view is not None) and czekitout.isa.bool_numpy_matrix(view):
+            result = view
+        else:
+            source = obj if (view is None) else view
+            czekitout.check.if_bool_matrix(source, obj_name)
+            result = (source
+                      if packed
+                      else np.array(source, dtype=bool, order=numpy_order))
+
+    if packed:
+        args = (result, obj, obj_name, memory_settings)
+        result = _packed_bool_conversion_of(*args)
+    else:
+        args = (result, obj, obj_name, None, memory_settings)
+        result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_bool_numpy_array_3d(obj, obj_name):
+def to_bool_numpy_array_3d(obj,
+                           obj_name,
+                           copy=None,
+                           readonly=False,
+                           order="any",
+                           align=None,
+                           out=None,
+                           packed=False,
+                           preserve_mask=False):
     r"""Convert input object to a boolean 3D numpy array.
 
     If the input object is not a boolean 3D matrix, then a `TypeError` exception
@@ -1920,24 +3064,195 @@ def to_bool_numpy_array_3d(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    packed : `bool`, optional
+        If ``packed`` is set to ``True``, then the result is packed with eight
+        elements per byte along its last axis, and returned as an instance of
+        the class :class:`czekitout.packed.PackedBoolArray`. The packed result
+        is written directly, such that, if ``obj`` is not already a boolean
+        numpy array, then at most one slice of ``obj`` along its first axis is
+        held unpacked in memory at a time. In this case, the parameters
+        ``copy``, ``readonly``, ``order``, ``align``, and ``out`` apply to the
+        packed data, e.g. ``out`` must be a numpy array of the shape of the
+        packed data, and since the packed data never shares memory with
+        ``obj``, ``copy`` must not be set to ``False``. Moreover,
+        ``preserve_mask`` must not be set to ``True``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`czekitout.packed.PackedBoolArray`
+        The object resulting from the conversion. If ``out`` is not set to
+        ``None``, then ``result`` is ``out``, or the packed array wrapping
+        ``out`` if ``packed`` is set to ``True``.
 
     """
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+
+    packed = to_bool(packed, "packed")
+
     if czekitout.isa.bool_numpy_array_3d(obj):
         result = obj
     else:
-        czekitout.check.if_bool_array_3d(obj, obj_name)
-        result = np.array(obj, dtype=bool)
+        view = _zero_copy_view_of(obj)
+        if (view is not None) and czekitout.isa.bool_numpy_array_3d(view):
+            result = view
+        else:
+            source = obj if (view is None) else view
+            czekitout.check.if_bool_array_3d(source, obj_name)
+            result = (source
+                      if packed
+                      else np.array(source, dtype=bool, order=numpy_order))
+
+    if packed:
+        args = (result, obj, obj_name, memory_settings)
+        result = _packed_bool_conversion_of(*args)
+    else:
+        args = (result, obj, obj_name, None, memory_settings)
+        result = _finalize_conversion(*args)
+
+    return result
+
+
+
+def _packed_bool_conversion_of(bool_array_or_seq,
+                               obj,
+                               obj_name,
+                               memory_settings):
+    # ``bool_array_or_seq`` is either a validated boolean numpy array, or a
+    # validated sequence, which is packed slice by slice along its first axis,
+    # such that it is never converted to an unpacked array in its entirety.
+    if memory_settings["preserve_mask"]:
+        err_msg_args = (_packed_bool_conversion_of_err_msg_1,)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    if (isinstance(bool_array_or_seq, np.ndarray)
+        and (bool_array_or_seq.dtype == bool)):
+        shape = bool_array_or_seq.shape
+        packed_data = np.packbits(bool_array_or_seq, axis=-1)
+    else:
+        shape, packed_data = _shape_and_packed_data_of_seq(bool_array_or_seq,
+                                                           obj_name)
+
+    args = (packed_data, obj, obj_name, None, memory_settings)
+    packed_data = _finalize_conversion(*args)
+
+    result = czekitout.packed.PackedBoolArray(packed_data, shape)
 
     return result
 
 
 
-def to_complex_numpy_array(obj, obj_name):
+def _shape_and_packed_data_of_seq(seq, obj_name):
+    packed_data = None
+    slice_shape = None
+
+    for slice_idx, elem_of_seq in enumerate(seq):
+        try:
+            bool_slice = np.asarray(elem_of_seq, dtype=bool)
+        except:
+            err_msg_args = (_shape_and_packed_data_of_seq_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        if packed_data is None:
+            slice_shape = bool_slice.shape
+            packed_slice_shape = (slice_shape[:-1]
+                                  + (-(-slice_shape[-1]//8),))
+            packed_data = np.empty((len(seq),)+packed_slice_shape, np.uint8)
+
+        if bool_slice.shape != slice_shape:
+            err_msg_args = (_shape_and_packed_data_of_seq_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        packed_data[slice_idx] = np.packbits(bool_slice, axis=-1)
+
+    if packed_data is None:
+        shape = (0,)
+        packed_data = np.zeros((0,), np.uint8)
+    else:
+        shape = (len(seq),) + slice_shape
+
+    return shape, packed_data
+
+
+
+def _check_and_convert_complex_dtype(dtype):
+    if dtype is not None:
+        try:
+            dtype = np.dtype(dtype)
+            if dtype not in (np.complex128, np.complex64):
+                raise
+        except:
+            err_msg_args = (_check_and_convert_complex_dtype_err_msg_1,)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    return dtype
+
+
+
+def to_complex_numpy_array(obj,
+                           obj_name,
+                           dtype=None,
+                           copy=None,
+                           readonly=False,
+                           order="any",
+                           align=None,
+                           out=None,
+                           preserve_mask=False):
     r"""Convert input object to a complex-valued numpy array.
 
     If the input object is not a complex-valued array, then a `TypeError`
@@ -1953,29 +3268,117 @@ def to_complex_numpy_array(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    dtype : `None` | `numpy.dtype`-like, optional
+        The dtype of the result, which must be either ``numpy.complex128`` or
+        ``numpy.complex64``. If ``dtype`` is set to ``None``, then the dtype of
+        ``obj`` is preserved if ``obj`` is already a valid complex-valued numpy
+        array, otherwise the dtype of the result is ``numpy.complex128``. Since
+        ``numpy.complex64`` elements occupy half the memory of
+        ``numpy.complex128`` elements, setting ``dtype`` to ``numpy.complex64``
+        halves the memory occupied by the result, at the cost of precision.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``obj`` is already a valid
+        complex-valued numpy array of the requested dtype, then ``result`` is
+        ``obj`` itself, unless a copy or a read-only view is requested, or
+        ``obj`` does not have the required memory layout. Otherwise, ``result``
+        is validated in place, and is allocated only once, unless the required
+        alignment is not satisfied by the conversion. If ``out`` is not set to
+        ``None``, then ``result`` is ``out``.
 
     """
-    if czekitout.isa.complex_numpy_array(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+    dtype = _check_and_convert_complex_dtype(dtype)
+
+    if (_isa_at_validation_level(czekitout.isa.complex_numpy_array, obj)
+        and ((dtype is None) or (obj.dtype == dtype))):
         result = obj
     else:
         try:
-            result = np.array(obj, dtype=complex)
+            result_dtype = np.complex128 if (dtype is None) else dtype
+            view = _zero_copy_view_of(obj)
+            source = obj if (view is None) else view
+            result = np.asarray(source, result_dtype, numpy_order)
             kwargs = {"obj": result, "obj_name": obj_name}
             czekitout.check.if_complex_numpy_array(**kwargs)
         except:
-            err_msg = _to_complex_numpy_array_err_msg_1.format(obj_name)
-            raise TypeError(err_msg)
+            err_msg_args = (_to_complex_numpy_array_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, None, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
 
 
-def to_complex_numpy_matrix(obj, obj_name):
+def to_complex_numpy_matrix(obj,
+                            obj_name,
+                            dtype=None,
+                            copy=None,
+                            readonly=False,
+                            order="any",
+                            align=None,
+                            out=None,
+                            preserve_mask=False):
     r"""Convert input object to a complex-valued numpy array.
 
     If the input object is not a complex-valued matrix, then a `TypeError`
@@ -1991,23 +3394,103 @@ def to_complex_numpy_matrix(obj, obj_name):
         Input object.
     obj_name : `str`
         Name of the input object.
+    dtype : `None` | `numpy.dtype`-like, optional
+        The dtype of the result, which must be either ``numpy.complex128`` or
+        ``numpy.complex64``. If ``dtype`` is set to ``None``, then the dtype of
+        ``obj`` is preserved if ``obj`` is already a valid complex-valued numpy
+        array, otherwise the dtype of the result is ``numpy.complex128``. Since
+        ``numpy.complex64`` elements occupy half the memory of
+        ``numpy.complex128`` elements, setting ``dtype`` to ``numpy.complex64``
+        halves the memory occupied by the result, at the cost of precision.
+    copy : `None` | `bool`, optional
+        Determines whether the result is a copy of ``obj``, mirroring the
+        semantics of the parameter ``copy`` of the function
+        :func:`numpy.asarray` in numpy 2. If ``copy`` is set to ``True``, then
+        the result never shares memory with ``obj``. If ``copy`` is set to
+        ``None``, then ``obj`` is copied only if the conversion requires it.
+        If ``copy`` is set to ``False``, then ``obj`` is never copied, and a
+        `ValueError` exception is raised if the conversion cannot be performed
+        without copying.
+    readonly : `bool`, optional
+        If ``readonly`` is set to ``True``, and the result would otherwise share
+        memory with ``obj``, e.g. if ``obj`` is passed through as is, then a
+        read-only view of ``obj`` is returned instead, such that the result can
+        be handed out without a defensive copy. Results that do not share memory
+        with ``obj`` are writeable regardless.
+    order : ``"any"`` | ``"C"`` | ``"F"``, optional
+        The required memory layout of the result. If ``order`` is set to
+        ``"C"`` or ``"F"``, then the result is C-contiguous or
+        Fortran-contiguous respectively. If ``order`` is set to ``"any"``, then
+        no memory layout is required.
+    align : `None` | `int`, optional
+        If ``align`` is not set to ``None``, then it must be a positive power of
+        two, in which case the data of the result starts at a memory address
+        that is a multiple of ``align`` bytes, e.g. ``64`` for cache-line or
+        AVX-512 alignment. If ``obj`` already satisfies the required dtype,
+        memory layout, and alignment, then no copy is made. Otherwise, the
+        result is produced in a single allocation.
+    out : `None` | :class:`numpy.ndarray`, optional
+        If ``out`` is not set to ``None``, then the converted data is written
+        into ``out``, which is then returned, such that repeatedly converting
+        valid numpy arrays into the same buffer allocates no new arrays. In
+        this case, ``out`` must be a writeable numpy array of the same shape as
+        the result, whose memory layout satisfies ``order`` and ``align``, and
+        to whose dtype the converted data can be cast according to the
+        ``"same_kind"`` casting rule. The dtype of ``out`` takes precedence over
+        any other dtype specification, and ``copy`` must not be set to
+        ``False``.
+    preserve_mask : `bool`, optional
+        If ``obj`` is a masked array, i.e. an instance of the class
+        :class:`numpy.ma.MaskedArray`, and ``preserve_mask`` is set to
+        ``True``, then only its unmasked elements are validated, without
+        filling in the masked elements of a copy of ``obj``, and its masked
+        elements are converted as is. In this case, the result is a masked
+        array with the mask of ``obj``, whose data is the array that would
+        otherwise be returned, e.g. ``out``. The mask is copied if and only if
+        ``copy`` is set to ``True``. Otherwise, the mask of ``obj`` is
+        discarded, hence all of the elements of ``obj``, masked or not, are
+        validated, and the result is a regular numpy array.
 
     Returns
     -------
-    result : :class:`numpy.ndarray`
-        The object resulting from the conversion.
+    result : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        The object resulting from the conversion. If ``obj`` is already a valid
+        complex-valued numpy array of the requested dtype, then ``result`` is
+        ``obj`` itself, unless a copy or a read-only view is requested, or
+        ``obj`` does not have the required memory layout. Otherwise, ``result``
+        is validated in place, and is allocated only once, unless the required
+        alignment is not satisfied by the conversion. If ``out`` is not set to
+        ``None``, then ``result`` is ``out``.
 
     """
-    if czekitout.isa.complex_numpy_matrix(obj):
+    kwargs = {"copy": copy,
+              "readonly": readonly,
+              "order": order,
+              "align": align,
+              "out": out,
+              "preserve_mask": preserve_mask}
+    memory_settings = _check_and_convert_memory_settings(**kwargs)
+    obj = _unmasked_unless_mask_is_preserved(obj, memory_settings)
+    numpy_order = memory_settings["numpy_order"]
+    dtype = _check_and_convert_complex_dtype(dtype)
+
+    if (_isa_at_validation_level(czekitout.isa.complex_numpy_matrix, obj)
+        and ((dtype is None) or (obj.dtype == dtype))):
         result = obj
     else:
         try:
-            result = np.array(obj, dtype=complex)
+            result_dtype = np.complex128 if (dtype is None) else dtype
+            view = _zero_copy_view_of(obj)
+            source = obj if (view is None) else view
+            result = np.asarray(source, result_dtype, numpy_order)
             kwargs = {"obj": result, "obj_name": obj_name}
             czekitout.check.if_complex_numpy_matrix(result, obj_name)
         except:
-            err_msg = _to_complex_numpy_matrix_err_msg_1.format(obj_name)
-            raise TypeError(err_msg)
+            err_msg_args = (_to_complex_numpy_matrix_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    args = (result, obj, obj_name, None, memory_settings)
+    result = _finalize_conversion(*args)
 
     return result
 
@@ -2041,8 +3524,42 @@ _to_nonnegative_numpy_array_err_msg_1 = \
 _to_nonnegative_numpy_matrix_err_msg_1 = \
     ("The object ``{}`` must be a nonnegative matrix.")
 
+_check_and_convert_complex_dtype_err_msg_1 = \
+    ("The object ``dtype`` must be either ``None``, ``numpy.complex128``, or "
+     "``numpy.complex64``.")
+
 _to_complex_numpy_array_err_msg_1 = \
     ("The object ``{}`` must be a complex-valued array.")
 
 _to_complex_numpy_matrix_err_msg_1 = \
     ("The object ``{}`` must be a complex-valued matrix.")
+
+_check_and_convert_memory_settings_err_msg_1 = \
+    ("The object ``align`` must be a positive power of two.")
+
+_check_and_convert_memory_settings_err_msg_2 = \
+    ("The object ``out`` must be either set to ``None`` or a numpy array.")
+
+_check_and_convert_memory_settings_err_msg_3 = \
+    ("The object ``out`` must be a writeable numpy array, whose memory layout "
+     "satisfies ``order`` and ``align``.")
+
+_finalize_conversion_err_msg_1 = \
+    ("The object ``{}`` cannot be converted without being copied, which is "
+     "required since ``copy`` is set to ``False``.")
+
+_write_conversion_to_out_err_msg_1 = \
+    ("The object ``{}`` was converted to an array of shape {}, which does not "
+     "match the shape {} of the object ``out``.")
+
+_packed_bool_conversion_of_err_msg_1 = \
+    ("The objects ``packed`` and ``preserve_mask`` cannot both be set to "
+     "``True``.")
+
+_shape_and_packed_data_of_seq_err_msg_1 = \
+    ("The object ``{}`` must not be ragged, i.e. its slices along its first "
+     "axis must all be of the same shape.")
+
+_write_conversion_to_out_err_msg_2 = \
+    ("The object ``{}`` was converted to an array of dtype ``{}``, which "
+     "cannot be cast to the dtype ``{}`` of the object ``out``.")
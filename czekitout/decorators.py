@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains decorators that validate and convert the arguments of functions.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For wrapping functions.
+import functools
+
+# For inspecting the signatures of functions.
+import inspect
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For getting whether validation stripping is enabled.
+import czekitout.config
+
+# For validating objects.
+import czekitout.check
+
+# For resolving the specs of arguments.
+import czekitout.schema
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["validated"]
+
+
+
+# Flags indicating whether validation stripping is enabled, aliased such that
+# each flag can be read with a single attribute lookup.
+_validation_stripping_flags = czekitout.config._validation_stripping_flags
+
+_positional_param_kinds = (inspect.Parameter.POSITIONAL_ONLY,
+                           inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+
+def _compile_specs(func, specs):
+    params = inspect.signature(func).parameters
+    param_names = tuple(params.keys())
+
+    positional_specs = []
+    keyword_only_specs = []
+
+    for param_name, spec in specs.items():
+        spec_func = czekitout.schema._func_of_spec(spec, param_name)
+        is_check_func = (spec_func in czekitout.schema._check_funcs)
+        param_kind = getattr(params.get(param_name), "kind", None)
+
+        if param_kind in _positional_param_kinds:
+            param_idx = param_names.index(param_name)
+            compiled_spec = (param_idx, param_name, spec_func, is_check_func)
+            positional_specs.append(compiled_spec)
+        elif param_kind == inspect.Parameter.KEYWORD_ONLY:
+            compiled_spec = (param_name, spec_func, is_check_func)
+            keyword_only_specs.append(compiled_spec)
+        else:
+            err_msg_args = (_compile_specs_err_msg_1,
+                            param_name,
+                            func.__qualname__)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    positional_specs = tuple(sorted(positional_specs, key=lambda x: x[0]))
+    keyword_only_specs = tuple(keyword_only_specs)
+
+    return positional_specs, keyword_only_specs
+
+
+
+def _validate_and_convert_args(args,
+                               kwargs,
+                               positional_specs,
+                               keyword_only_specs):
+    num_args = len(args)
+    converted_args = None
+
+    for param_idx, param_name, spec_func, is_check_func in positional_specs:
+        if param_idx < num_args:
+            converted_arg = spec_func(args[param_idx], param_name)
+            if not is_check_func:
+                if converted_args is None:
+                    converted_args = list(args)
+                converted_args[param_idx] = converted_arg
+        elif param_name in kwargs:
+            converted_arg = spec_func(kwargs[param_name], param_name)
+            if not is_check_func:
+                kwargs[param_name] = converted_arg
+
+    if kwargs:
+        for param_name, spec_func, is_check_func in keyword_only_specs:
+            if param_name in kwargs:
+                converted_arg = spec_func(kwargs[param_name], param_name)
+                if not is_check_func:
+                    kwargs[param_name] = converted_arg
+
+    if converted_args is not None:
+        args = converted_args
+
+    return args, kwargs
+
+
+
+def validated(**specs):
+    r"""Decorate a function such that its arguments are validated and converted
+    before each call.
+
+    Each keyword argument of the current function is the spec of the parameter
+    of the decorated function with the same name. Like the specs of
+    :class:`czekitout.schema.Schema` objects, each spec is either the name of a
+    ``czekitout.check.if_*`` or ``czekitout.convert.to_*`` function, e.g.
+    ``"to_positive_float"``, or a callable object of the form ``spec(obj,
+    obj_name)``. Before each call of the decorated function, each argument that
+    has a spec is replaced by ``spec(arg, param_name)``, where ``param_name`` is
+    the name of the corresponding parameter. If the spec is a
+    ``czekitout.check.if_*`` function, then the argument is validated but left
+    unconverted. Arguments that are not passed explicitly, i.e. whose default
+    values are used, are neither validated nor converted.
+
+    The signature of the decorated function is inspected, and the specs are
+    resolved and mapped to the positions of the parameters, only once upon
+    decoration. Arguments passed by position are then looked up directly by
+    index upon each call, without binding the arguments to the signature.
+
+    If validation stripping is enabled, then the decorated function skips all
+    validations and conversions, and simply calls the undecorated function. See
+    the summary documentation of the module :mod:`czekitout.config` for details.
+
+    If any spec does not correspond to a parameter of the decorated function
+    that can be passed by position or keyword, i.e. to a parameter that is not
+    of the form ``*args`` or ``**kwargs``, then a `ValueError` exception is
+    raised upon decoration.
+
+    Parameters
+    ----------
+    **specs
+        The specs of the parameters of the decorated function.
+
+    Returns
+    -------
+    decorator : callable
+        The decorator.
+
+    """
+    specs = czekitout.schema._check_and_convert_specs(specs)
+
+    def decorator(func):
+        czekitout.check.if_callable(func, "func")
+
+        positional_specs, keyword_only_specs = _compile_specs(func, specs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _validation_stripping_flags.is_enabled:
+                args, kwargs = _validate_and_convert_args(args,
+                                                          kwargs,
+                                                          positional_specs,
+                                                          keyword_only_specs)
+            result = func(*args, **kwargs)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_compile_specs_err_msg_1 = \
+    ("The spec for ``{}`` does not correspond to a parameter of the function "
+     "``{}`` that can be passed by position or keyword.")
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains the exception classes raised by ``czekitout`` when validations
+fail.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["ValidationError",
+           "ValidationTypeError",
+           "ValidationValueError",
+           "SchemaValidationError"]
+
+
+
+class ValidationError(Exception):
+    r"""The base class of the exceptions raised by ``czekitout`` when
+    validations fail.
+
+    Rather than storing a formatted error message, the exception stores an
+    unformatted error message along with the arguments with which to format
+    it. The formatted error message is only rendered when requested, e.g. upon
+    ``str(exception)``, and is subsequently cached. As such, raising and
+    catching the exception, without inspecting its message, does not require
+    any string formatting. Like for any other exception, the attribute ``args``
+    of the exception is a tuple containing only the formatted error message.
+    Setting said attribute, e.g. to add context to the error message before
+    reraising the exception, replaces the formatted error message with
+    ``str(Exception(*args))``, where ``args`` is the new value of said
+    attribute, as for any other exception.
+
+    If error aggregation is enabled, and the exception is raised by a function
+    that validates a sequence or array element by element, then the indices and
+    values of the invalid elements are attached to the exception, and are
+    reported at the end of its formatted error message. See the summary
+    documentation of the module :mod:`czekitout.config` for a description of
+    error aggregation.
+
+    Parameters
+    ----------
+    unformatted_err_msg : `str`
+        The unformatted error message, with a replacement field ``{}`` for each
+        positional argument in ``format_args``.
+    *format_args
+        The arguments with which to format ``unformatted_err_msg``.
+
+    Attributes
+    ----------
+    num_invalid_elems : `int` | `None`
+        The total number of invalid elements, if attached, otherwise ``None``.
+    invalid_elem_indices : `numpy.ndarray` (`int`, ndim=1) | `None`
+        The indices of the invalid elements, if attached, otherwise ``None``.
+        For sequences, these are the positions of the invalid elements in the
+        sequence. For numpy arrays, these are the flat indices of the invalid
+        elements. Only the indices of the first invalid elements are attached,
+        up to the maximum number returned by the function
+        :func:`czekitout.config.get_max_num_reported_invalid_elems`.
+    invalid_elems : `tuple` | `None`
+        The values of the invalid elements at the indices
+        ``invalid_elem_indices``, if attached, otherwise ``None``.
+
+    """
+    num_invalid_elems = None
+    invalid_elem_indices = None
+    invalid_elems = None
+
+
+
+    def __init__(self, unformatted_err_msg, *format_args):
+        super().__init__()
+
+        self._unformatted_err_msg = unformatted_err_msg
+        self._format_args = format_args
+        self._err_msg = None
+        self._args = None
+
+        return None
+
+
+
+    @property
+    def unformatted_err_msg(self):
+        r"""`str`: The unformatted error message.
+
+        """
+        result = self._unformatted_err_msg
+
+        return result
+
+
+
+    @property
+    def format_args(self):
+        r"""`tuple`: The arguments with which to format the error message.
+
+        """
+        result = self._format_args
+
+        return result
+
+
+
+    @property
+    def args(self):
+        r"""`tuple`: A tuple containing only the formatted error message,
+        unless set otherwise.
+
+        """
+        result = (str(self),) if (self._args is None) else self._args
+
+        return result
+
+
+
+    @args.setter
+    def args(self, args):
+        self._args = tuple(args)
+        self._err_msg = str(Exception(*self._args))
+
+        return None
+
+
+
+    def __repr__(self):
+        result = "{}({!r})".format(type(self).__name__, str(self))
+
+        return result
+
+
+
+    def __reduce__(self):
+        constructor_args = (self._unformatted_err_msg,) + self._format_args
+        result = (type(self), constructor_args, self.__dict__)
+
+        return result
+
+
+
+    def __str__(self):
+        if self._err_msg is None:
+            self._err_msg = \
+                self._unformatted_err_msg.format(*self._format_args)
+            if self.invalid_elem_indices is not None:
+                self._err_msg += " " + self._report_of_invalid_elems()
+        result = self._err_msg
+
+        return result
+
+
+
+    def _report_of_invalid_elems(self):
+        num_reported_invalid_elems = len(self.invalid_elem_indices)
+        invalid_elem_indices = self.invalid_elem_indices.tolist()
+        invalid_elems = list(self.invalid_elems)
+
+        if num_reported_invalid_elems == self.num_invalid_elems:
+            report = _validation_error_err_msg_1.format(invalid_elem_indices,
+                                                        invalid_elems)
+        else:
+            format_args = (self.num_invalid_elems,
+                           num_reported_invalid_elems,
+                           invalid_elem_indices,
+                           invalid_elems)
+            report = _validation_error_err_msg_2.format(*format_args)
+
+        return report
+
+
+
+class ValidationTypeError(ValidationError, TypeError):
+    r"""The exception raised by ``czekitout`` when an object is of an invalid
+    type.
+
+    See the documentation for the class
+    :class:`czekitout.errors.ValidationError` for a description of the
+    parameters.
+
+    """
+    pass
+
+
+
+class ValidationValueError(ValidationError, ValueError):
+    r"""The exception raised by ``czekitout`` when an object is of a valid type
+    but has an invalid value.
+
+    See the documentation for the class
+    :class:`czekitout.errors.ValidationError` for a description of the
+    parameters.
+
+    """
+    pass
+
+
+
+class SchemaValidationError(ValidationError, TypeError, ValueError):
+    r"""The exception raised by :class:`czekitout.schema.Schema` objects when
+    one or more entries of a dictionary-like object fail validation, and by
+    :class:`czekitout.schema.RecordSchema` objects when one or more fields of a
+    structured array fail validation.
+
+    Rather than stopping at the first entry that fails validation, said objects
+    validate every entry, and collect the exceptions raised along the way. The
+    formatted error message of the current exception is a report of the error
+    messages of all the collected exceptions. Since the collected exceptions can
+    be of the type `TypeError` or `ValueError`, the current exception is of both
+    types.
+
+    Parameters
+    ----------
+    unformatted_err_msg : `str`
+        The unformatted error message, with two replacement fields ``{}``: the
+        first for ``obj_name``, and the second for the report of the error
+        messages of the collected exceptions.
+    obj_name : `str`
+        The name of the dictionary-like object that failed validation.
+    errors : `dict`
+        The collected exceptions, where each dictionary key is the key of the
+        entry that failed validation, and the corresponding dictionary value is
+        the exception raised upon validating said entry.
+
+    """
+    def __init__(self, unformatted_err_msg, obj_name, errors):
+        super().__init__(unformatted_err_msg, obj_name, errors)
+
+        return None
+
+
+
+    @property
+    def errors(self):
+        r"""`dict`: The collected exceptions, keyed by the keys of the entries
+        that failed validation.
+
+        """
+        result = self._format_args[1]
+
+        return result
+
+
+
+    def __str__(self):
+        if self._err_msg is None:
+            unformatted_err_msg = self._unformatted_err_msg
+            obj_name, errors = self._format_args
+            report = "\n".join("    * {}".format(err)
+                               for err
+                               in errors.values())
+            self._err_msg = unformatted_err_msg.format(obj_name, report)
+        result = self._err_msg
+
+        return result
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_validation_error_err_msg_1 = \
+    ("The invalid elements are at the indices ``{}``, and are ``{}``.")
+_validation_error_err_msg_2 = \
+    ("There are {} invalid elements in total, the first {} of which are at the "
+     "indices ``{}``, and are ``{}``.")
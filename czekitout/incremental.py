@@ -0,0 +1,565 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains classes for validating numpy arrays incrementally, i.e. as they
+are filled.
+
+Functions like :func:`czekitout.check.if_real_numpy_array` validate an array in
+its entirety upon every call. Validating an array that is filled over time,
+e.g. a preallocated buffer into which measurements are appended, by calling
+such a function on the filled part of the array after each append, scans the
+first elements of the array over and over again, such that the total cost of
+validation grows quadratically with the number of appends. The class
+:class:`czekitout.incremental.GrowingArrayValidator` instead remembers how much
+of an array has already been validated, and scans only the elements appended
+since, such that the total cost of validation grows linearly with the size of
+the array.
+
+Likewise, functions like :func:`czekitout.convert.to_bool_numpy_array_3d`
+validate a stack of 2D frames, e.g. the images acquired by a detector, only once
+the entire stack is held in memory. The class
+:class:`czekitout.incremental.FrameStackValidator` instead validates the frames
+of a stack one at a time, as they arrive, and optionally writes each valid frame
+into a preallocated 3D array.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For general array handling.
+import numpy as np
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For getting the validation level.
+import czekitout.config
+
+# For type-checking objects.
+import czekitout.isa
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["GrowingArrayValidator",
+           "FrameStackValidator"]
+
+
+
+# Flags indicating the validation level of the current context.
+_validation_level_flags = czekitout.config._validation_level_flags
+
+# The names of the functions in the module ``czekitout.isa`` that validate the
+# elements of regions of arrays to be validated by the functions in the module
+# ``czekitout.check`` with the names of the keys. Said functions do not depend
+# on the shapes of the regions.
+_elem_isa_func_names_of_check_func_names = \
+    {"if_real_numpy_array": "real_numpy_array",
+     "if_real_numpy_array_1d": "real_numpy_array",
+     "if_real_numpy_matrix": "real_numpy_array",
+     "if_real_two_column_numpy_matrix": "real_numpy_array",
+     "if_real_numpy_array_3d": "real_numpy_array",
+     "if_nonnegative_numpy_array": "nonnegative_numpy_array",
+     "if_nonnegative_numpy_matrix": "nonnegative_numpy_array",
+     "if_complex_numpy_array": "complex_numpy_array",
+     "if_complex_numpy_matrix": "complex_numpy_array"}
+
+
+
+class GrowingArrayValidator():
+    r"""A validator of a numpy array that is filled along its first axis over
+    time.
+
+    A validator is bound to a numpy array, referred to as the buffer, of which
+    only the first elements along the first axis, i.e. the slice
+    ``buffer[:num_elems]`` for some ``num_elems``, are filled. Each call of the
+    method :meth:`czekitout.incremental.GrowingArrayValidator.check` validates
+    said slice like the function in the module :mod:`czekitout.check` with the
+    name ``check_func_name``. However, the validator remembers the largest
+    ``num_elems`` up to which the buffer has been validated, referred to as the
+    high-water mark, and scans only the elements beyond said mark. Hence, if the
+    buffer is appended to, and validated after each append, then each element
+    is scanned exactly once.
+
+    The metadata of the buffer, i.e. its dtype and number of dimensions, is
+    validated once, upon construction of the validator. The elements of the
+    buffer are scanned only if the current validation level is ``"full"``, and
+    the high-water mark is only raised by such scans. See the summary
+    documentation of the module :mod:`czekitout.config` for a description of the
+    validation levels.
+
+    The validator assumes that the elements below the high-water mark are not
+    modified after they are validated. If they are, e.g. because the buffer is
+    reused from the start, then the high-water mark should be lowered via the
+    method :meth:`czekitout.incremental.GrowingArrayValidator.reset`.
+
+    Parameters
+    ----------
+    buffer : :class:`numpy.ndarray`
+        The buffer, which must have at least one dimension.
+    obj_name : `str`
+        The name of the buffer.
+    check_func_name : `str`
+        The name of the function in the module :mod:`czekitout.check` against
+        which to validate the filled part of the buffer. Must be one of
+        ``"if_real_numpy_array"``, ``"if_real_numpy_array_1d"``,
+        ``"if_real_numpy_matrix"``, ``"if_real_two_column_numpy_matrix"``,
+        ``"if_real_numpy_array_3d"``, ``"if_nonnegative_numpy_array"``,
+        ``"if_nonnegative_numpy_matrix"``, ``"if_complex_numpy_array"``, or
+        ``"if_complex_numpy_matrix"``.
+
+    """
+    def __init__(self, buffer, obj_name, check_func_name):
+        czekitout.check._check_obj_name(obj_name)
+
+        accepted_strings = tuple(_elem_isa_func_names_of_check_func_names)
+        kwargs = {"obj": check_func_name,
+                  "obj_name": "check_func_name",
+                  "accepted_strings": accepted_strings}
+        czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+        elem_isa_func_name = \
+            _elem_isa_func_names_of_check_func_names[check_func_name]
+
+        self._obj_name = obj_name
+        self._check_func = getattr(czekitout.check, check_func_name)
+        self._elem_isa_func = getattr(czekitout.isa, elem_isa_func_name)
+        self._num_validated_elems = 0
+        self._buffer = self._check_buffer(buffer)
+
+        return None
+
+
+
+    def _check_buffer(self, buffer):
+        if (not isinstance(buffer, np.ndarray)) or (buffer.ndim == 0):
+            err_msg_args = (_growing_array_validator_err_msg_1, self._obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        # Validating an empty slice of the buffer validates the metadata of the
+        # buffer, without scanning any of its elements.
+        self._check_func(buffer[:0], self._obj_name)
+
+        return buffer
+
+
+
+    @property
+    def buffer(self):
+        r""":class:`numpy.ndarray`: The buffer.
+
+        """
+        result = self._buffer
+
+        return result
+
+
+
+    @property
+    def num_validated_elems(self):
+        r"""`int`: The high-water mark, i.e. the number of elements along the
+        first axis of the buffer that have been validated so far.
+
+        """
+        result = self._num_validated_elems
+
+        return result
+
+
+
+    def check(self, num_elems):
+        r"""Validate the first elements along the first axis of the buffer.
+
+        Only the elements from the high-water mark up to ``num_elems`` are
+        scanned. If any of said elements is invalid, then an exception is
+        raised that names the scanned region of the buffer, e.g. ``obj[5:8]``,
+        and the high-water mark is left unchanged. Otherwise, the high-water
+        mark is raised to ``num_elems``.
+
+        Parameters
+        ----------
+        num_elems : `int`
+            The number of elements along the first axis of the buffer that are
+            filled. Must be nonnegative, and no greater than the length of the
+            buffer.
+
+        Returns
+        -------
+        result : :class:`numpy.ndarray`
+            The filled part of the buffer, i.e. the view
+            ``buffer[:num_elems]``.
+
+        """
+        buffer = self._buffer
+        start = self._num_validated_elems
+
+        num_elems = self._check_and_convert_num_elems(num_elems)
+
+        if (num_elems > start) and _validation_level_flags.is_full:
+            region = buffer[start:num_elems]
+            if not self._elem_isa_func(region):
+                # The region is validated again, this time naming it, such that
+                # the exception raised identifies the region.
+                region_name = "{}[{}:{}]".format(self._obj_name,
+                                                 start,
+                                                 num_elems)
+                self._check_func(region, region_name)
+            self._num_validated_elems = num_elems
+
+        result = buffer[:num_elems]
+
+        return result
+
+
+
+    def _check_and_convert_num_elems(self, num_elems):
+        num_elems = czekitout.convert.to_nonnegative_int(num_elems,
+                                                         "num_elems")
+
+        if num_elems > len(self._buffer):
+            err_msg_args = (_growing_array_validator_err_msg_2,
+                            self._obj_name,
+                            len(self._buffer))
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        return num_elems
+
+
+
+    def reset(self, num_elems=0):
+        r"""Lower the high-water mark.
+
+        If the high-water mark is already less than or equal to ``num_elems``,
+        then it is left unchanged.
+
+        Parameters
+        ----------
+        num_elems : `int`, optional
+            The new high-water mark. Must be nonnegative, and no greater than
+            the length of the buffer.
+
+        """
+        num_elems = self._check_and_convert_num_elems(num_elems)
+        self._num_validated_elems = min(self._num_validated_elems, num_elems)
+
+        return None
+
+
+
+    def rebind(self, buffer):
+        r"""Bind the validator to another buffer.
+
+        This method is intended for buffers that are grown by reallocation, in
+        which case the filled part of the old buffer is copied into the new
+        buffer. The high-water mark is kept, hence the elements of the new
+        buffer below the high-water mark are assumed to be copies of the
+        validated elements of the old buffer. If the new buffer is shorter than
+        the high-water mark, then the mark is lowered to the length of the new
+        buffer.
+
+        Parameters
+        ----------
+        buffer : :class:`numpy.ndarray`
+            The new buffer, which must have at least one dimension.
+
+        """
+        self._buffer = self._check_buffer(buffer)
+        self._num_validated_elems = min(self._num_validated_elems, len(buffer))
+
+        return None
+
+
+
+class FrameStackValidator():
+    r"""A validator of the frames of a 3D stack, which are validated one at a
+    time.
+
+    A stack is a 3D array, the first axis of which indexes its frames, i.e. the
+    2D arrays ``stack[0]``, ``stack[1]``, etc. Each frame pushed onto the
+    validator, via the method
+    :meth:`czekitout.incremental.FrameStackValidator.push`, is converted via
+    the function in the module :mod:`czekitout.convert` with the name
+    ``frame_convert_func_name``, and is then checked to be consistent with the
+    shape and dtype declared for the frames of the stack. If a frame
+    fails validation, then the exception raised names the frame by its index in
+    the stack, e.g. ``obj[3]`` for the fourth frame of a stack named ``obj``,
+    and the frame is not counted as pushed, such that the next frame pushed
+    takes its index.
+
+    If the preallocated 3D array ``out`` is given, then each valid frame is
+    written into said array, at the index of the frame, without allocating any
+    intermediate array if the frame is already a valid numpy array. As such, the
+    full stack can be assembled without ever holding more than one frame in
+    memory besides ``out``.
+
+    Parameters
+    ----------
+    obj_name : `str`
+        The name of the stack.
+    frame_convert_func_name : `str`
+        The name of the function in the module :mod:`czekitout.convert` with
+        which to convert each frame. Must be one of ``"to_real_numpy_matrix"``,
+        ``"to_nonnegative_numpy_matrix"``, ``"to_bool_numpy_matrix"``, or
+        ``"to_complex_numpy_matrix"``.
+    frame_shape : `array_like` (`int`, shape=(``2``,)) | `None`, optional
+        The shape of each frame. If ``frame_shape`` is set to ``None``, then
+        the shape of the frames is given by ``out.shape[1:]`` if ``out`` is
+        given, otherwise by the shape of the first frame pushed.
+    dtype : `numpy.dtype` | `type` | `str` | `None`, optional
+        The dtype of the stack. The dtype of each converted frame must be
+        castable to ``dtype`` under the ``"same_kind"`` casting rule of numpy.
+        If ``dtype`` is set to ``None``, then the dtype of the stack is given by
+        ``out.dtype`` if ``out`` is given, otherwise by the dtype of the first
+        frame pushed.
+    out : :class:`numpy.ndarray` | `None`, optional
+        The preallocated, writable 3D array into which to write the valid
+        frames. If ``out`` is given, then ``frame_shape`` and ``dtype`` must be
+        either set to ``None``, or consistent with the shape and dtype of
+        ``out``, and at most ``len(out)`` frames can be pushed.
+
+    """
+    def __init__(self,
+                 obj_name,
+                 frame_convert_func_name,
+                 frame_shape=None,
+                 dtype=None,
+                 out=None):
+        czekitout.check._check_obj_name(obj_name)
+
+        kwargs = {"obj": frame_convert_func_name,
+                  "obj_name": "frame_convert_func_name",
+                  "accepted_strings": _accepted_frame_convert_func_names}
+        czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+        if frame_shape is not None:
+            func_alias = czekitout.convert.to_pair_of_nonnegative_ints
+            frame_shape = func_alias(frame_shape, "frame_shape")
+
+        if dtype is not None:
+            try:
+                dtype = np.dtype(dtype)
+            except:
+                err_msg_args = (_frame_stack_validator_err_msg_1,)
+                raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        if out is not None:
+            frame_shape, dtype = self._check_out(out, frame_shape, dtype)
+
+        self._obj_name = obj_name
+        self._frame_convert_func = getattr(czekitout.convert,
+                                           frame_convert_func_name)
+        self._frame_shape = frame_shape
+        self._dtype = dtype
+        self._out = out
+        self._num_frames = 0
+
+        return None
+
+
+
+    def _check_out(self, out, frame_shape, dtype):
+        if not czekitout.isa.numpy_array_3d(out):
+            err_msg_args = (_frame_stack_validator_err_msg_2,)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        if not out.flags.writeable:
+            err_msg_args = (_frame_stack_validator_err_msg_3,)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        if (((frame_shape is not None) and (frame_shape != out.shape[1:]))
+            or ((dtype is not None) and (dtype != out.dtype))):
+            err_msg_args = (_frame_stack_validator_err_msg_4,)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        frame_shape = out.shape[1:]
+        dtype = out.dtype
+
+        return frame_shape, dtype
+
+
+
+    @property
+    def num_frames(self):
+        r"""`int`: The number of frames that have been pushed successfully so
+        far.
+
+        """
+        result = self._num_frames
+
+        return result
+
+
+
+    @property
+    def frame_shape(self):
+        r"""`tuple` (`int`) | `None`: The shape of each frame, or ``None`` if it
+        has yet to be determined by the first frame pushed.
+
+        """
+        result = self._frame_shape
+
+        return result
+
+
+
+    @property
+    def dtype(self):
+        r"""`numpy.dtype` | `None`: The dtype of the stack, or ``None`` if it
+        has yet to be determined by the first frame pushed.
+
+        """
+        result = self._dtype
+
+        return result
+
+
+
+    @property
+    def stack(self):
+        r""":class:`numpy.ndarray` | `None`: The frames written so far, i.e. the
+        view ``out[:num_frames]``, if ``out`` was given, otherwise ``None``.
+
+        """
+        result = (None
+                  if (self._out is None)
+                  else self._out[:self._num_frames])
+
+        return result
+
+
+
+    def push(self, frame):
+        r"""Validate and convert the next frame of the stack.
+
+        Parameters
+        ----------
+        frame : `array_like`
+            The frame.
+
+        Returns
+        -------
+        result : :class:`numpy.ndarray`
+            The converted frame. If ``out`` was given, then ``result`` is the
+            view of ``out`` into which the frame was written.
+
+        """
+        frame_idx = self._num_frames
+        frame_name = "{}[{}]".format(self._obj_name, frame_idx)
+        out = self._out
+
+        if out is None:
+            result = self._frame_convert_func(frame, frame_name)
+            if not _validation_level_flags.is_off:
+                self._check_frame_shape_and_dtype(result, frame_name)
+        else:
+            if frame_idx == len(out):
+                err_msg_args = (_frame_stack_validator_err_msg_5,
+                                self._obj_name,
+                                len(out))
+                raise czekitout.errors.ValidationValueError(*err_msg_args)
+            result = self._frame_convert_func(frame,
+                                              frame_name,
+                                              out=out[frame_idx])
+
+        self._frame_shape = result.shape
+        self._dtype = result.dtype if (self._dtype is None) else self._dtype
+        self._num_frames += 1
+
+        return result
+
+
+
+    def _check_frame_shape_and_dtype(self, frame, frame_name):
+        frame_shape = self._frame_shape
+        dtype = self._dtype
+
+        if (frame_shape is not None) and (frame.shape != frame_shape):
+            err_msg_args = (_frame_stack_validator_err_msg_6,
+                            frame_name,
+                            str(frame.shape),
+                            str(frame_shape))
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        if ((dtype is not None)
+            and (not np.can_cast(frame.dtype, dtype, casting="same_kind"))):
+            err_msg_args = (_frame_stack_validator_err_msg_7,
+                            frame_name,
+                            str(frame.dtype),
+                            str(dtype))
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        return None
+
+
+
+# The names of the functions in the module ``czekitout.convert`` with which the
+# frames of stacks can be converted.
+_accepted_frame_convert_func_names = ("to_real_numpy_matrix",
+                                      "to_nonnegative_numpy_matrix",
+                                      "to_bool_numpy_matrix",
+                                      "to_complex_numpy_matrix")
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_growing_array_validator_err_msg_1 = \
+    ("The object ``{}`` must be a numpy array with at least one dimension.")
+
+_growing_array_validator_err_msg_2 = \
+    ("The object ``num_elems`` must be an integer no greater than the length "
+     "of the object ``{}``, which is {}.")
+
+_frame_stack_validator_err_msg_1 = \
+    ("The object ``dtype`` must be either set to ``None`` or an object that "
+     "can be converted to a numpy dtype.")
+
+_frame_stack_validator_err_msg_2 = \
+    ("The object ``out`` must be either set to ``None`` or a 3D numpy array.")
+
+_frame_stack_validator_err_msg_3 = \
+    ("The object ``out`` must be writable.")
+
+_frame_stack_validator_err_msg_4 = \
+    ("The objects ``frame_shape`` and ``dtype`` must each be either set to "
+     "``None`` or consistent with the shape and dtype of the object ``out`` "
+     "respectively.")
+
+_frame_stack_validator_err_msg_5 = \
+    ("The stack ``{}`` is full: the object ``out`` holds at most {} frames.")
+
+_frame_stack_validator_err_msg_6 = \
+    ("The object ``{}`` was converted to an array of shape {}, which does not "
+     "match the shape {} of the other frames of the stack.")
+
+_frame_stack_validator_err_msg_7 = \
+    ("The object ``{}`` was converted to an array of dtype ``{}``, which "
+     "cannot be cast to the dtype ``{}`` of the stack.")
@@ -0,0 +1,695 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains functions for loading and converting numpy arrays stored in
+``.npy`` files, and a class for loading and converting the numpy arrays stored
+in ``.npz`` archives lazily.
+
+Loading an array via :func:`numpy.load`, and then converting it via e.g.
+:func:`czekitout.convert.to_real_numpy_array_3d`, reads the entire file into
+memory, even if the array turns out to be invalid. Each function in the current
+module of the form ``<convert_func_name>_from_file``, e.g.
+:func:`czekitout.io.to_real_numpy_array_3d_from_file`, instead proceeds in three
+steps:
+
+1. Only the header of the ``.npy`` file is read, from which the shape and the
+   dtype of the stored array are validated. As such, an array of the wrong
+   dtype or number of dimensions is rejected in constant time, regardless of
+   the size of the file.
+2. If the validation level is ``"full"``, then the stored array is memory-mapped
+   by default, and its elements are validated chunk by chunk, e.g. scanned for
+   NaNs, such that at most one chunk is read into memory at a time.
+3. The stored array is converted via the function in the module
+   :mod:`czekitout.convert` with the name ``<convert_func_name>``, without
+   scanning its elements a second time.
+
+Since the arrays stored in ``.npy`` files are already numpy arrays, they must
+satisfy the requirements of the corresponding function in the module
+:mod:`czekitout.convert` as is, e.g. the array stored in a file loaded via the
+function :func:`czekitout.io.to_bool_numpy_matrix_from_file` must have a boolean
+dtype.
+
+The class :class:`czekitout.io.NpzArchive` wraps a ``.npz`` archive, and
+validates and converts each member array according to its spec, following the
+same steps, only upon accessing said member array by name.
+
+If the validation cache is enabled, as described in the summary documentation
+of the module :mod:`czekitout.config`, then each array stored in a file that
+passes the validation of step 2 is recorded in the validation cache, keyed on
+the absolute path of the file, the name of the member array if the file is a
+``.npz`` archive, and the name of the function in the module
+:mod:`czekitout.convert` against which the array was validated. Each record
+also stores the size, the modification time, the inode number, and the device
+number of the file at the start of said validation. Subsequently, as long as
+the file is unchanged, i.e. as long as a single ``stat`` of the file reproduces
+said record, steps 1 and 2 are skipped. Any change to the file, including
+replacing it with another file, invalidates its records. Since the validation
+cache is only an optimization, if it cannot be opened, e.g. because its path is
+not writable, then a `RuntimeWarning` is issued, and arrays are validated as if
+the validation cache were disabled.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For converting path-like objects to paths, and stat-ing files.
+import os
+
+# For storing the validation cache on disk.
+import sqlite3
+
+# For synchronizing access to the validation cache across threads.
+import threading
+
+# For warning that the validation cache could not be opened.
+import warnings
+
+# For reading the members of ``.npz`` archives.
+import zipfile
+
+# For defining the abstract base class of ``.npz`` archives.
+import collections.abc
+
+
+
+# For general array handling, and reading ``.npy`` headers.
+import numpy as np
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For getting and overriding the validation level.
+import czekitout.config
+
+# For type-checking objects.
+import czekitout.isa
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["to_real_two_column_numpy_matrix_from_file",
+           "to_numpy_array_from_file",
+           "to_real_numpy_array_from_file",
+           "to_real_numpy_array_1d_from_file",
+           "to_real_numpy_matrix_from_file",
+           "to_real_numpy_array_3d_from_file",
+           "to_nonnegative_numpy_array_from_file",
+           "to_nonnegative_numpy_matrix_from_file",
+           "to_bool_numpy_matrix_from_file",
+           "to_bool_numpy_array_3d_from_file",
+           "to_complex_numpy_array_from_file",
+           "to_complex_numpy_matrix_from_file",
+           "NpzArchive"]
+
+
+
+# The names of the functions in the module ``czekitout.isa`` that validate the
+# elements of chunks of arrays to be converted by the functions in the module
+# ``czekitout.convert`` with the names of the keys. Said functions do not
+# depend on the shapes of the chunks.
+_elem_isa_func_names_of_convert_func_names = \
+    {"to_real_two_column_numpy_matrix": "real_numpy_array",
+     "to_numpy_array": "numpy_array",
+     "to_real_numpy_array": "real_numpy_array",
+     "to_real_numpy_array_1d": "real_numpy_array",
+     "to_real_numpy_matrix": "real_numpy_array",
+     "to_real_numpy_array_3d": "real_numpy_array",
+     "to_nonnegative_numpy_array": "nonnegative_numpy_array",
+     "to_nonnegative_numpy_matrix": "nonnegative_numpy_array",
+     "to_bool_numpy_matrix": "bool_numpy_array",
+     "to_bool_numpy_array_3d": "bool_numpy_array",
+     "to_complex_numpy_array": "complex_numpy_array",
+     "to_complex_numpy_matrix": "complex_numpy_array"}
+
+# The maximum number of bytes per chunk of elements validated at a time.
+_max_num_bytes_per_chunk = 2**24
+
+
+
+class _ValidationCache():
+    def __init__(self, path):
+        sql_statement = ("CREATE TABLE IF NOT EXISTS validations "
+                         "(path TEXT, member TEXT, predicate TEXT, "
+                         "size INTEGER, mtime_ns INTEGER, inode INTEGER, "
+                         "device INTEGER, "
+                         "PRIMARY KEY (path, member, predicate))")
+
+        kwargs = {"database": path,
+                  "check_same_thread": False,
+                  "isolation_level": None}
+        self._connection = sqlite3.connect(**kwargs)
+
+        try:
+            self._connection.execute(sql_statement)
+        except:
+            self._connection.close()
+            raise
+
+        self._lock = threading.Lock()
+
+        return None
+
+
+
+    def has_entry(self, key, stamp):
+        sql_statement = ("SELECT size, mtime_ns, inode, device "
+                         "FROM validations "
+                         "WHERE path = ? AND member = ? AND predicate = ?")
+
+        # The validation cache is only an optimization, hence failing to read
+        # from it, e.g. because another process holds a lock on it, is treated
+        # as a cache miss.
+        with self._lock:
+            try:
+                cursor = self._connection.execute(sql_statement, key)
+                row = cursor.fetchone()
+            except:
+                row = None
+
+        result = (stamp is not None) and (row == stamp)
+
+        return result
+
+
+
+    def add_entry(self, key, stamp):
+        sql_statement = ("INSERT OR REPLACE INTO validations "
+                         "VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+        # Likewise, failing to write to the validation cache is not an error.
+        with self._lock:
+            try:
+                self._connection.execute(sql_statement, key+stamp)
+            except:
+                pass
+
+        return None
+
+
+
+# The validation caches that have been opened, keyed on their paths.
+_validation_caches = dict()
+_validation_caches_lock = threading.Lock()
+
+
+
+def _current_validation_cache():
+    path = czekitout.config.get_validation_cache_path()
+
+    if path is None:
+        validation_cache = None
+    else:
+        with _validation_caches_lock:
+            if path not in _validation_caches:
+                # The validation cache is only an optimization, hence failing
+                # to open it merely disables it, with a warning issued once
+                # per path.
+                try:
+                    _validation_caches[path] = _ValidationCache(path)
+                except:
+                    args = (_current_validation_cache_err_msg_1.format(path),
+                            RuntimeWarning)
+                    warnings.warn(*args)
+                    _validation_caches[path] = None
+            validation_cache = _validation_caches[path]
+
+    return validation_cache
+
+
+
+def _stamp_of(path):
+    try:
+        stat_result = os.stat(path)
+        stamp = (stat_result.st_size,
+                 stat_result.st_mtime_ns,
+                 stat_result.st_ino,
+                 stat_result.st_dev)
+    except:
+        stamp = None
+
+    return stamp
+
+
+
+def _check_and_convert_path(path):
+    try:
+        path = os.fspath(path)
+    except:
+        err_msg_args = (_check_and_convert_path_err_msg_1,)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    return path
+
+
+
+def _read_npy_header(file, obj_name):
+    try:
+        version = np.lib.format.read_magic(file)
+        read_header = (np.lib.format.read_array_header_1_0
+                       if (version == (1, 0))
+                       else np.lib.format.read_array_header_2_0)
+        shape, fortran_order, dtype = read_header(file)
+    except:
+        err_msg_args = (_read_npy_header_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+    return shape, fortran_order, dtype
+
+
+
+def _check_header(shape, dtype, convert_func_name, obj_name):
+    # The metadata of the stored array is validated against a stand-in array
+    # of the same shape and dtype, which occupies the memory of a single
+    # element.
+    stand_in = np.broadcast_to(np.zeros((), dtype=dtype), shape)
+    isa_func = getattr(czekitout.isa, convert_func_name[3:])
+
+    with czekitout.config.local_validation_level("fast"):
+        header_is_valid = \
+            czekitout.check._isa_at_validation_level(isa_func, stand_in)
+
+    if not header_is_valid:
+        err_msg_args = (_check_header_err_msg_1,
+                        obj_name,
+                        str(shape),
+                        str(dtype),
+                        convert_func_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    return None
+
+
+
+def _check_elems_chunk_by_chunk(array, convert_func_name, obj_name):
+    elem_isa_func_name = \
+        _elem_isa_func_names_of_convert_func_names[convert_func_name]
+    elem_isa_func = getattr(czekitout.isa, elem_isa_func_name)
+
+    # Chunks are taken along the axis along which the stored array is laid out
+    # contiguously, such that each chunk maps onto a contiguous range of the
+    # file.
+    axis = -1 if (array.flags.f_contiguous and (array.ndim > 1)) else 0
+    num_slices = array.shape[axis] if (array.ndim > 0) else 1
+    num_bytes_per_slice = max(array.nbytes // max(num_slices, 1), 1)
+    num_slices_per_chunk = max(_max_num_bytes_per_chunk//num_bytes_per_slice, 1)
+
+    for start in range(0, max(num_slices, 1), num_slices_per_chunk):
+        if array.ndim > 0:
+            chunk_slice = slice(start, start+num_slices_per_chunk)
+            chunk = array[(Ellipsis, chunk_slice) if axis else chunk_slice]
+        else:
+            chunk = array
+
+        if not elem_isa_func(chunk):
+            # The chunk is converted only for the exception that the conversion
+            # raises.
+            convert_func = getattr(czekitout.convert, convert_func_name)
+            convert_func(chunk, obj_name)
+
+    return None
+
+
+
+def _convert_checked_array(array, convert_func_name, obj_name, kwargs):
+    convert_func = getattr(czekitout.convert, convert_func_name)
+
+    if czekitout.config.get_validation_level() == "full":
+        # The elements have already been validated chunk by chunk, hence only
+        # the metadata of the array is validated again.
+        with czekitout.config.local_validation_level("fast"):
+            result = convert_func(array, obj_name, **kwargs)
+    else:
+        result = convert_func(array, obj_name, **kwargs)
+
+    return result
+
+
+
+def _load_and_convert(open_file,
+                      load_array,
+                      convert_func_name,
+                      obj_name,
+                      kwargs,
+                      file_path,
+                      member_name=""):
+    validation_level = czekitout.config.get_validation_level()
+    validation_cache = (_current_validation_cache()
+                        if (validation_level != "off")
+                        else None)
+
+    if validation_cache is not None:
+        # The file is stat-ed before it is validated, such that any change to
+        # the file during its validation invalidates the record below.
+        cache_key = (os.path.abspath(file_path), member_name, convert_func_name)
+        stamp = _stamp_of(file_path)
+        array_is_cached_as_valid = validation_cache.has_entry(cache_key, stamp)
+    else:
+        array_is_cached_as_valid = False
+
+    if (validation_level != "off") and (not array_is_cached_as_valid):
+        with open_file() as file:
+            shape, _, dtype = _read_npy_header(file, obj_name)
+        _check_header(shape, dtype, convert_func_name, obj_name)
+
+    array = load_array()
+
+    if array_is_cached_as_valid:
+        with czekitout.config.local_validation_level("fast"):
+            result = _convert_checked_array(array,
+                                            convert_func_name,
+                                            obj_name,
+                                            kwargs)
+    else:
+        if validation_level == "full":
+            _check_elems_chunk_by_chunk(array, convert_func_name, obj_name)
+            if (validation_cache is not None) and (stamp is not None):
+                validation_cache.add_entry(cache_key, stamp)
+        result = _convert_checked_array(array,
+                                        convert_func_name,
+                                        obj_name,
+                                        kwargs)
+
+    return result
+
+
+
+def _from_file_func_of(convert_func_name):
+    def from_file_func(path, mmap=True, **kwargs):
+        path = _check_and_convert_path(path)
+        mmap = czekitout.convert.to_bool(mmap, "mmap")
+
+        def open_file():
+            file = open(path, "rb")
+
+            return file
+
+        def load_array():
+            load_kwargs = {"file": path,
+                           "mmap_mode": "r" if mmap else None,
+                           "allow_pickle": False}
+            try:
+                array = np.load(**load_kwargs)
+            except:
+                err_msg_args = (_read_npy_header_err_msg_1, path)
+                raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+            return array
+
+        args = (open_file, load_array, convert_func_name, path, kwargs, path)
+        result = _load_and_convert(*args)
+
+        return result
+
+    format_args = (convert_func_name,)
+    from_file_func.__name__ = convert_func_name + "_from_file"
+    from_file_func.__qualname__ = from_file_func.__name__
+    from_file_func.__doc__ = _from_file_func_doc_template.format(*format_args)
+
+    return from_file_func
+
+
+
+_from_file_func_doc_template = \
+    (r"""Load and convert the numpy array stored in a ``.npy`` file.
+
+    This function validates and converts the numpy array stored in the
+    ``.npy`` file at ``path`` like the function
+    :func:`czekitout.convert.{0}`, rejecting arrays of the wrong dtype or
+    number of dimensions from the header of the file alone, and validating the
+    elements chunk by chunk. See the summary documentation of the module
+    :mod:`czekitout.io` for details. Exceptions raised name the array by
+    ``path``.
+
+    Parameters
+    ----------
+    path : `str` | path-like object
+        The path of the ``.npy`` file.
+    mmap : `bool`, optional
+        If ``mmap`` is set to ``True``, then the stored array is memory-mapped
+        read-only, rather than read into memory in its entirety.
+    **kwargs
+        The optional keyword arguments passed to the function
+        :func:`czekitout.convert.{0}`, e.g. ``copy``.
+
+    Returns
+    -------
+    result : :class:`numpy.ndarray`
+        The converted array. If ``mmap`` is set to ``True``, and no copy is
+        made by the conversion, then ``result`` is a read-only memory map of
+        the stored array.
+
+    """)
+
+
+
+to_real_two_column_numpy_matrix_from_file = \
+    _from_file_func_of("to_real_two_column_numpy_matrix")
+to_numpy_array_from_file = \
+    _from_file_func_of("to_numpy_array")
+to_real_numpy_array_from_file = \
+    _from_file_func_of("to_real_numpy_array")
+to_real_numpy_array_1d_from_file = \
+    _from_file_func_of("to_real_numpy_array_1d")
+to_real_numpy_matrix_from_file = \
+    _from_file_func_of("to_real_numpy_matrix")
+to_real_numpy_array_3d_from_file = \
+    _from_file_func_of("to_real_numpy_array_3d")
+to_nonnegative_numpy_array_from_file = \
+    _from_file_func_of("to_nonnegative_numpy_array")
+to_nonnegative_numpy_matrix_from_file = \
+    _from_file_func_of("to_nonnegative_numpy_matrix")
+to_bool_numpy_matrix_from_file = \
+    _from_file_func_of("to_bool_numpy_matrix")
+to_bool_numpy_array_3d_from_file = \
+    _from_file_func_of("to_bool_numpy_array_3d")
+to_complex_numpy_array_from_file = \
+    _from_file_func_of("to_complex_numpy_array")
+to_complex_numpy_matrix_from_file = \
+    _from_file_func_of("to_complex_numpy_matrix")
+
+
+
+class NpzArchive(collections.abc.Mapping):
+    r"""A ``.npz`` archive whose member arrays are validated and converted
+    lazily.
+
+    An archive maps the name of each of its member arrays, e.g. ``"image"`` for
+    the member file ``image.npy``, to said member array. No member array is
+    read upon constructing the archive. Instead, each member array is read,
+    validated, and converted only upon accessing it by name for the first time,
+    as described in the summary documentation of the module
+    :mod:`czekitout.io`. The converted member array is then cached, such that
+    subsequent accesses cost a dictionary lookup. Since the members of ``.npz``
+    archives cannot be memory-mapped, each member array is read into memory in
+    its entirety upon its first access, however member arrays of the wrong
+    dtype or number of dimensions are still rejected from their headers alone.
+
+    Archives can be used as context managers, which close the archive upon
+    exiting the ``with`` block.
+
+    Parameters
+    ----------
+    path : `str` | path-like object
+        The path of the ``.npz`` archive.
+    member_specs : `dict` | `None`, optional
+        The specs of the member arrays: each key is the name of a member array,
+        and the corresponding value is the name of the function in the module
+        :mod:`czekitout.convert` with which to convert said member array, e.g.
+        ``"to_real_numpy_matrix"``. Member arrays without a spec are loaded
+        without validation. If ``member_specs`` is set to ``None``, then no
+        member array has a spec.
+
+    """
+    def __init__(self, path, member_specs=None):
+        path = _check_and_convert_path(path)
+        member_specs = self._check_and_convert_member_specs(member_specs)
+
+        try:
+            self._zip_file = zipfile.ZipFile(path)
+        except:
+            err_msg_args = (_npz_archive_err_msg_1, path)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        self._path = path
+        self._member_specs = member_specs
+        self._member_names = tuple(file_name[:-4]
+                                   for file_name
+                                   in self._zip_file.namelist()
+                                   if file_name.endswith(".npy"))
+        self._member_arrays = dict()
+
+        return None
+
+
+
+    def _check_and_convert_member_specs(self, member_specs):
+        try:
+            member_specs = (dict()
+                            if (member_specs is None)
+                            else dict(member_specs))
+        except:
+            err_msg_args = (_npz_archive_err_msg_2,)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        accepted_strings = tuple(_elem_isa_func_names_of_convert_func_names)
+        for member_name, member_spec in member_specs.items():
+            obj_name = "member_specs[{}]".format(repr(member_name))
+            kwargs = {"obj": member_spec,
+                      "obj_name": obj_name,
+                      "accepted_strings": accepted_strings}
+            czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+        return member_specs
+
+
+
+    def __getitem__(self, member_name):
+        if member_name not in self._member_arrays:
+            if member_name not in self._member_names:
+                raise KeyError(member_name)
+            member_array = self._load_member_array(member_name)
+            self._member_arrays[member_name] = member_array
+
+        result = self._member_arrays[member_name]
+
+        return result
+
+
+
+    def _load_member_array(self, member_name):
+        obj_name = "{}[{}]".format(self._path, repr(member_name))
+        file_name = member_name + ".npy"
+
+        def open_file():
+            file = self._zip_file.open(file_name)
+
+            return file
+
+        def load_array():
+            with open_file() as file:
+                try:
+                    array = np.lib.format.read_array(file, allow_pickle=False)
+                except:
+                    err_msg_args = (_read_npy_header_err_msg_1, obj_name)
+                    raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+            return array
+
+        convert_func_name = self._member_specs.get(member_name, None)
+        if convert_func_name is None:
+            member_array = load_array()
+        else:
+            args = (open_file,
+                    load_array,
+                    convert_func_name,
+                    obj_name,
+                    dict(),
+                    self._path,
+                    member_name)
+            member_array = _load_and_convert(*args)
+
+        return member_array
+
+
+
+    def __contains__(self, member_name):
+        # Overrides the method of ``collections.abc.Mapping``, which would
+        # otherwise load the member array.
+        result = (member_name in self._member_names)
+
+        return result
+
+
+
+    def __iter__(self):
+        result = iter(self._member_names)
+
+        return result
+
+
+
+    def __len__(self):
+        result = len(self._member_names)
+
+        return result
+
+
+
+    def close(self):
+        r"""Close the archive.
+
+        Member arrays that have already been accessed remain available.
+
+        """
+        self._zip_file.close()
+
+        return None
+
+
+
+    def __enter__(self):
+        result = self
+
+        return result
+
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+        return None
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_check_and_convert_path_err_msg_1 = \
+    ("The object ``path`` must be a path-like object.")
+
+_read_npy_header_err_msg_1 = \
+    ("The object ``{}`` must be a readable ``.npy`` file, storing an array "
+     "that is not an object array.")
+
+_check_header_err_msg_1 = \
+    ("The array stored in ``{}``, of shape {} and dtype ``{}``, does not "
+     "satisfy the requirements of the function ``czekitout.convert.{}``.")
+
+_npz_archive_err_msg_1 = \
+    ("The object ``{}`` must be a readable ``.npz`` archive.")
+
+_npz_archive_err_msg_2 = \
+    ("The object ``member_specs`` must be either set to ``None`` or a "
+     "dictionary.")
+
+_current_validation_cache_err_msg_1 = \
+    ("The validation cache could not be opened at the path ``{}``, hence it is "
+     "disabled for said path: the path must be that of either a writable "
+     "SQLite database file, or a file that can be created.")
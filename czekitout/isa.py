@@ -52,6 +52,38 @@ __all__ = ["numpy_array",
 
 
 
+def _data_and_unmasked_elems_of(obj):
+    # Returns the data of the numpy array ``obj``, along with either a boolean
+    # array that is ``True`` at the unmasked elements of said data, if ``obj``
+    # is a masked array with a mask, or ``True`` otherwise. The latter can be
+    # passed as the ``where`` argument of reductions, such that only the
+    # unmasked elements are reduced, without filling in the masked elements of a
+    # copy of the data.
+    if isinstance(obj, np.ma.MaskedArray):
+        data = obj.data
+        mask = obj.mask
+        unmasked_elems = True if (mask is np.ma.nomask) else ~mask
+    else:
+        data = obj
+        unmasked_elems = True
+
+    return data, unmasked_elems
+
+
+
+def _min_of_unmasked_elems_and_zero(obj):
+    # The minimum of zero and the unmasked elements of the real-valued numpy
+    # array ``obj``, which is NaN if and only if any of said elements is NaN,
+    # and negative if and only if any of said elements is negative. Unlike
+    # ``np.isnan(obj).any()`` or ``(obj < 0).any()``, said reduction does not
+    # allocate a temporary array the size of ``obj``.
+    data, unmasked_elems = _data_and_unmasked_elems_of(obj)
+    result = np.min(data, where=unmasked_elems, initial=0)
+
+    return result
+
+
+
 def numpy_array(obj):
     r"""Returns ``True`` if input object is a numpy array.
 
@@ -79,6 +111,10 @@ def scalar_numpy_array(obj):
     We define a scalar as a number that is boolean, an integer, real-valued, or
     complex-valued.
 
+    ``obj`` is scanned for NaNs, and ``result`` is set to ``False`` if any are
+    found. If ``obj`` is a masked array, i.e. an instance of the class
+    :class:`numpy.ma.MaskedArray`, then only its unmasked elements are scanned.
+
     Parameters
     ----------
     obj : any type
@@ -93,14 +129,23 @@ def scalar_numpy_array(obj):
     """
     is_numpy_array = numpy_array  # Alias for readability.
     
-    if is_numpy_array(obj):
+    if not is_numpy_array(obj):
+        result = False
+    elif obj.dtype.kind in "biu":
+        result = True
+    elif obj.dtype.kind == "f":
+        result = not np.isnan(_min_of_unmasked_elems_and_zero(obj))
+    elif obj.dtype.kind == "c":
+        # Numeric arrays are scanned in place, rather than being copied to a
+        # complex-valued array first.
+        data, unmasked_elems = _data_and_unmasked_elems_of(obj)
+        result = not np.isnan(data).any(where=unmasked_elems)
+    else:
         try:
             obj.astype(complex)
             result = not np.any(np.isnan(obj))
         except:
             result = False
-    else:
-        result = False
 
     return result
 
@@ -135,6 +180,9 @@ def real_numpy_array(obj):
 def nonnegative_numpy_array(obj):
     r"""Returns ``True`` if input object is a nonnegative numpy array.
 
+    If ``obj`` is a masked array, i.e. an instance of the class
+    :class:`numpy.ma.MaskedArray`, then only its unmasked elements are scanned.
+
     Parameters
     ----------
     obj : any type
@@ -150,7 +198,7 @@ def nonnegative_numpy_array(obj):
     is_real_numpy_array = real_numpy_array  # Alias for readability.
     
     if is_real_numpy_array(obj):
-        result = bool(np.all(obj >= 0))
+        result = bool(_min_of_unmasked_elems_and_zero(obj) >= 0)
     else:
         result = False
 
@@ -11,8 +11,8 @@
 #
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
-r"""Contains a function that determines the fully-qualified class name of a 
-given object or class.
+r"""Contains functions that determine the fully-qualified class names of given
+objects or classes.
 
 """
 
@@ -22,6 +22,9 @@ given object or class.
 ## Load libraries/packages/modules ##
 #####################################
 
+# For caching fully qualified class names without keeping classes alive.
+import weakref
+
 
 
 ##################################
@@ -29,13 +32,23 @@ given object or class.
 ##################################
 
 # List of public objects in objects.
-__all__ = ["fully_qualified_class_name"]
+__all__ = ["fully_qualified_class_name",
+           "fully_qualified_class_names"]
+
+
+
+# Cache of fully qualified class names, keyed on the classes themselves.
+_fully_qualified_class_name_cache = weakref.WeakKeyDictionary()
 
 
 
 def fully_qualified_class_name(obj_or_cls):
     r"""Get fully qualified class name of given input object or class.
 
+    The name of each class is computed only once, after which it is stored in a
+    cache that holds weak references to the classes, i.e. the cache does not
+    prevent classes from being garbage collected.
+
     Parameters
     ----------
     obj_or_cls : any type
@@ -53,17 +66,54 @@ def fully_qualified_class_name(obj_or_cls):
         obj = obj_or_cls
         cls = obj.__class__
 
-    module = cls.__module__
+    try:
+        result = _fully_qualified_class_name_cache[cls]
+    except KeyError:
+        module = cls.__module__
 
-    if module == "builtins":
-        result = cls.__qualname__
-    else:
-        result = module + "." + cls.__qualname__
+        if module == "builtins":
+            result = cls.__qualname__
+        else:
+            result = module + "." + cls.__qualname__
+
+        _fully_qualified_class_name_cache[cls] = result
     
     return result
 
 
 
+def fully_qualified_class_names(objs_or_clss):
+    r"""Get fully qualified class names of given input objects or classes.
+
+    Parameters
+    ----------
+    objs_or_clss : `array_like` (any type, ndim=1)
+        Input objects or classes.
+
+    Returns
+    -------
+    result : `tuple` (`str`)
+        The fully qualified class names of the elements of ``objs_or_clss``, in
+        the same order as said elements.
+
+    """
+    fully_qualified_class_name_cache = _fully_qualified_class_name_cache
+    result = tuple()
+
+    for obj_or_cls in objs_or_clss:
+        cls = (obj_or_cls
+               if isinstance(obj_or_cls, type)
+               else obj_or_cls.__class__)
+        try:
+            name = fully_qualified_class_name_cache[cls]
+        except KeyError:
+            name = fully_qualified_class_name(cls)
+        result += (name,)
+
+    return result
+
+
+
 ###########################
 ## Define error messages ##
 ###########################
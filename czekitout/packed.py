@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains a class for storing boolean arrays with one bit per element.
+
+Boolean numpy arrays occupy one byte per element, e.g. a mask of shape
+``(1000, 2048, 2048)`` occupies 4 GB. The functions
+:func:`czekitout.convert.to_bool_numpy_matrix` and
+:func:`czekitout.convert.to_bool_numpy_array_3d` can instead return their
+results packed via :func:`numpy.packbits`, i.e. with eight elements per byte,
+wrapped in an instance of the class :class:`czekitout.packed.PackedBoolArray`,
+which occupies an eighth of the memory.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For general array handling.
+import numpy as np
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["PackedBoolArray"]
+
+
+
+class PackedBoolArray():
+    r"""A boolean array stored with one bit per element.
+
+    The elements are packed along the last axis of the array, as done by
+    :func:`numpy.packbits` with ``axis=-1`` and ``bitorder="big"``, such that
+    each row along the last axis, of length ``n``, is stored in ``ceil(n/8)``
+    bytes.
+
+    Indexing a packed array with integers and slices that leave the last axis
+    unindexed, e.g. ``packed_array[3]`` or ``packed_array[2:5, 10]``, returns
+    another packed array that is a view of the packed data, without unpacking
+    any element. Any other indexing, e.g. ``packed_array[3, 10, 7]``, unpacks
+    only the rows selected by the integers and slices indexing the leading
+    axes, if any, and returns the result of indexing said unpacked rows, as a
+    boolean numpy array or a numpy boolean scalar. The method
+    :meth:`czekitout.packed.PackedBoolArray.unpack` unpacks the entire array.
+    Packed arrays can also be passed to numpy functions, e.g.
+    :func:`numpy.asarray`, which unpack them.
+
+    Parameters
+    ----------
+    data : :class:`numpy.ndarray`
+        The packed data, i.e. a numpy array of the dtype ``numpy.uint8``, of
+        the shape ``shape[:-1] + (ceil(shape[-1]/8),)``.
+    shape : `tuple` (`int`)
+        The shape of the unpacked array, which must have at least one
+        dimension.
+
+    """
+    def __init__(self, data, shape):
+        try:
+            shape = tuple(int(dim) for dim in shape)
+            expected_data_shape = shape[:-1] + (-(-shape[-1]//8),)
+            data_is_valid = (isinstance(data, np.ndarray)
+                             and (data.dtype == np.uint8)
+                             and (data.shape == expected_data_shape)
+                             and (min(shape) >= 0))
+        except:
+            data_is_valid = False
+
+        if not data_is_valid:
+            err_msg_args = (_packed_bool_array_err_msg_1,)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        self._data = data
+        self._shape = shape
+
+        return None
+
+
+
+    @property
+    def data(self):
+        r""":class:`numpy.ndarray`: The packed data.
+
+        """
+        result = self._data
+
+        return result
+
+
+
+    @property
+    def shape(self):
+        r"""`tuple` (`int`): The shape of the unpacked array.
+
+        """
+        result = self._shape
+
+        return result
+
+
+
+    @property
+    def ndim(self):
+        r"""`int`: The number of dimensions of the unpacked array.
+
+        """
+        result = len(self._shape)
+
+        return result
+
+
+
+    @property
+    def size(self):
+        r"""`int`: The number of elements of the unpacked array.
+
+        """
+        result = int(np.prod(self._shape))
+
+        return result
+
+
+
+    @property
+    def dtype(self):
+        r"""`numpy.dtype`: The dtype of the unpacked array, i.e. ``bool``.
+
+        """
+        result = np.dtype(bool)
+
+        return result
+
+
+
+    @property
+    def nbytes(self):
+        r"""`int`: The number of bytes occupied by the packed data.
+
+        """
+        result = self._data.nbytes
+
+        return result
+
+
+
+    def __len__(self):
+        result = self._shape[0]
+
+        return result
+
+
+
+    def __repr__(self):
+        result = "{}(shape={})".format(type(self).__name__, self._shape)
+
+        return result
+
+
+
+    def unpack(self):
+        r"""Unpack the array.
+
+        Returns
+        -------
+        result : :class:`numpy.ndarray`
+            The unpacked boolean array.
+
+        """
+        result = self._unpacked_rows_of(self._data)
+
+        return result
+
+
+
+    def _unpacked_rows_of(self, data):
+        result = np.unpackbits(data, axis=-1, count=self._shape[-1]).view(bool)
+
+        return result
+
+
+
+    def __array__(self, dtype=None, copy=None):
+        if copy is False:
+            err_msg_args = (_packed_bool_array_err_msg_2,)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        result = self.unpack()
+        if dtype is not None:
+            result = result.astype(dtype, copy=False)
+
+        return result
+
+
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        ndim = self.ndim
+
+        key_is_basic = all(isinstance(elem_of_key, (int, np.integer, slice))
+                           for elem_of_key in key)
+
+        if key_is_basic and (len(key) < ndim):
+            data = self._data[key]
+            shape = data.shape[:-1] + self._shape[-1:]
+            result = type(self)(data, shape)
+        elif key_is_basic and (len(key) == ndim):
+            rows = self._unpacked_rows_of(self._data[key[:-1]])
+            result = rows[..., key[-1]]
+        else:
+            result = self.unpack()[key]
+
+        return result
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_packed_bool_array_err_msg_1 = \
+    ("The object ``data`` must be a numpy array of the dtype ``numpy.uint8``, "
+     "and of the shape ``shape[:-1] + (ceil(shape[-1]/8),)``, where the "
+     "object ``shape`` must be a nonempty sequence of nonnegative integers.")
+
+_packed_bool_array_err_msg_2 = \
+    ("A packed boolean array cannot be converted to a numpy array without "
+     "unpacking, i.e. copying, it.")
@@ -0,0 +1,474 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains a function for converting many objects to numpy arrays in
+parallel.
+
+Converting objects like nested lists and object arrays to numpy arrays is bound
+by the global interpreter lock, such that converting many such objects in
+threads does not speed things up. The function
+:func:`czekitout.parallel.convert` can instead fan the conversions out to a pool
+of processes. To avoid pickling the potentially large arrays involved, numpy
+arrays are passed to the worker processes, and the converted arrays are passed
+back, through shared memory blocks, as provided by the module
+:mod:`multiprocessing.shared_memory`. The converted arrays returned are views
+of said shared memory blocks, i.e. no copies are made upon returning them.
+Numpy arrays that need no conversion are returned as views of the shared memory
+blocks they were passed through, such that they are copied only once.
+
+Objects that are not numpy arrays, e.g. nested lists, and object arrays, cannot
+be passed through shared memory blocks, and are instead pickled, as are the
+results of converting object arrays. Pickling nested lists is itself bound by
+the global interpreter lock, and takes a sizable fraction of the time taken to
+convert them, hence converting nested lists in a pool of processes may well be
+slower than converting them serially, unless each conversion takes much longer
+than pickling its object.
+
+Since starting a pool of processes takes much longer than most conversions, the
+pool is started once, upon its first use, and reused thereafter. The settings
+of the current context, e.g. its dtype policy, are passed to the worker
+processes along with each object, such that the conversions in the worker
+processes are performed according to said settings.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For determining whether POSIX shared memory is used.
+import os
+
+# For running calls in pools of threads and processes.
+import concurrent.futures
+
+# For shutting down the reusable pool of processes upon exiting.
+import atexit
+
+# For running calls in pools of threads within copies of the current context.
+import contextvars
+
+# For passing arrays between processes without pickling them.
+import multiprocessing.shared_memory
+import multiprocessing.resource_tracker
+
+
+
+# For general array handling.
+import numpy as np
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+# For getting and setting the settings of the worker processes.
+import czekitout.config
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["convert"]
+
+
+
+_names_of_convert_funcs = ("to_real_two_column_numpy_matrix",
+                           "to_numpy_array",
+                           "to_real_numpy_array",
+                           "to_real_numpy_array_1d",
+                           "to_real_numpy_matrix",
+                           "to_real_numpy_array_3d",
+                           "to_nonnegative_numpy_array",
+                           "to_nonnegative_numpy_matrix",
+                           "to_bool_numpy_matrix",
+                           "to_bool_numpy_array_3d",
+                           "to_complex_numpy_array",
+                           "to_complex_numpy_matrix")
+
+_modes = ("serial", "thread", "process")
+
+# The pool of processes reused by the calls to the function ``convert`` in the
+# process-parallel mode, along with its maximum number of processes.
+_process_pool = None
+_max_workers_of_process_pool = None
+
+
+
+class _SharedArraySpec():
+    # The specification of a numpy array stored in a shared memory block, which
+    # is passed between processes instead of the array itself.
+    def __init__(self, block_name, shape, dtype):
+        self.block_name = block_name
+        self.shape = shape
+        self.dtype = dtype
+
+        return None
+
+
+
+class _SharedArrayOwner():
+    # The base object of a numpy array that views a shared memory block.
+    # Closing a shared memory block unmaps its memory, even if numpy arrays
+    # still view it, hence the block must stay open for as long as any such
+    # array is referenced. Since numpy arrays that view other arrays reference
+    # the base objects of the latter, the block, which is closed upon garbage
+    # collection, is kept open by referencing it from the base object.
+    def __init__(self, block, spec):
+        view = np.ndarray(spec.shape, spec.dtype, buffer=block.buf)
+
+        self.block = block
+        self.__array_interface__ = view.__array_interface__
+
+        return None
+
+
+
+def _share_array(array):
+    # Copies ``array`` into a new shared memory block, and returns the block,
+    # along with the specification of the shared copy.
+    kwargs = {"create": True, "size": max(array.nbytes, 1)}
+    block = multiprocessing.shared_memory.SharedMemory(**kwargs)
+    np.copyto(np.ndarray(array.shape, array.dtype, buffer=block.buf), array)
+    spec = _SharedArraySpec(block.name, array.shape, array.dtype)
+
+    return block, spec
+
+
+
+def _view_of_shared_array(spec, unlink):
+    block = multiprocessing.shared_memory.SharedMemory(name=spec.block_name)
+    if unlink:
+        block.unlink()
+    view = np.asarray(_SharedArrayOwner(block, spec))
+
+    return view
+
+
+
+def _is_shareable(obj):
+    result = (isinstance(obj, np.ndarray) and (not obj.dtype.hasobject))
+
+    return result
+
+
+
+def _current_settings():
+    # The settings of the current context, which are passed to the worker
+    # processes, since the latter may have been started before said settings
+    # were set, and do not share the context of the current thread in any case.
+    settings = {"validation_level": czekitout.config.get_validation_level(),
+                "error_aggregation": czekitout.config.get_error_aggregation(),
+                "dtype_policy": czekitout.config.get_dtype_policy(),
+                "max_num_reported_invalid_elems": \
+                czekitout.config.get_max_num_reported_invalid_elems()}
+
+    return settings
+
+
+
+def _convert_in_worker(convert_func_name, obj, obj_name, settings):
+    # The function run in the worker processes. Numpy arrays are received and
+    # returned as specifications of shared copies, unless they are object
+    # arrays, which cannot be shared. If the converted array is the received
+    # array itself, i.e. if no conversion was needed, then the specification
+    # of the received array is returned, such that the array is not copied
+    # into another shared memory block.
+    input_spec = obj if isinstance(obj, _SharedArraySpec) else None
+    if input_spec is not None:
+        obj = _view_of_shared_array(input_spec, unlink=False)
+
+    max_num = settings["max_num_reported_invalid_elems"]
+    czekitout.config.set_max_num_reported_invalid_elems(max_num)
+
+    level = settings["validation_level"]
+    enabled = settings["error_aggregation"]
+    dtype_policy = settings["dtype_policy"]
+
+    convert_func = getattr(czekitout.convert, convert_func_name)
+    with czekitout.config.local_validation_level(level):
+        with czekitout.config.local_error_aggregation(enabled):
+            with czekitout.config.local_dtype_policy(dtype_policy):
+                array = convert_func(obj, obj_name)
+
+    if (input_spec is not None) and (array is obj):
+        result = input_spec
+    elif _is_shareable(array):
+        output_block, result = _share_array(array)
+        output_block.close()
+    else:
+        result = array
+
+    return result
+
+
+
+def _array_of_worker_result(worker_result, input_blocks):
+    # ``input_blocks`` maps the names of the shared memory blocks of the input
+    # arrays to said blocks. An input block that is returned by a worker
+    # process is viewed directly, and removed from ``input_blocks``, since it
+    # must then stay open for as long as the view is referenced.
+    if isinstance(worker_result, _SharedArraySpec):
+        input_block = input_blocks.pop(worker_result.block_name, None)
+        if input_block is None:
+            array = _view_of_shared_array(worker_result, unlink=True)
+        else:
+            input_block.unlink()
+            array = np.asarray(_SharedArrayOwner(input_block, worker_result))
+    else:
+        array = worker_result
+
+    return array
+
+
+
+def _shut_down_reusable_process_pool():
+    # Shuts down the reusable pool of processes, if any. This function is also
+    # called upon exiting, such that said pool is not garbage collected while
+    # the interpreter is being finalized.
+    global _process_pool
+
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+    return None
+
+
+
+atexit.register(_shut_down_reusable_process_pool)
+
+
+
+def _reusable_process_pool(max_workers):
+    # Starting a pool of processes takes much longer than most conversions,
+    # hence the same pool is reused until a pool with a different maximum
+    # number of processes is requested, or the pool breaks.
+    global _process_pool
+    global _max_workers_of_process_pool
+
+    if ((_process_pool is None)
+        or (max_workers != _max_workers_of_process_pool)):
+        _shut_down_reusable_process_pool()
+
+        if os.name == "posix":
+            # The resource tracker of the current process must be running
+            # before the worker processes are started, such that the latter
+            # register their shared memory blocks with the former, rather than
+            # with resource trackers of their own, which would report the
+            # blocks unlinked by the current process as leaked.
+            multiprocessing.resource_tracker.ensure_running()
+
+        # Alias for readability.
+        ProcessPoolExecutor = concurrent.futures.ProcessPoolExecutor
+
+        _process_pool = ProcessPoolExecutor(max_workers)
+        _max_workers_of_process_pool = max_workers
+
+    return _process_pool
+
+
+
+def _convert_in_process_pool(objs, obj_names, convert_func_name, max_workers):
+    global _process_pool
+
+    executor = _reusable_process_pool(max_workers)
+    args = (executor, objs, obj_names, convert_func_name)
+    try:
+        results = _convert_in_given_process_pool(*args)
+    except concurrent.futures.process.BrokenProcessPool:
+        # A broken pool is not reused.
+        _process_pool = None
+        raise
+
+    return results
+
+
+
+def _convert_in_given_process_pool(executor,
+                                   objs,
+                                   obj_names,
+                                   convert_func_name):
+    input_blocks = dict()
+    futures = []
+    settings = _current_settings()
+
+    try:
+        for obj, obj_name in zip(objs, obj_names):
+            if _is_shareable(obj):
+                input_block, obj = _share_array(obj)
+                input_blocks[input_block.name] = input_block
+            args = (convert_func_name, obj, obj_name, settings)
+            futures.append(executor.submit(_convert_in_worker, *args))
+    finally:
+        # Every worker result is collected, including those after a failed
+        # conversion or submission, such that every shared output block is
+        # unlinked.
+        results = []
+        exceptions = []
+        for future in futures:
+            try:
+                worker_result = future.result()
+                results.append(_array_of_worker_result(worker_result,
+                                                       input_blocks))
+            except BaseException as err:
+                exceptions.append(err)
+
+        for input_block in input_blocks.values():
+            input_block.close()
+            input_block.unlink()
+
+    if exceptions:
+        raise exceptions[0]
+
+    return results
+
+
+
+def _convert_in_thread_pool(objs, obj_names, convert_func_name, max_workers):
+    # Each conversion is run within its own copy of the current context, such
+    # that the context-local settings of the current thread apply to it.
+    convert_func = getattr(czekitout.convert, convert_func_name)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = tuple(executor.submit(contextvars.copy_context().run,
+                                        convert_func,
+                                        obj,
+                                        obj_name)
+                        for obj, obj_name
+                        in zip(objs, obj_names))
+
+    arrays = [future.result() for future in futures]
+
+    return arrays
+
+
+
+def convert(objs,
+            obj_name,
+            convert_func_name,
+            mode="process",
+            max_workers=None):
+    r"""Convert many objects to numpy arrays, optionally in parallel.
+
+    Calling ``convert(objs, obj_name, convert_func_name)`` returns the list of
+    arrays ``convert_func(obj, elem_name)``, for each object ``obj`` in
+    ``objs``, where ``convert_func`` is the function in the module
+    :mod:`czekitout.convert` with the name ``convert_func_name``, e.g.
+    ``"to_real_numpy_matrix"``, and ``elem_name`` names the object by its
+    position in ``objs``, e.g. ``objs[3]`` for the fourth object of ``objs``
+    if ``obj_name`` is set to ``"objs"``. If any object fails validation, then
+    the exception raised for the first such object is raised.
+
+    If ``mode`` is set to ``"process"``, then the conversions are run in a pool
+    of processes, and numpy arrays are passed through shared memory blocks, as
+    described in the summary documentation of the module
+    :mod:`czekitout.parallel`. Objects that are not numpy arrays, e.g. nested
+    lists, and object arrays, are pickled, which limits the speedup that can
+    be expected for such objects, as also described in said summary
+    documentation. Since the returned arrays are views of shared memory
+    blocks, each block remains mapped into the memory of the current process
+    for as long as its array, or any view thereof, is referenced, and is
+    released once no such array is referenced. The pool of processes is
+    started upon the first call in this mode, and reused by subsequent calls
+    in this mode with the same value of ``max_workers``.
+
+    In every mode, the conversions are performed according to the settings of
+    the current context, e.g. the dtype policy set via
+    :func:`czekitout.config.local_dtype_policy`, as described in the summary
+    documentation of the module :mod:`czekitout.config`.
+
+    Parameters
+    ----------
+    objs : iterable
+        The objects to convert.
+    obj_name : `str`
+        The name of ``objs``.
+    convert_func_name : `str`
+        The name of the function in the module :mod:`czekitout.convert` with
+        which to convert each object. Must be the name of a function that
+        returns a numpy array, e.g. ``"to_real_numpy_matrix"``.
+    mode : ``"serial"`` | ``"thread"`` | ``"process"``, optional
+        If ``mode`` is set to ``"serial"``, then the objects are converted one
+        after the other in the current thread. If ``mode`` is set to
+        ``"thread"``, then the objects are converted in a pool of threads.
+        Otherwise, the objects are converted in a pool of processes.
+    max_workers : `int` | `None`, optional
+        The maximum number of threads or processes of the pool. If
+        ``max_workers`` is set to ``None``, then the default of
+        :class:`concurrent.futures.ThreadPoolExecutor` or
+        :class:`concurrent.futures.ProcessPoolExecutor` is used. Ignored if
+        ``mode`` is set to ``"serial"``. If ``mode`` is set to ``"process"``,
+        and ``max_workers`` differs from the value it had in the previous call
+        in this mode, then the pool of processes of said call is shut down, and
+        a new one is started.
+
+    Returns
+    -------
+    arrays : `list` (:class:`numpy.ndarray`)
+        The converted arrays.
+
+    """
+    czekitout.check._check_obj_name(obj_name)
+    try:
+        objs = tuple(objs)
+    except:
+        err_msg_args = (_convert_err_msg_1, obj_name)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    kwargs = {"obj": convert_func_name,
+              "obj_name": "convert_func_name",
+              "accepted_strings": _names_of_convert_funcs}
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    kwargs = {"obj": mode, "obj_name": "mode", "accepted_strings": _modes}
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    if max_workers is not None:
+        max_workers = czekitout.convert.to_positive_int(max_workers,
+                                                        "max_workers")
+
+    obj_names = tuple("{}[{}]".format(obj_name, obj_idx)
+                      for obj_idx
+                      in range(len(objs)))
+
+    args = (objs, obj_names, convert_func_name, max_workers)
+    if mode == "process":
+        arrays = _convert_in_process_pool(*args)
+    elif mode == "thread":
+        arrays = _convert_in_thread_pool(*args)
+    else:
+        convert_func = getattr(czekitout.convert, convert_func_name)
+        arrays = list(map(convert_func, objs, obj_names))
+
+    return arrays
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_convert_err_msg_1 = \
+    ("The object ``{}`` must be iterable.")
@@ -0,0 +1,466 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains a class for validating and converting dictionary-like objects, e.g.
+dictionaries of parameters, entry by entry, according to a schema, and a class
+for validating numpy structured arrays, i.e. arrays of records, field by field.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For determining whether records are dictionary-like.
+import collections.abc
+
+
+
+# For general array handling.
+import numpy as np
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["Schema",
+           "RecordSchema"]
+
+
+
+def _names_of_funcs_in_module(module, prefix):
+    result = tuple(name
+                   for name
+                   in dir(module)
+                   if name.startswith(prefix))
+
+    return result
+
+
+
+_names_of_check_funcs = _names_of_funcs_in_module(czekitout.check, "if_")
+_names_of_convert_funcs = _names_of_funcs_in_module(czekitout.convert, "to_")
+
+_check_funcs = frozenset(getattr(czekitout.check, name)
+                         for name
+                         in _names_of_check_funcs)
+
+
+
+def _check_and_convert_specs(specs):
+    try:
+        specs = dict(specs)
+        if not all(type(key) is str for key in specs):
+            raise
+    except:
+        err_msg_args = (_check_and_convert_specs_err_msg_1,)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    specs = {key: _func_of_spec(spec, key) for key, spec in specs.items()}
+
+    return specs
+
+
+
+def _func_of_spec(spec, key):
+    if type(spec) is str:
+        if spec in _names_of_check_funcs:
+            func = getattr(czekitout.check, spec)
+        elif spec in _names_of_convert_funcs:
+            func = getattr(czekitout.convert, spec)
+        else:
+            err_msg_args = (_func_of_spec_err_msg_1, key)
+            raise czekitout.errors.ValidationValueError(*err_msg_args)
+    elif callable(spec):
+        func = spec
+    else:
+        err_msg_args = (_func_of_spec_err_msg_1, key)
+        raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+    return func
+
+
+
+class Schema():
+    r"""A schema for validating and converting dictionary-like objects.
+
+    A schema maps each key of a dictionary-like object to a "spec", i.e. a
+    validation or conversion function that is applied to the value of said key.
+    The schema is compiled once upon construction, after which the schema
+    object can be called repeatedly to validate and convert dictionary-like
+    objects in a single pass.
+
+    Calling the schema object is equivalent to the hand-written sequence of
+    calls of the form ``spec(obj[key], key)``, except that rather than stopping
+    at the first entry that fails validation, every entry is validated, and all
+    of the error messages are collected into a single report, which is raised as
+    an exception of the type :class:`czekitout.errors.SchemaValidationError`.
+    The keys of the schema are passed as the ``obj_name`` arguments of the
+    specs. Since the specs validate their ``obj_name`` arguments as they do
+    when called by hand, calling the schema object takes about as long as the
+    equivalent hand-written sequence of calls, i.e. the schema trades no speed
+    for its single report of errors.
+
+    Parameters
+    ----------
+    specs : `dict`-like
+        The specs of the schema, where each dictionary key is a key that is
+        required in the dictionary-like objects to validate, and must be a
+        string. Each dictionary value is the spec of the corresponding key,
+        which is either the name of a ``czekitout.check.if_*`` or
+        ``czekitout.convert.to_*`` function, e.g. ``"to_positive_float"``, or a
+        callable object of the form ``spec(obj, obj_name)``. If the spec is a
+        ``czekitout.check.if_*`` function, then the value of the corresponding
+        key is validated but left unconverted. Otherwise, the value of the
+        corresponding key is replaced by the value returned by the spec.
+    allow_extra_keys : `bool`, optional
+        If ``allow_extra_keys`` is set to ``True``, then keys that are not in
+        ``specs`` are allowed in the dictionary-like objects to validate, and
+        their values are passed through unconverted. Otherwise, such keys are
+        reported as errors.
+
+    """
+    def __init__(self, specs, allow_extra_keys=False):
+        self._specs = _check_and_convert_specs(specs)
+        self._allow_extra_keys = czekitout.convert.to_bool(allow_extra_keys,
+                                                           "allow_extra_keys")
+
+        self._compiled_specs = tuple((key, func, (func in _check_funcs))
+                                     for key, func
+                                     in self._specs.items())
+
+        return None
+
+
+
+    @property
+    def specs(self):
+        r"""`dict`: The specs of the schema, with each spec given as a callable
+        object.
+
+        """
+        result = self._specs.copy()
+
+        return result
+
+
+
+    @property
+    def allow_extra_keys(self):
+        r"""`bool`: Whether keys that are not in the specs are allowed.
+
+        """
+        result = self._allow_extra_keys
+
+        return result
+
+
+
+    def __call__(self, obj, obj_name):
+        r"""Validate and convert a dictionary-like object.
+
+        Parameters
+        ----------
+        obj : any type
+            Input object.
+        obj_name : `str`
+            Name of the input object.
+
+        Returns
+        -------
+        result : `dict`
+            The object resulting from the conversion, with its keys ordered
+            like those of the schema, followed by any extra keys.
+
+        """
+        obj = czekitout.convert.to_dict(obj, obj_name)
+
+        result = dict()
+        errors = dict()
+        num_missing_keys = 0
+
+        for key, func, is_check_func in self._compiled_specs:
+            try:
+                value = obj[key]
+            except KeyError:
+                err_msg_args = (_schema_call_err_msg_2, key, obj_name)
+                err = czekitout.errors.ValidationValueError(*err_msg_args)
+                errors[key] = err
+                num_missing_keys += 1
+                continue
+
+            try:
+                converted_value = func(value, key)
+            except (TypeError, ValueError) as err:
+                errors[key] = err
+                continue
+
+            result[key] = value if is_check_func else converted_value
+
+        if len(obj) > len(self._compiled_specs) - num_missing_keys:
+            self._handle_extra_keys(obj, obj_name, result, errors)
+
+        if errors:
+            err_msg_args = (_schema_call_err_msg_1, obj_name, errors)
+            raise czekitout.errors.SchemaValidationError(*err_msg_args)
+
+        return result
+
+
+
+    def _handle_extra_keys(self, obj, obj_name, result, errors):
+        specs = self._specs
+
+        for key in obj:
+            if key in specs:
+                continue
+            if self._allow_extra_keys:
+                result[key] = obj[key]
+            else:
+                err_msg_args = (_schema_call_err_msg_3, key, obj_name)
+                err = czekitout.errors.ValidationValueError(*err_msg_args)
+                errors[key] = err
+
+        return None
+
+
+
+class RecordSchema():
+    r"""A schema for validating numpy structured arrays, i.e. arrays of records,
+    and for converting sequences of records to such arrays.
+
+    A record schema comprises a structured dtype, e.g. the dtype of an array of
+    records with the fields ``"x"``, ``"y"``, ``"intensity"``, and
+    ``"flags"``, and maps any of the fields of said dtype to a spec, i.e. a
+    validation or conversion function that is applied to the field. Calling the
+    record schema object validates every field of a structured array with a
+    spec in a single call, by applying the spec to the view of the field, e.g.
+    ``obj["x"]``, such that no field is copied. Like for
+    :class:`czekitout.schema.Schema` objects, rather than stopping at the first
+    field that fails validation, every field is validated, and all of the error
+    messages are collected into a single report, which is raised as an
+    exception of the type :class:`czekitout.errors.SchemaValidationError`.
+
+    If the object passed to the record schema object is not a structured array,
+    then it is converted to a 1D structured array of the dtype of the schema,
+    from a sequence of records, each of which is either a dictionary-like
+    object, mapping every field name of the dtype to the value of said field,
+    or a sequence of the values of the fields, in the order of the fields of
+    the dtype. Said structured array is allocated once, and filled record by
+    record, such that no intermediate array or list of records is created.
+
+    Parameters
+    ----------
+    dtype : `numpy.dtype` | `array_like`
+        The structured dtype of the records, or any object that can be
+        converted to such a dtype, e.g. ``[("x", "f8"), ("flags", "u1")]``.
+    field_specs : `dict`-like, optional
+        The specs of the fields, where each dictionary key is the name of a
+        field of ``dtype``, and the corresponding dictionary value is the spec
+        of said field, which is either the name of a ``czekitout.check.if_*``
+        or ``czekitout.convert.to_*`` function, e.g.
+        ``"if_nonnegative_numpy_array"``, or a callable object of the form
+        ``spec(obj, obj_name)``. Since each spec is applied to a view of a
+        field, any value returned by the spec is discarded, i.e. the fields are
+        validated, but not converted. Fields without a spec are not validated.
+
+    """
+    def __init__(self, dtype, field_specs=None):
+        try:
+            dtype = np.dtype(dtype)
+            if dtype.names is None:
+                raise
+        except:
+            err_msg_args = (_record_schema_err_msg_1,)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        field_specs = (dict()
+                       if (field_specs is None)
+                       else _check_and_convert_specs(field_specs))
+        for field_name in field_specs:
+            if field_name not in dtype.names:
+                err_msg_args = (_record_schema_err_msg_2, field_name)
+                raise czekitout.errors.ValidationValueError(*err_msg_args)
+
+        self._dtype = dtype
+        self._field_specs = field_specs
+
+        return None
+
+
+
+    @property
+    def dtype(self):
+        r"""`numpy.dtype`: The structured dtype of the records.
+
+        """
+        result = self._dtype
+
+        return result
+
+
+
+    @property
+    def field_specs(self):
+        r"""`dict`: The specs of the fields, with each spec given as a callable
+        object.
+
+        """
+        result = self._field_specs.copy()
+
+        return result
+
+
+
+    def __call__(self, obj, obj_name):
+        r"""Validate a structured array, or convert a sequence of records to a
+        structured array and validate it.
+
+        If ``obj`` is a structured array, then it must have every field of the
+        dtype of the schema, and may have additional fields, which are not
+        validated.
+
+        Parameters
+        ----------
+        obj : any type
+            Input object.
+        obj_name : `str`
+            Name of the input object.
+
+        Returns
+        -------
+        result : :class:`numpy.ndarray`
+            ``obj`` if ``obj`` is a structured array, otherwise the structured
+            array resulting from the conversion.
+
+        """
+        czekitout.check._check_obj_name(obj_name)
+
+        if isinstance(obj, np.ndarray) and (obj.dtype.names is not None):
+            result = obj
+        else:
+            result = self._structured_array_of_records(obj, obj_name)
+
+        errors = dict()
+
+        for field_name in self._dtype.names:
+            if field_name not in result.dtype.names:
+                err_msg_args = (_record_schema_call_err_msg_1,
+                                field_name,
+                                obj_name)
+                err = czekitout.errors.ValidationValueError(*err_msg_args)
+                errors[field_name] = err
+                continue
+
+            func = self._field_specs.get(field_name, None)
+            if func is None:
+                continue
+
+            field_view_name = "{}[{}]".format(obj_name, repr(field_name))
+            try:
+                func(result[field_name], field_view_name)
+            except (TypeError, ValueError) as err:
+                errors[field_name] = err
+
+        if errors:
+            err_msg_args = (_schema_call_err_msg_1, obj_name, errors)
+            raise czekitout.errors.SchemaValidationError(*err_msg_args)
+
+        return result
+
+
+
+    def _structured_array_of_records(self, records, obj_name):
+        dtype = self._dtype
+
+        try:
+            num_records = len(records)
+            records_iterator = iter(records)
+        except:
+            err_msg_args = (_record_schema_call_err_msg_2, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        result = np.empty((num_records,), dtype=dtype)
+
+        for record_idx, record in enumerate(records_iterator):
+            try:
+                if isinstance(record, collections.abc.Mapping):
+                    record = tuple(record[field_name]
+                                   for field_name
+                                   in dtype.names)
+                elif isinstance(record, (str, bytes)):
+                    raise
+                result[record_idx] = tuple(record)
+            except:
+                record_name = "{}[{}]".format(obj_name, record_idx)
+                err_msg_args = (_record_schema_call_err_msg_3,
+                                record_name,
+                                str(dtype))
+                raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        return result
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_check_and_convert_specs_err_msg_1 = \
+    ("The object ``specs`` must be dictionary-like, with keys that are "
+     "instances of the class `str`.")
+
+_func_of_spec_err_msg_1 = \
+    ("The spec for ``{}`` must be either a callable object, or the name of a "
+     "function in the module ``czekitout.check`` or ``czekitout.convert``.")
+
+_schema_call_err_msg_1 = \
+    ("The object ``{}`` failed validation, for the following reasons:\n{}")
+_schema_call_err_msg_2 = \
+    ("The key ``{}`` is missing from the object ``{}``.")
+_schema_call_err_msg_3 = \
+    ("The key ``{}`` of the object ``{}`` is not a key of the schema.")
+
+_record_schema_err_msg_1 = \
+    ("The object ``dtype`` must be a structured numpy dtype, or an object that "
+     "can be converted to such a dtype.")
+_record_schema_err_msg_2 = \
+    ("The key ``{}`` of the object ``field_specs`` is not the name of a field "
+     "of the object ``dtype``.")
+
+_record_schema_call_err_msg_1 = \
+    ("The field ``{}`` is missing from the structured array ``{}``.")
+_record_schema_call_err_msg_2 = \
+    ("The object ``{}`` must be either a structured numpy array, or a "
+     "sequence of records.")
+_record_schema_call_err_msg_3 = \
+    ("The object ``{}`` must be a record of the dtype ``{}``, i.e. either a "
+     "dictionary-like object mapping every field name of said dtype to a "
+     "value of said field, or a sequence of the values of the fields of said "
+     "dtype.")
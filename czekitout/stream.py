@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains a class for validating and converting the elements of iterables
+lazily, i.e. as they are pulled.
+
+Functions like :func:`czekitout.check.if_float_seq` iterate over the entirety of
+the object being validated, which consumes iterators like generators, and never
+returns for unbounded iterators. The class :class:`czekitout.stream.Stream`
+instead wraps an iterable, and validates and converts each of its elements only
+when said element is pulled, such that iterators are consumed exactly once, and
+unbounded iterators can be validated.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For slicing iterators.
+import itertools
+
+
+
+# For general array handling.
+import numpy as np
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+# For resolving the spec of the elements.
+import czekitout.schema
+
+# For validating and converting chunks of elements in a vectorized manner.
+import czekitout.batch
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["Stream"]
+
+
+
+_batch_funcs_of_convert_funcs = \
+    {czekitout.convert.to_float: czekitout.batch.float_,
+     czekitout.convert.to_positive_float: czekitout.batch.positive_float,
+     czekitout.convert.to_nonnegative_float: czekitout.batch.nonnegative_float,
+     czekitout.convert.to_int: czekitout.batch.int_,
+     czekitout.convert.to_positive_int: czekitout.batch.positive_int,
+     czekitout.convert.to_nonnegative_int: czekitout.batch.nonnegative_int,
+     czekitout.convert.to_bool: czekitout.batch.bool_}
+
+
+
+class _StreamBase():
+    # The validation and conversion of the elements of streams, shared by the
+    # class ``czekitout.stream.Stream`` and its asynchronous counterpart
+    # ``czekitout.aio.AsyncStream``. Subclasses implement the method
+    # ``_iterator_of``, which returns the iterator, synchronous or asynchronous,
+    # over the elements of the wrapped iterable, and the method
+    # ``_push_back_elems``, which puts elements that were pulled from said
+    # iterator, but not consumed, back in front of said iterator.
+    def __init__(self, iterable, obj_name, elem_spec):
+        czekitout.check._check_obj_name(obj_name)
+
+        self._iterator = self._iterator_of(iterable, obj_name)
+        self._obj_name = obj_name
+        self._elem_func = czekitout.schema._func_of_spec(elem_spec, "elem_spec")
+        self._elem_func_is_check_func = \
+            (self._elem_func in czekitout.schema._check_funcs)
+        self._batch_func = \
+            _batch_funcs_of_convert_funcs.get(self._elem_func, None)
+        self._num_elems_pulled = 0
+
+        return None
+
+
+
+    @property
+    def num_elems_pulled(self):
+        r"""`int`: The number of elements pulled from the stream so far,
+        including any element that failed validation.
+
+        """
+        result = self._num_elems_pulled
+
+        return result
+
+
+
+    def _validate_and_convert_elem(self, elem, elem_idx):
+        elem_func = self._elem_func
+
+        try:
+            converted_elem = elem_func(elem, "elem_of_obj")
+            elem_is_valid = True
+        except (TypeError, ValueError):
+            elem_is_valid = False
+
+        if not elem_is_valid:
+            # The element is validated again, this time naming it by its
+            # position, such that the exception raised identifies the element.
+            elem_name = "{}[{}]".format(self._obj_name, elem_idx)
+            converted_elem = elem_func(elem, elem_name)
+
+        result = elem if self._elem_func_is_check_func else converted_elem
+
+        return result
+
+
+
+    def _validate_and_convert_chunk(self, elems, first_elem_idx):
+        batch_func = self._batch_func
+        chunk = None
+
+        if batch_func is not None:
+            mask, values = batch_func(elems)
+            if mask.all():
+                chunk = values
+
+        if chunk is None:
+            chunk = []
+            for elem_idx, elem in enumerate(elems):
+                try:
+                    converted_elem = \
+                        self._validate_and_convert_elem(elem,
+                                                        first_elem_idx+elem_idx)
+                except:
+                    # The elements of the chunk following the failing element
+                    # are returned to the stream, such that they can be pulled
+                    # after the failure.
+                    self._num_elems_pulled = first_elem_idx + elem_idx + 1
+                    self._push_back_elems(elems[elem_idx+1:])
+                    raise
+                chunk.append(converted_elem)
+
+            if batch_func is not None:
+                # Only reached if every element is valid according to the spec,
+                # but not according to ``batch_func``, e.g. for integers that
+                # cannot be represented as 64-bit integers.
+                chunk = np.array(chunk)
+
+        return chunk
+
+
+
+class Stream(_StreamBase):
+    r"""A stream that validates and converts the elements of an iterable lazily.
+
+    A stream wraps an iterable, and is itself an iterator: each time an element
+    is pulled from the stream, the next element of the iterable is pulled,
+    validated, and converted according to the spec of the elements. If an
+    element fails validation, then the exception raised names the element by
+    its position in the iterable, e.g. ``obj[3]`` for the fourth element of an
+    iterable named ``obj``. Elements that are pulled before the failing element
+    remain valid, and the stream can be pulled from again after a failure, in
+    which case it resumes with the element after the failing one.
+
+    Elements can also be pulled in chunks via the method
+    :meth:`czekitout.stream.Stream.chunks`, such that consumers can process the
+    elements in blocks of a fixed size, while holding at most one block in
+    memory at a time.
+
+    Parameters
+    ----------
+    iterable : iterable
+        The iterable to wrap, e.g. a sequence, generator, or unbounded
+        iterator. If ``iterable`` is an iterator, then it is consumed by the
+        stream.
+    obj_name : `str`
+        The name of ``iterable``.
+    elem_spec : `str` | callable
+        The spec of the elements, which is either the name of a
+        ``czekitout.check.if_*`` or ``czekitout.convert.to_*`` function, e.g.
+        ``"to_positive_float"``, or a callable object of the form
+        ``elem_spec(obj, obj_name)``. If the spec is a ``czekitout.check.if_*``
+        function, then each element is validated but left unconverted.
+        Otherwise, each element is replaced by the value returned by the spec.
+
+    """
+    def _iterator_of(self, iterable, obj_name):
+        try:
+            iterator = iter(iterable)
+        except:
+            err_msg_args = (_stream_err_msg_1, obj_name)
+            raise czekitout.errors.ValidationTypeError(*err_msg_args)
+
+        return iterator
+
+
+
+    def __iter__(self):
+        result = self
+
+        return result
+
+
+
+    def __next__(self):
+        elem = next(self._iterator)
+        elem_idx = self._num_elems_pulled
+        self._num_elems_pulled += 1
+
+        result = self._validate_and_convert_elem(elem, elem_idx)
+
+        return result
+
+
+
+    def chunks(self, chunk_size):
+        r"""Pull the remaining elements of the stream in chunks.
+
+        This method returns a generator that, each time it is pulled from, pulls
+        the next ``chunk_size`` elements of the stream, or fewer if the stream
+        is exhausted, and validates and converts said elements.
+
+        If the spec of the elements is one of the functions
+        ``czekitout.convert.to_float``, ``czekitout.convert.to_positive_float``,
+        ``czekitout.convert.to_nonnegative_float``,
+        ``czekitout.convert.to_int``, ``czekitout.convert.to_positive_int``,
+        ``czekitout.convert.to_nonnegative_int``, or
+        ``czekitout.convert.to_bool``, then each chunk is validated and
+        converted in a vectorized manner via the corresponding function of the
+        module :mod:`czekitout.batch`, and is yielded as a 1D numpy array.
+        Otherwise, the elements of each chunk are validated and converted one by
+        one, and each chunk is yielded as a list.
+
+        If any element of a chunk fails validation, then an exception is raised
+        that names the first such element by its position in the iterable, as
+        described in the documentation for the class
+        :class:`czekitout.stream.Stream`. Like any generator, the generator
+        returned by the current method is exhausted upon raising an exception,
+        however the remaining elements of the stream, starting with the element
+        after the failing one, can still be pulled, either directly, or via a
+        new call of the current method.
+
+        Parameters
+        ----------
+        chunk_size : `int`
+            The number of elements per chunk. Must be positive.
+
+        Returns
+        -------
+        chunks : generator
+            The generator of the chunks.
+
+        """
+        chunk_size = czekitout.convert.to_positive_int(chunk_size,
+                                                       "chunk_size")
+        chunks = self._generate_chunks(chunk_size)
+
+        return chunks
+
+
+
+    def _push_back_elems(self, elems):
+        self._iterator = itertools.chain(elems, self._iterator)
+
+        return None
+
+
+
+    def _generate_chunks(self, chunk_size):
+        while True:
+            elems = tuple(itertools.islice(self._iterator, chunk_size))
+            if len(elems) == 0:
+                break
+
+            first_elem_idx = self._num_elems_pulled
+            self._num_elems_pulled += len(elems)
+
+            yield self._validate_and_convert_chunk(elems, first_elem_idx)
+
+        return None
+
+
+
+###########################
+## Define error messages ##
+###########################
+
+_stream_err_msg_1 = \
+    ("The object ``{}`` must be iterable.")
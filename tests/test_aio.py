@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.aio`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For running coroutines.
+import asyncio
+
+# For creating executors.
+import concurrent.futures
+
+# For getting the identities of threads.
+import threading
+
+# For importing ``czekitout`` in a fresh interpreter.
+import subprocess
+import sys
+
+
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For getting and setting the validation level.
+import czekitout.config
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+# For validating and converting objects asynchronously.
+import czekitout.aio
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+class _RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.num_submitted_calls = 0
+
+        return None
+
+
+
+    def submit(self, *args, **kwargs):
+        self.num_submitted_calls += 1
+        future = super().submit(*args, **kwargs)
+
+        return future
+
+
+
+@pytest.fixture
+def recording_executor():
+    executor = _RecordingExecutor()
+    size_threshold = czekitout.aio.get_size_threshold()
+    czekitout.aio.set_executor(executor)
+    czekitout.aio.set_size_threshold(100)
+
+    yield executor
+
+    czekitout.aio.set_executor(None)
+    czekitout.aio.set_size_threshold(size_threshold)
+    executor.shutdown()
+
+    return None
+
+
+
+async def _async_gen_of(elems):
+    for elem in elems:
+        yield elem
+
+
+
+def test_1_of_lazy_import(monkeypatch):
+    code = ("import sys, czekitout; "
+            "assert 'asyncio' not in sys.modules; "
+            "czekitout.aio.AsyncStream; "
+            "assert 'asyncio' in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    monkeypatch.delattr(czekitout, "aio")
+    assert czekitout.aio is sys.modules["czekitout.aio"]
+
+    with pytest.raises(AttributeError):
+        czekitout.nonexistent_module
+
+    return None
+
+
+
+def test_1_of_set_executor():
+    assert czekitout.aio.get_executor() is None
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        czekitout.aio.set_executor(executor)
+        assert czekitout.aio.get_executor() is executor
+    czekitout.aio.set_executor(None)
+    assert czekitout.aio.get_executor() is None
+
+    with pytest.raises(TypeError):
+        czekitout.aio.set_executor("executor")
+
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        with pytest.raises(TypeError) as err_info:
+            czekitout.aio.set_executor(executor)
+        assert "ThreadPoolExecutor" in str(err_info.value)
+    assert czekitout.aio.get_executor() is None
+
+    return None
+
+
+
+def test_1_of_set_size_threshold():
+    size_threshold = czekitout.aio.get_size_threshold()
+    assert size_threshold == 2**16
+
+    czekitout.aio.set_size_threshold(0)
+    assert czekitout.aio.get_size_threshold() == 0
+
+    with pytest.raises(ValueError):
+        czekitout.aio.set_size_threshold(-1)
+
+    czekitout.aio.set_size_threshold(size_threshold)
+
+    return None
+
+
+
+def test_1_of_coroutine_funcs(recording_executor):
+    for func_name in czekitout.aio.__all__:
+        if func_name.startswith(("if_", "to_")):
+            coroutine_func = getattr(czekitout.aio, func_name)
+            assert asyncio.iscoroutinefunction(coroutine_func)
+            assert coroutine_func.__name__ == func_name
+            assert func_name in coroutine_func.__doc__
+
+    objs = (np.zeros((3, 3, 3)), np.zeros((5, 5, 5)), [[[0]*5]*5]*5)
+    expected_num_submitted_calls = (0, 1, 2)
+
+    zip_obj = zip(objs, expected_num_submitted_calls)
+    for obj, expected_num_submitted_call in zip_obj:
+        kwargs = {"obj": obj, "obj_name": "obj"}
+        coroutine = czekitout.aio.to_real_numpy_array_3d(**kwargs)
+        result = asyncio.run(coroutine)
+        expected_result = czekitout.convert.to_real_numpy_array_3d(**kwargs)
+        assert np.array_equal(result, expected_result)
+        num_submitted_calls = recording_executor.num_submitted_calls
+        assert num_submitted_calls == expected_num_submitted_call
+
+    for obj in (-np.ones((2, 2)), -np.ones((20, 20))):
+        coroutine = czekitout.aio.if_nonnegative_numpy_matrix(obj, "obj")
+        with pytest.raises(ValueError) as err_info:
+            asyncio.run(coroutine)
+        assert "``obj``" in str(err_info.value)
+
+    return None
+
+
+
+def test_2_of_coroutine_funcs(recording_executor):
+    async def check_obj_with_validation_level_off(obj):
+        with czekitout.config.local_validation_level("off"):
+            await czekitout.aio.if_nonnegative_numpy_matrix(obj, "obj")
+
+        return None
+
+    coroutine = check_obj_with_validation_level_off(-np.ones((20, 20)))
+    asyncio.run(coroutine)
+    assert recording_executor.num_submitted_calls == 1
+
+    thread_idents = []
+
+    def check_obj(obj, obj_name):
+        thread_idents.append(threading.get_ident())
+        czekitout.check.if_real_numpy_array(obj, obj_name)
+
+        return None
+
+    coroutine_func = czekitout.aio._coroutine_func_of(check_obj)
+    asyncio.run(coroutine_func(np.zeros((20, 20)), "obj"))
+    assert thread_idents[0] != threading.get_ident()
+
+    return None
+
+
+
+def test_1_of_AsyncStream(recording_executor):
+    async def pull_elems_and_chunks():
+        stream = czekitout.aio.AsyncStream(_async_gen_of(range(250)),
+                                           "obj",
+                                           "to_float")
+        assert stream.__aiter__() is stream
+        elems = [await stream.__anext__(), await stream.__anext__()]
+        chunks = [chunk async for chunk in stream.chunks(chunk_size=120)]
+
+        return stream, elems, chunks
+
+    stream, elems, chunks = asyncio.run(pull_elems_and_chunks())
+    assert elems == [0.0, 1.0]
+    assert [len(chunk) for chunk in chunks] == [120, 120, 8]
+    assert np.array_equal(np.concatenate(chunks), np.arange(2, 250))
+    assert stream.num_elems_pulled == 250
+    assert recording_executor.num_submitted_calls == 2
+
+    return None
+
+
+
+def test_2_of_AsyncStream():
+    async def pull_chunks(elems, chunk_size):
+        stream = czekitout.aio.AsyncStream(_async_gen_of(elems),
+                                           "obj",
+                                           "to_int")
+        chunks = [chunk async for chunk in stream.chunks(chunk_size)]
+
+        return chunks
+
+    chunks = asyncio.run(pull_chunks(elems=(1, 2, 3), chunk_size=2))
+    assert [chunk.tolist() for chunk in chunks] == [[1, 2], [3]]
+
+    with pytest.raises(TypeError) as err_info:
+        asyncio.run(pull_chunks(elems=(1, 2, "a", 4), chunk_size=2))
+    assert "``obj[2]``" in str(err_info.value)
+
+    async def pull_remaining_elems(elems, chunk_size):
+        stream = czekitout.aio.AsyncStream(_async_gen_of(elems),
+                                           "obj",
+                                           "to_positive_int")
+        with pytest.raises(ValueError) as err_info:
+            _ = [chunk async for chunk in stream.chunks(chunk_size)]
+        assert "``obj[2]``" in str(err_info.value)
+        num_elems_pulled = stream.num_elems_pulled
+        remaining_elems = [elem async for elem in stream]
+
+        return num_elems_pulled, remaining_elems
+
+    elems = (1, 2, -3, 4, 5, 6, 7)
+    result = asyncio.run(pull_remaining_elems(elems, chunk_size=4))
+    assert result == (3, [4, 5, 6, 7])
+
+    async def pull_elems(elems):
+        stream = czekitout.aio.AsyncStream(_async_gen_of(elems),
+                                           "obj",
+                                           "if_str_like")
+        elems = [elem async for elem in stream]
+
+        return elems
+
+    assert asyncio.run(pull_elems(("a", "b"))) == ["a", "b"]
+
+    with pytest.raises(TypeError):
+        czekitout.aio.AsyncStream((1, 2), "obj", "to_int")
+    with pytest.raises(ValueError):
+        asyncio.run(pull_chunks(elems=(1, 2), chunk_size=0))
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.annotations`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For introspecting type annotations.
+import typing
+
+
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For converting objects.
+import czekitout.convert
+
+# For compiling validators from type annotations.
+import czekitout.annotations
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# ``typing.Annotated`` was added in Python 3.9.
+_skip_if_annotated_is_unavailable = \
+    pytest.mark.skipif(not hasattr(typing, "Annotated"),
+                       reason="requires typing.Annotated")
+
+
+
+@_skip_if_annotated_is_unavailable
+def test_1_of_compile_validator():
+    func_to_test = czekitout.annotations.compile_validator
+
+    Annotated = typing.Annotated  # Alias for readability.
+    module_alias = czekitout.annotations
+
+    annotations_and_expected_validators = \
+        ((float, czekitout.convert.to_float),
+         (Annotated[float, module_alias.Positive],
+          czekitout.convert.to_positive_float),
+         (Annotated[int, module_alias.Nonnegative, "doc"],
+          czekitout.convert.to_nonnegative_int),
+         (typing.Tuple[int, int], czekitout.convert.to_pair_of_ints),
+         (typing.Tuple[int, ...], czekitout.convert.to_tuple_of_ints),
+         (typing.List[str], czekitout.convert.to_list_of_strs),
+         (Annotated[typing.Tuple[typing.Tuple[int, int], ...],
+                    module_alias.Nonnegative],
+          czekitout.convert.to_pairs_of_nonnegative_ints),
+         (Annotated[np.ndarray, module_alias.RealMatrix],
+          czekitout.convert.to_real_numpy_matrix),
+         (Annotated[np.ndarray, module_alias.Real, module_alias.Matrix],
+          czekitout.convert.to_real_numpy_matrix),
+         (Annotated[Annotated[np.ndarray, module_alias.Real],
+                    module_alias.TwoColumnMatrix],
+          czekitout.convert.to_real_two_column_numpy_matrix))
+
+    for annotation, expected_validator in annotations_and_expected_validators:
+        assert func_to_test(annotation) is expected_validator
+
+    validator = func_to_test(Annotated[np.ndarray, module_alias.RealMatrix])
+    assert np.all(validator([[1, 2]], "obj") == np.array([[1.0, 2.0]]))
+    with pytest.raises(TypeError):
+        validator([1, 2], "obj")
+
+    return None
+
+
+
+@_skip_if_annotated_is_unavailable
+def test_2_of_compile_validator():
+    func_to_test = czekitout.annotations.compile_validator
+
+    Annotated = typing.Annotated  # Alias for readability.
+    module_alias = czekitout.annotations
+
+    validator = func_to_test(typing.Optional[Annotated[float,
+                                                       module_alias.Positive]])
+    assert validator(None, "obj") is None
+    assert validator("2", "obj") == 2.0
+    with pytest.raises(ValueError):
+        validator(-2, "obj")
+
+    validator = func_to_test(typing.Union[None, int])
+    assert validator(None, "obj") is None
+    assert validator(2.0, "obj") == 2
+
+    obj = object()
+    assert func_to_test(typing.Any)(obj, "obj") is obj
+
+    validator = func_to_test(typing.Callable[[int], int])
+    assert validator(max, "obj") is max
+    with pytest.raises(TypeError):
+        validator(3, "obj")
+
+    validator = func_to_test(complex)
+    assert validator(1j, "obj") == 1j
+    with pytest.raises(TypeError) as err_info:
+        validator(1, "obj")
+    assert "`complex`" in str(err_info.value)
+
+    return None
+
+
+
+@_skip_if_annotated_is_unavailable
+def test_3_of_compile_validator(monkeypatch):
+    func_to_test = czekitout.annotations.compile_validator
+
+    Annotated = typing.Annotated  # Alias for readability.
+    module_alias = czekitout.annotations
+
+    with pytest.raises(ValueError) as err_info:
+        func_to_test(Annotated[str, module_alias.Positive])
+    assert "['positive']" in str(err_info.value)
+
+    for annotation in (typing.Dict[str, int], typing.Union[int, str], "float"):
+        with pytest.raises(ValueError) as err_info:
+            func_to_test(annotation)
+        assert str(annotation) in str(err_info.value)
+
+    annotation = Annotated[float, ["unhashable metadata"]]
+    assert func_to_test(annotation) is czekitout.convert.to_float
+    assert func_to_test(annotation) is czekitout.convert.to_float
+
+    monkeypatch.setattr(module_alias, "_max_num_cached_validators", 2)
+    module_alias._validator_cache.clear()
+    for annotation in (int, float, bool):
+        func_to_test(annotation)
+        assert annotation in module_alias._validator_cache
+    assert len(module_alias._validator_cache) == 1
+
+    return None
+
+
+
+def test_1_of_Constraint():
+    cls_alias = czekitout.annotations.Constraint
+
+    constraint = cls_alias(name="PositiveMatrix",
+                           properties=("positive", "2d"))
+    assert constraint.properties == frozenset(("positive", "2d"))
+    expected_repr = "czekitout.annotations.PositiveMatrix"
+    assert repr(constraint) == expected_repr
+
+    with pytest.raises(TypeError):
+        cls_alias(name="Positive", properties=(1,))
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
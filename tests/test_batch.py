@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.batch`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+# For validating and converting batches of scalars.
+import czekitout.batch
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+_func_names = ("float_",
+               "positive_float",
+               "nonnegative_float",
+               "int_",
+               "positive_int",
+               "nonnegative_int",
+               "bool_")
+
+
+
+def _scalar_funcs_of_batch_func_name(func_name):
+    name_stem = func_name.rstrip("_")
+    check_func = getattr(czekitout.check, "if_"+name_stem)
+    convert_func = getattr(czekitout.convert, "to_"+name_stem)
+
+    return check_func, convert_func
+
+
+
+def _expected_mask_and_values(func_name, batch):
+    check_func, convert_func = _scalar_funcs_of_batch_func_name(func_name)
+
+    expected_mask = []
+    expected_values = []
+    for elem in batch:
+        try:
+            check_func(elem, "elem")
+            expected_mask.append(True)
+            expected_values.append(convert_func(elem, "elem"))
+        except (TypeError, ValueError):
+            expected_mask.append(False)
+            expected_values.append(None)
+
+    return expected_mask, expected_values
+
+
+
+def _assert_results_are_as_expected(func_name, batch):
+    func_to_test = getattr(czekitout.batch, func_name)
+    mask, values = func_to_test(batch)
+    expected_mask, expected_values = _expected_mask_and_values(func_name, batch)
+
+    assert mask.tolist() == expected_mask
+    for elem_idx, expected_value in enumerate(expected_values):
+        if expected_value is not None:
+            value = values[elem_idx]
+            assert (value == expected_value) or np.isnan(expected_value)
+
+    return None
+
+
+
+def test_1_of_batch_funcs():
+    batch = (0, 1, 2, -1, 2.5, -2.5, True, False, np.float32(1.5),
+             np.int64(3), np.bool_(True), 1+0j, 1+1e-15j, 1+1j, "1.5", b"1",
+             None, (1, 2), [1], np.nan, np.inf, -np.inf, np.array(2.0),
+             np.array([1.0]), object(), np.datetime64("2020-01-01"))
+
+    for func_name in _func_names:
+        _assert_results_are_as_expected(func_name, batch)
+
+    return None
+
+
+
+def test_2_of_batch_funcs():
+    batches = (np.array([0, 1, -3, 2]),
+               np.array([0.0, 1.5, -2.0, np.nan, np.inf]),
+               np.array([1+0j, 1+1j, -1+0j]),
+               np.array([True, False]),
+               np.array([0, 1, 5], dtype=np.uint64),
+               np.array(["1", "2"]),
+               [0.5, 1, True, -3],
+               [1, 2, 3])
+
+    for batch in batches:
+        for func_name in _func_names:
+            _assert_results_are_as_expected(func_name, batch)
+
+    batch = np.array([[1.0, -2.0], [0.5, np.nan]])
+    mask, values = czekitout.batch.positive_float(batch)
+    assert mask.shape == batch.shape
+    assert mask.tolist() == [[True, False], [True, True]]
+    assert np.isnan(values[0, 1])
+
+    batch = np.array([[1, "a"], [0.5, None]], dtype=object)
+    mask, values = czekitout.batch.int_(batch)
+    assert mask.tolist() == [[True, False], [False, False]]
+    assert values.tolist() == [[1, 0], [0, 0]]
+    assert values.dtype == np.int64
+
+    return None
+
+
+
+def test_3_of_batch_funcs():
+    batch = (2**70, 1.0e300, np.uint64(2**63))
+    for func_name in ("int_", "positive_int", "nonnegative_int"):
+        func_to_test = getattr(czekitout.batch, func_name)
+        mask, values = func_to_test(batch)
+        assert not np.any(mask)
+
+    mask, values = czekitout.batch.int_(np.array([1, 2**63], dtype=np.uint64))
+    assert mask.tolist() == [True, False]
+    assert values.tolist() == [1, 0]
+
+    for batch in (3, "abc", b"abc"):
+        with pytest.raises(TypeError):
+            czekitout.batch.float_(batch)
+
+    mask, values = czekitout.batch.bool_([])
+    assert mask.shape == (0,)
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
@@ -21,6 +21,11 @@ r"""Contains tests for the module :mod:`czekitout.convert`.
 ## Load libraries/packages/modules ##
 #####################################
 
+# For checking against abstract base classes.
+import collections.abc
+
+
+
 # For general array handling.
 import numpy as np
 
@@ -29,6 +34,9 @@ import pytest
 
 
 
+# For enabling error aggregation.
+import czekitout.config
+
 # For validating objects.
 import czekitout.check
 
@@ -87,6 +95,89 @@ def test_1_of_if_instance_of_any_accepted_types():
 
 
 
+def test_1_of_TypeGuard():
+    cls_to_test = czekitout.check.TypeGuard
+
+    unformatted_err_msg = \
+        czekitout.check._if_instance_of_any_accepted_types_err_msg_2
+
+    accepted_types = (collections.abc.Sequence, int)
+    type_guard = cls_to_test(accepted_types)
+
+    assert type_guard.accepted_types == accepted_types
+    assert type_guard.names_of_accepted_types == ("collections.abc.Sequence",
+                                                  "int")
+    assert type_guard._caches_isinstance_results
+
+    for _ in range(2):
+        assert type_guard.is_instance([1, 2])
+        assert type_guard.is_instance(3)
+        assert not type_guard.is_instance({1, 2})
+        assert type_guard._isinstance_results[set] == False
+        
+    assert type_guard.check((1, 2), "obj") == None
+    
+    err_msg = unformatted_err_msg.format("obj",
+                                         "(`collections.abc.Sequence`, `int`)")
+    with pytest.raises(TypeError) as err_info:
+        type_guard.check(3.5, "obj")
+    assert str(err_info.value) == err_msg
+
+    class SetLikeSequence(set):
+        pass
+
+    assert not type_guard.is_instance(SetLikeSequence())
+    collections.abc.Sequence.register(SetLikeSequence)
+    assert type_guard.is_instance(SetLikeSequence())
+
+    type_guard = cls_to_test([int, float])
+    assert not type_guard._caches_isinstance_results
+    assert type_guard.is_instance(3.5)
+
+    with pytest.raises(TypeError) as err_info:
+        cls_to_test(tuple())
+
+    return None
+
+
+
+def test_2_of_if_instance_of_any_accepted_types():
+    func_to_test = czekitout.check.if_instance_of_any_accepted_types
+    type_guard_cache = czekitout.check._type_guard_cache
+
+    accepted_types = (int, float)
+    func_to_test(3, "obj", accepted_types)
+    type_guard = type_guard_cache[id(accepted_types)][1]
+    func_to_test(3.5, "obj", accepted_types)
+    assert type_guard_cache[id(accepted_types)][1] is type_guard
+
+    accepted_types = [int, float]
+    func_to_test(3, "obj", accepted_types)
+    assert id(accepted_types) not in type_guard_cache
+
+    with pytest.raises(TypeError) as err_info:
+        func_to_test(3, None, (int,))
+
+    return None
+
+
+
+def test_3_of_if_instance_of_any_accepted_types(monkeypatch):
+    func_to_test = czekitout.check.if_instance_of_any_accepted_types
+    type_guard_cache = czekitout.check._type_guard_cache
+
+    monkeypatch.setattr(czekitout.check, "_max_num_cached_type_guards", 1)
+
+    accepted_types_1 = (int,)
+    accepted_types_2 = (float,)
+    func_to_test(3, "obj", accepted_types_1)
+    func_to_test(3.5, "obj", accepted_types_2)
+    assert list(type_guard_cache.keys()) == [id(accepted_types_2)]
+
+    return None
+
+
+
 def test_1_of_if_one_of_any_accepted_strings():
     func_to_test = czekitout.check.if_one_of_any_accepted_strings
 
@@ -174,6 +265,35 @@ def test_1_of_if_complex_numpy_array():
 
 
 
+def test_1_of_masked_arrays():
+    data = np.array([[1.0, np.nan, -2.0], [-3.0, 4.0, np.inf]])
+    mask = np.isnan(data) | (data == -2.0)
+    obj = np.ma.MaskedArray(data, mask=mask)
+
+    czekitout.check.if_real_numpy_array(obj=obj, obj_name="obj")
+    with pytest.raises(ValueError):
+        czekitout.check.if_nonnegative_numpy_matrix(obj=obj, obj_name="obj")
+
+    with czekitout.config.local_error_aggregation():
+        with pytest.raises(ValueError) as err_info:
+            czekitout.check.if_nonnegative_numpy_array(obj=obj,
+                                                       obj_name="obj")
+    assert err_info.value.invalid_elem_indices.tolist() == [3]
+    assert err_info.value.invalid_elems == (-3.0,)
+
+    obj = np.ma.MaskedArray(data, mask=(mask | (data == -3.0)))
+    czekitout.check.if_nonnegative_numpy_array(obj=obj, obj_name="obj")
+
+    obj = np.ma.MaskedArray(data+1j, mask=mask)
+    czekitout.check.if_complex_numpy_array(obj=obj, obj_name="obj")
+    obj.mask = False
+    with pytest.raises(TypeError):
+        czekitout.check.if_complex_numpy_array(obj=obj, obj_name="obj")
+
+    return None
+
+
+
 def test_1_of_if_callable():
     func_to_test = czekitout.check.if_callable
 
@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.config`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For running code in other threads.
+import threading
+
+# For copying contexts.
+import contextvars
+
+
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For getting and setting the validation level.
+import czekitout.config
+
+# For type-checking objects.
+import czekitout.isa
+
+# For validating objects.
+import czekitout.check
+
+# For converting objects.
+import czekitout.convert
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+@pytest.fixture
+def restore_global_validation_level():
+    level = czekitout.config.get_validation_level()
+    yield None
+    czekitout.config.set_validation_level(level)
+
+    return None
+
+
+
+def test_1_of_set_validation_level(restore_global_validation_level):
+    flags = czekitout.config._validation_level_flags
+
+    for level in ("off", "fast", "full"):
+        czekitout.config.set_validation_level(level)
+        assert czekitout.config.get_validation_level() == level
+        assert flags.is_off == (level == "off")
+        assert flags.is_full == (level == "full")
+
+    for level in ("slow", None, ("full",)):
+        with pytest.raises(ValueError):
+            czekitout.config.set_validation_level(level)
+    assert czekitout.config.get_validation_level() == "full"
+
+    return None
+
+
+
+def test_1_of_local_validation_level(restore_global_validation_level):
+    flags = czekitout.config._validation_level_flags
+    czekitout.config.set_validation_level("full")
+
+    with czekitout.config.local_validation_level("fast"):
+        assert czekitout.config.get_validation_level() == "fast"
+        assert (flags.is_off, flags.is_full) == (False, False)
+
+        with czekitout.config.local_validation_level("off"):
+            assert czekitout.config.get_validation_level() == "off"
+            assert (flags.is_off, flags.is_full) == (True, False)
+
+            czekitout.config.set_validation_level("fast")
+            assert czekitout.config.get_validation_level() == "off"
+
+        assert czekitout.config.get_validation_level() == "fast"
+
+    assert czekitout.config.get_validation_level() == "fast"
+    assert (flags.is_off, flags.is_full) == (False, False)
+
+    with pytest.raises(ValueError):
+        czekitout.config.local_validation_level("slow").__enter__()
+    assert czekitout.config.get_validation_level() == "fast"
+
+    with pytest.raises(KeyError):
+        with czekitout.config.local_validation_level("off"):
+            raise KeyError
+    assert czekitout.config.get_validation_level() == "fast"
+
+    return None
+
+
+
+def test_2_of_local_validation_level(restore_global_validation_level):
+    czekitout.config.set_validation_level("full")
+    levels_seen_by_other_thread = []
+    exceptions_raised_in_other_thread = []
+
+    def target():
+        level = czekitout.config.get_validation_level()
+        levels_seen_by_other_thread.append(level)
+        try:
+            czekitout.check.if_float(obj="a", obj_name="obj")
+        except TypeError as exception:
+            exceptions_raised_in_other_thread.append(exception)
+
+        return None
+
+    with czekitout.config.local_validation_level("off"):
+        czekitout.check.if_float(obj="a", obj_name="obj")
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+    assert levels_seen_by_other_thread == ["full"]
+    assert len(exceptions_raised_in_other_thread) == 1
+
+    # A context copied within the ``with`` block keeps the context-local
+    # validation level after the block is exited, and does not affect the
+    # current context.
+    flags = czekitout.config._validation_level_flags
+    with czekitout.config.local_validation_level("off"):
+        copied_context = contextvars.copy_context()
+    assert copied_context.run(lambda: flags.is_off)
+    assert not flags.is_off
+
+    return None
+
+
+
+def test_1_of_validation_level_flags(restore_global_validation_level,
+                                     monkeypatch):
+    flags = czekitout.config._validation_level_flags
+    ValidationLevelFlags = czekitout.config._ValidationLevelFlags
+    monkeypatch.setattr(flags, "__class__", ValidationLevelFlags)
+
+    czekitout.config.set_validation_level("off")
+    assert vars(flags) == {"is_off": True, "is_full": False}
+    assert (flags.is_off, flags.is_full) == (True, False)
+
+    with czekitout.config.local_validation_level("full"):
+        assert (flags.is_off, flags.is_full) == (False, True)
+    assert type(flags) is not ValidationLevelFlags
+    assert (flags.is_off, flags.is_full) == (True, False)
+
+    czekitout.config.set_validation_level("full")
+    assert (flags.is_off, flags.is_full) == (False, True)
+
+    return None
+
+
+
+def test_1_of_validation_level_from_env(monkeypatch):
+    env_var_name = "CZEKITOUT_VALIDATION_LEVEL"
+
+    monkeypatch.delenv(env_var_name, raising=False)
+    assert czekitout.config._validation_level_from_env() == "full"
+
+    for level in ("off", "fast", "full"):
+        monkeypatch.setenv(env_var_name, level)
+        assert czekitout.config._validation_level_from_env() == level
+
+    monkeypatch.setenv(env_var_name, "slow")
+    with pytest.raises(ValueError) as err_info:
+        czekitout.config._validation_level_from_env()
+    assert env_var_name in str(err_info.value)
+
+    return None
+
+
+
+def test_1_of_validation_levels(restore_global_validation_level):
+    array_with_nan = np.array([1.0, np.nan])
+    negative_array = np.array([[-1.0, 2.0]])
+
+    czekitout.config.set_validation_level("full")
+    assert not czekitout.isa.scalar_numpy_array(array_with_nan)
+    assert czekitout.isa.scalar_numpy_array(np.array([1], dtype="m8[s]"))
+    assert not czekitout.isa.scalar_numpy_array(np.array([1.0], dtype=object))
+    assert not czekitout.isa.nonnegative_numpy_matrix(negative_array)
+    with pytest.raises(ValueError):
+        czekitout.check.if_nonnegative_numpy_matrix(obj=negative_array,
+                                                    obj_name="obj")
+
+    czekitout.config.set_validation_level("fast")
+    assert not czekitout.isa.scalar_numpy_array(array_with_nan)
+    assert not czekitout.isa.nonnegative_numpy_matrix(negative_array)
+    czekitout.check.if_real_numpy_array(obj=array_with_nan, obj_name="obj")
+    result = czekitout.convert.to_real_numpy_array(array_with_nan, "obj")
+    assert result is array_with_nan
+    czekitout.check.if_nonnegative_numpy_matrix(obj=negative_array,
+                                                obj_name="obj")
+    invalid_objs = (np.array(["a"]),
+                    [1.0],
+                    np.array([1.0], dtype=object),
+                    np.array([1j]))
+    for invalid_obj in invalid_objs:
+        with pytest.raises(TypeError):
+            czekitout.check.if_real_numpy_array(obj=invalid_obj,
+                                                obj_name="obj")
+    czekitout.check.if_complex_numpy_array(obj=np.array([np.nan*1j]),
+                                           obj_name="obj")
+    with pytest.raises(TypeError):
+        czekitout.check.if_float(obj="a", obj_name="obj")
+
+    czekitout.config.set_validation_level("off")
+    czekitout.check.if_float(obj="a", obj_name="obj")
+    czekitout.check.if_instance_of_any_accepted_types(obj="a",
+                                                      obj_name="obj",
+                                                      accepted_types=(int,))
+    type_guard = czekitout.check.TypeGuard(accepted_types=(int,))
+    type_guard.check(obj="a", obj_name="obj")
+
+    return None
+
+
+
+def test_2_of_validation_levels(restore_global_validation_level):
+    objs = (2, 2.5, np.float32(1.5), np.int64(-3), True, "1.5", b"True", 1+0j)
+
+    czekitout.config.set_validation_level("full")
+    expected_results = tuple(czekitout.convert.to_float(obj, "obj")
+                             for obj
+                             in objs)
+
+    czekitout.config.set_validation_level("off")
+    for obj, expected_result in zip(objs, expected_results):
+        result = czekitout.convert.to_float(obj, "obj")
+        assert type(result) is float
+        assert result == expected_result
+
+    assert czekitout.convert.to_int(2.0, "obj") == 2
+    assert czekitout.convert.to_bool(1, "obj") is True
+
+    with pytest.raises(ValueError):
+        czekitout.convert.to_float(None, "obj")
+
+    return None
+
+
+
+def test_3_of_validation_levels(restore_global_validation_level):
+    czekitout.config.set_validation_level("off")
+
+    func_names = tuple(func_name
+                       for func_name
+                       in dir(czekitout.check)
+                       if func_name.startswith("if_"))
+
+    for func_name in func_names:
+        func_to_test = getattr(czekitout.check, func_name)
+        kwargs = {"obj": object(), "obj_name": None}
+        if func_name == "if_instance_of_any_accepted_types":
+            kwargs["accepted_types"] = None
+        elif func_name == "if_one_of_any_accepted_strings":
+            kwargs["accepted_strings"] = None
+        assert func_to_test(**kwargs) is None
+
+    return None
+
+
+
+def test_1_of_set_validation_stripping():
+    enabled = czekitout.config.get_validation_stripping()
+
+    for new_enabled in (True, False):
+        czekitout.config.set_validation_stripping(new_enabled)
+        assert czekitout.config.get_validation_stripping() is new_enabled
+
+    with pytest.raises(TypeError):
+        czekitout.config.set_validation_stripping(1)
+
+    czekitout.config.set_validation_stripping(enabled)
+
+    return None
+
+
+
+def test_1_of_validation_stripping_from_env(monkeypatch):
+    env_var_name = "CZEKITOUT_STRIP_VALIDATION"
+
+    monkeypatch.delenv(env_var_name, raising=False)
+    assert czekitout.config._validation_stripping_from_env() is False
+
+    for env_var_value, expected_result in (("0", False), ("1", True)):
+        monkeypatch.setenv(env_var_name, env_var_value)
+        result = czekitout.config._validation_stripping_from_env()
+        assert result is expected_result
+
+    monkeypatch.setenv(env_var_name, "yes")
+    with pytest.raises(ValueError) as err_info:
+        czekitout.config._validation_stripping_from_env()
+    assert env_var_name in str(err_info.value)
+
+    return None
+
+
+
+def test_1_of_set_error_aggregation():
+    enabled = czekitout.config.get_error_aggregation()
+    assert enabled is False
+
+    for new_enabled in (True, False):
+        czekitout.config.set_error_aggregation(new_enabled)
+        assert czekitout.config.get_error_aggregation() is new_enabled
+
+    with pytest.raises(TypeError):
+        czekitout.config.set_error_aggregation(None)
+
+    czekitout.config.set_error_aggregation(enabled)
+
+    return None
+
+
+
+def test_1_of_local_error_aggregation():
+    with czekitout.config.local_error_aggregation():
+        assert czekitout.config.get_error_aggregation() is True
+        with czekitout.config.local_error_aggregation(False):
+            assert czekitout.config.get_error_aggregation() is False
+        assert czekitout.config.get_error_aggregation() is True
+    assert czekitout.config.get_error_aggregation() is False
+
+    with pytest.raises(TypeError):
+        czekitout.config.local_error_aggregation(1).__enter__()
+
+    return None
+
+
+
+def test_1_of_set_max_num_reported_invalid_elems():
+    max_num = czekitout.config.get_max_num_reported_invalid_elems()
+    assert max_num == 100
+
+    czekitout.config.set_max_num_reported_invalid_elems(3)
+    assert czekitout.config.get_max_num_reported_invalid_elems() == 3
+
+    for new_max_num in (2.0, True, None):
+        with pytest.raises(TypeError):
+            czekitout.config.set_max_num_reported_invalid_elems(new_max_num)
+    for new_max_num in (0, -1):
+        with pytest.raises(ValueError):
+            czekitout.config.set_max_num_reported_invalid_elems(new_max_num)
+    assert czekitout.config.get_max_num_reported_invalid_elems() == 3
+
+    czekitout.config.set_max_num_reported_invalid_elems(max_num)
+
+    return None
+
+
+
+def test_1_of_set_dtype_policy():
+    dtype_policy = czekitout.config.get_dtype_policy()
+    assert dtype_policy == "preserve"
+
+    for new_dtype_policy in czekitout.config._accepted_dtype_policies:
+        czekitout.config.set_dtype_policy(new_dtype_policy)
+        assert czekitout.config.get_dtype_policy() == new_dtype_policy
+
+    for new_dtype_policy in ("float16", None):
+        with pytest.raises(ValueError):
+            czekitout.config.set_dtype_policy(new_dtype_policy)
+
+    czekitout.config.set_dtype_policy(dtype_policy)
+
+    return None
+
+
+
+def test_1_of_local_dtype_policy():
+    with czekitout.config.local_dtype_policy("float32"):
+        assert czekitout.config.get_dtype_policy() == "float32"
+        with czekitout.config.local_dtype_policy("minimal_lossless"):
+            assert czekitout.config.get_dtype_policy() == "minimal_lossless"
+        assert czekitout.config.get_dtype_policy() == "float32"
+    assert czekitout.config.get_dtype_policy() == "preserve"
+
+    with pytest.raises(ValueError):
+        czekitout.config.local_dtype_policy("float16").__enter__()
+
+    return None
+
+
+
+def test_1_of_set_validation_cache_path(tmp_path, monkeypatch):
+    path = czekitout.config.get_validation_cache_path()
+    assert path is None
+
+    new_path = tmp_path / "cache.sqlite"
+    czekitout.config.set_validation_cache_path(new_path)
+    assert czekitout.config.get_validation_cache_path() == str(new_path)
+
+    with pytest.raises(TypeError):
+        czekitout.config.set_validation_cache_path(3)
+    assert czekitout.config.get_validation_cache_path() == str(new_path)
+
+    czekitout.config.set_validation_cache_path(path)
+
+    env_var_name = "CZEKITOUT_VALIDATION_CACHE_PATH"
+    monkeypatch.delenv(env_var_name, raising=False)
+    assert czekitout.config._validation_cache_path_from_env() is None
+    monkeypatch.setenv(env_var_name, str(new_path))
+    assert czekitout.config._validation_cache_path_from_env() == str(new_path)
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
@@ -30,9 +30,15 @@ import inspect
 # For randomly selecting items in dictionaries.
 import random
 
+# For measuring the memory allocated by conversions.
+import tracemalloc
+
 # To create path objects.
 import pathlib
 
+# For creating objects that support the buffer protocol.
+import array
+
 
 
 # For general array handling.
@@ -46,6 +52,12 @@ import pytest
 # For converting objects.
 import czekitout.convert
 
+# For checking the postconditions of conversions.
+import czekitout.isa
+
+# For storing boolean arrays with one bit per element.
+import czekitout.packed
+
 
 
 ##################################
@@ -2567,6 +2579,581 @@ def expected_exception_map_of_test_1_of_to_complex_numpy_matrix(
 
 
 
+def test_2_of_to_complex_numpy_array():
+    obj = np.array([1+2j, 3-4j])
+    assert czekitout.convert.to_complex_numpy_array(obj, "obj") is obj
+
+    kwargs = {"obj": obj, "obj_name": "obj", "dtype": np.complex64}
+    result = czekitout.convert.to_complex_numpy_array(**kwargs)
+    assert result.dtype == np.complex64
+    assert np.array_equal(result, obj)
+
+    kwargs = {"obj": result, "obj_name": "obj"}
+    assert czekitout.convert.to_complex_numpy_array(**kwargs) is result
+
+    kwargs = {"obj": [[1, 2j]], "obj_name": "obj", "dtype": "complex64"}
+    result = czekitout.convert.to_complex_numpy_matrix(**kwargs)
+    assert result.dtype == np.complex64
+    assert result.tolist() == [[1, 2j]]
+
+    for dtype in ("float64", 5):
+        kwargs = {"obj": obj, "obj_name": "obj", "dtype": dtype}
+        with pytest.raises(ValueError):
+            czekitout.convert.to_complex_numpy_array(**kwargs)
+
+    obj = np.array([[1+2j, np.nan]])
+    for func_name in ("to_complex_numpy_array", "to_complex_numpy_matrix"):
+        func = getattr(czekitout.convert, func_name)
+        with pytest.raises(TypeError):
+            func(obj, "obj")
+        with pytest.raises(TypeError):
+            func(obj, "obj", dtype=np.complex64)
+
+    return None
+
+
+
+def test_1_of_dtype_policies():
+    func_names = ("to_real_numpy_array",
+                  "to_real_numpy_array_1d",
+                  "to_real_numpy_matrix",
+                  "to_real_numpy_array_3d",
+                  "to_nonnegative_numpy_array",
+                  "to_nonnegative_numpy_matrix")
+
+    for func_name in func_names:
+        func = getattr(czekitout.convert, func_name)
+        ndim = 1 if ("1d" in func_name) else 2 if ("matrix" in func_name) else 3
+        obj = np.arange(4, dtype=np.float32).reshape((4,)+(1,)*(ndim-1))
+
+        assert func(obj, "obj") is obj
+        assert func(obj, "obj", dtype_policy="float32") is obj
+
+        result = func(obj, "obj", dtype_policy="float64")
+        assert result.dtype == np.float64
+        assert np.array_equal(result, obj)
+
+        result = func(obj.tolist(), "obj")
+        assert result.dtype == np.float64
+        assert np.array_equal(result, obj)
+
+        with czekitout.config.local_dtype_policy("float32"):
+            result = func(obj.tolist(), "obj")
+            assert result.dtype == np.float32
+            result = func(obj, "obj", dtype_policy="preserve")
+            assert result is obj
+
+        with pytest.raises(ValueError):
+            func(obj, "obj", dtype_policy="float16")
+
+    return None
+
+
+
+def test_2_of_dtype_policies():
+    func = czekitout.convert.to_real_numpy_array
+    kwargs = {"obj_name": "obj", "dtype_policy": "minimal_lossless"}
+
+    objs_and_expected_dtypes = ((np.array([0, 255]), np.uint8),
+                                ([[-1, 200]], np.int16),
+                                (np.array([], dtype=np.int64), np.int64),
+                                (np.array([True, False]), np.bool_),
+                                ([0.5, -2.0, np.inf], np.float16),
+                                ([0.5, 1.0e5+0.5], np.float32),
+                                (np.array([0.1]), np.float64),
+                                (np.array([0.1], dtype=np.float32), np.float32),
+                                (np.array([1.0e300]), np.float64),
+                                (np.array([0.5], dtype=np.float16), np.float16))
+
+    for obj, expected_dtype in objs_and_expected_dtypes:
+        result = func(obj, **kwargs)
+        assert result.dtype == expected_dtype
+        assert np.array_equal(result, obj)
+
+    obj = np.array([1, 2], dtype=np.uint8)
+    assert func(obj, **kwargs) is obj
+
+    with czekitout.config.local_validation_level("fast"):
+        obj = np.array([0.5, np.nan])
+        assert func(obj, **kwargs).dtype == np.float16
+
+    for obj in (["1.5"], [1+1j], np.array([-1.0])):
+        with pytest.raises((TypeError, ValueError)):
+            czekitout.convert.to_nonnegative_numpy_array(obj, **kwargs)
+
+    return None
+
+
+
+def test_3_of_dtype_policies():
+    func = czekitout.convert.to_real_numpy_matrix
+    expected_result = np.arange(1000*100.0).reshape((1000, 100))
+    obj = expected_result.tolist()
+
+    for dtype_policy in ("preserve", "float64", "float32"):
+        func(obj[:1], "obj", dtype_policy=dtype_policy)
+        tracemalloc.start()
+        result = func(obj, "obj", dtype_policy=dtype_policy)
+        _, peak_num_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert peak_num_bytes < 1.25*result.nbytes
+        assert np.array_equal(result, expected_result)
+
+    result = func(tuple(obj), "obj", order="F")
+    assert result.flags.f_contiguous
+    assert np.array_equal(result, expected_result)
+
+    func = czekitout.convert.to_nonnegative_numpy_array
+    result = func([True, 2, 3.5], "obj", dtype_policy="float32")
+    assert result.dtype == np.float32
+    assert result.tolist() == [1.0, 2.0, 3.5]
+    assert func([[]], "obj").shape == (1, 0)
+
+    invalid_objs = (["1.5"],
+                    [1+1j],
+                    [None],
+                    [2**70],
+                    [[1.0], [2.0, 3.0]],
+                    [[1.0, 2.0], [3.0]],
+                    [[1.0], [[2.0]]],
+                    [-1.0],
+                    [np.nan])
+    for invalid_obj in invalid_objs:
+        with pytest.raises((TypeError, ValueError)):
+            func(invalid_obj, "obj")
+
+    # Objects that expose their data via the buffer protocol keep their dtypes
+    # under the policy ``"preserve"``, like numpy arrays do.
+    func = czekitout.convert.to_real_numpy_array_1d
+    for obj, expected_dtype in ((bytearray(b"ab"), np.uint8),
+                                (array.array("i", [1, 2]), np.int32)):
+        result = func(obj, "obj")
+        assert result.dtype == expected_dtype
+        assert result.tolist() == list(obj)
+        result = func(obj, "obj", dtype_policy="float64")
+        assert result.dtype == np.float64
+
+    return None
+
+
+
+def test_1_of_copy_semantics():
+    objs = {"to_real_two_column_numpy_matrix": np.ones((3, 2)),
+            "to_numpy_array": np.ones((3,)),
+            "to_real_numpy_array": np.ones((3,)),
+            "to_real_numpy_array_1d": np.ones((3,)),
+            "to_real_numpy_matrix": np.ones((3, 3)),
+            "to_real_numpy_array_3d": np.ones((3, 3, 3)),
+            "to_nonnegative_numpy_array": np.ones((3,)),
+            "to_nonnegative_numpy_matrix": np.ones((3, 3)),
+            "to_bool_numpy_matrix": np.ones((3, 3), dtype=bool),
+            "to_bool_numpy_array_3d": np.ones((3, 3, 3), dtype=bool),
+            "to_complex_numpy_array": np.ones((3,), dtype=complex),
+            "to_complex_numpy_matrix": np.ones((3, 3), dtype=complex)}
+
+    for func_name, obj in objs.items():
+        func = getattr(czekitout.convert, func_name)
+
+        assert func(obj, "obj") is obj
+        assert func(obj, "obj", copy=False) is obj
+
+        result = func(obj, "obj", copy=True)
+        assert not np.shares_memory(result, obj)
+        assert np.array_equal(result, obj)
+
+        result = func(obj, "obj", readonly=True)
+        assert np.shares_memory(result, obj)
+        assert not result.flags.writeable
+        assert obj.flags.writeable
+
+        result = func(obj, "obj", copy=True, readonly=True)
+        assert not np.shares_memory(result, obj)
+        assert result.flags.writeable
+
+        result = func(obj.tolist(), "obj", readonly=True)
+        assert result.flags.writeable
+        assert np.array_equal(result, obj)
+
+        with pytest.raises(ValueError) as err_info:
+            func(obj.tolist(), "obj", copy=False)
+        assert "copy" in str(err_info.value)
+
+        for copy in ("never", 2.5):
+            with pytest.raises(TypeError):
+                func(obj, "obj", copy=copy)
+
+        with pytest.raises(TypeError):
+            func(obj, "obj", readonly=None)
+
+    obj = np.ones((3,), dtype=np.float32)
+    func = czekitout.convert.to_real_numpy_array
+    with pytest.raises(ValueError):
+        func(obj, "obj", dtype_policy="float64", copy=False)
+    func = czekitout.convert.to_complex_numpy_array
+    with pytest.raises(ValueError):
+        func(obj, "obj", copy=False)
+
+    obj = memoryview(np.ones((3,), dtype=complex))
+    result = func(obj, "obj")
+    assert np.shares_memory(result, obj)
+    assert np.shares_memory(func(obj, "obj", copy=False), obj)
+    result = func(obj, "obj", copy=True)
+    assert not np.shares_memory(result, obj)
+
+    return None
+
+
+
+def test_1_of_memory_layouts():
+    func = czekitout.convert.to_real_numpy_matrix
+
+    obj = np.ones((4, 3))
+    assert func(obj, "obj", order="C", align=1) is obj
+
+    result = func(obj, "obj", order="F")
+    assert result.flags.f_contiguous and (not result.flags.c_contiguous)
+    assert np.array_equal(result, obj)
+
+    result = func(obj.T, "obj", align=64)
+    assert result.ctypes.data % 64 == 0
+    assert result.flags.f_contiguous
+    assert np.array_equal(result, obj.T)
+
+    result = func(obj[:, ::2], "obj", order="C", align=64)
+    assert result.ctypes.data % 64 == 0
+    assert result.flags.c_contiguous
+    assert np.array_equal(result, obj[:, ::2])
+
+    result = func(obj.tolist(), "obj", order="F")
+    assert result.flags.f_contiguous and (result.base is None)
+
+    kwargs = {"obj": obj.tolist(),
+              "obj_name": "obj",
+              "dtype_policy": "float32",
+              "order": "F",
+              "align": 128}
+    result = func(**kwargs)
+    assert result.dtype == np.float32
+    assert result.flags.f_contiguous and (result.ctypes.data % 128 == 0)
+    assert np.array_equal(result, obj)
+
+    for align in (8, 16, 32, 64, 128, 256):
+        byte_buffer = np.zeros(8*12+2*align, dtype=np.uint8)
+        offset = (-byte_buffer.ctypes.data) % align + (align//2)
+        byte_buffer = byte_buffer[offset:offset+8*12]
+        obj = byte_buffer.view(np.float64).reshape((4, 3))
+        result = func(obj, "obj", align=align)
+        assert result is not obj
+        assert result.ctypes.data % align == 0
+        assert func(result, "obj", align=align) is result
+        with pytest.raises(ValueError):
+            func(obj, "obj", align=align, copy=False)
+
+    obj = np.zeros((0, 3))
+    assert func(obj, "obj", align=64) is obj
+
+    func = czekitout.convert.to_complex_numpy_matrix
+    obj = np.ones((4, 3), dtype=complex)
+    result = func(obj, "obj", order="F", readonly=True)
+    assert result.flags.f_contiguous and result.flags.writeable
+    assert np.array_equal(result, obj)
+    result = func(obj.T, "obj", order="F", copy=False)
+    assert np.shares_memory(result, obj)
+
+    for order in ("K", "c", None):
+        with pytest.raises((TypeError, ValueError)):
+            func(obj, "obj", order=order)
+    for align in (3, 0, 2.5):
+        with pytest.raises((TypeError, ValueError)):
+            func(obj, "obj", align=align)
+
+    return None
+
+
+
+def test_1_of_out():
+    frames = (np.full((8, 64, 64), 2.0), np.ones((8, 64, 64), dtype=np.uint16))
+    out = np.empty((8, 64, 64))
+    func = czekitout.convert.to_real_numpy_array_3d
+
+    for frame in frames:
+        assert func(frame, "frame", out=out) is out
+        assert np.array_equal(out, frame)
+
+    bool_frame = np.ones((8, 64, 64), dtype=bool)
+    bool_out = np.zeros((8, 64, 64), dtype=bool)
+    bool_func = czekitout.convert.to_bool_numpy_array_3d
+    assert bool_func(bool_frame, "bool_frame", out=bool_out) is bool_out
+    assert bool_out.all()
+
+    tracemalloc.start()
+    for _ in range(10):
+        for frame in frames:
+            func(frame, "frame", out=out)
+        bool_func(bool_frame, "bool_frame", out=bool_out)
+    _, peak_num_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak_num_bytes < frames[0].nbytes // 16
+
+    kwargs = {"obj": [[1, 2], [3, 4]],
+              "obj_name": "obj",
+              "out": np.empty((2, 2), dtype=np.float32, order="F"),
+              "order": "F"}
+    result = czekitout.convert.to_real_numpy_matrix(**kwargs)
+    assert result is kwargs["out"]
+    assert result.tolist() == [[1, 2], [3, 4]]
+
+    func = czekitout.convert.to_complex_numpy_array
+    invalid_kwargs_sets = ({"out": [0j, 0j]},
+                           {"out": np.zeros((3,), dtype=complex)},
+                           {"out": np.zeros((2,))},
+                           {"out": np.zeros((2,), dtype=complex),
+                            "copy": False},
+                           {"out": np.zeros((4,), dtype=complex)[::2],
+                            "order": "C"},
+                           {"out": np.zeros((2,), dtype=complex),
+                            "align": 2**20})
+    invalid_kwargs_sets[-2]["out"].flags.writeable = False
+    for invalid_kwargs in invalid_kwargs_sets:
+        with pytest.raises((TypeError, ValueError)):
+            func([1j, 2j], "obj", **invalid_kwargs)
+
+    return None
+
+
+
+class _ArrayInterfaceExporter():
+    def __init__(self, array):
+        self.array = array
+        self.__array_interface__ = array.__array_interface__
+
+        return None
+
+
+
+class _ArrayStructExporter():
+    def __init__(self, array):
+        self.array = array
+
+        return None
+
+
+
+    @property
+    def __array_struct__(self):
+        result = self.array.__array_struct__
+
+        return result
+
+
+
+class _DLPackExporter():
+    def __init__(self, array):
+        self.array = array
+
+        return None
+
+
+
+    def __dlpack__(self, **kwargs):
+        result = self.array.__dlpack__(**kwargs)
+
+        return result
+
+
+
+class _BrokenDLPackList(list):
+    def __dlpack__(self, **kwargs):
+        raise RuntimeError
+
+
+
+def test_1_of_zero_copy_ingestion():
+    source = np.arange(6, dtype=np.float32).reshape((2, 3))
+    exporters = (memoryview(source),
+                 _ArrayInterfaceExporter(source),
+                 _ArrayStructExporter(source),
+                 _DLPackExporter(source))
+    func = czekitout.convert.to_real_numpy_matrix
+
+    for exporter in exporters:
+        result = func(exporter, "exporter")
+        assert np.shares_memory(result, source)
+        assert result.dtype == np.float32
+        assert np.array_equal(result, source)
+
+        result = func(exporter, "exporter", copy=False, readonly=True)
+        assert np.shares_memory(result, source)
+        assert not result.flags.writeable
+
+        result = func(exporter, "exporter", dtype_policy="float64")
+        assert not np.shares_memory(result, source)
+        assert np.array_equal(result, source)
+
+    obj = array.array("d", [1.0, 2.5])
+    result = czekitout.convert.to_real_numpy_array_1d(obj, "obj", copy=False)
+    result[0] = 3.0
+    assert obj[0] == 3.0
+
+    obj = bytearray(b"ab")
+    result = czekitout.convert.to_numpy_array(obj, "obj", copy=False)
+    assert result.tolist() == [97, 98]
+
+    result = czekitout.convert.to_numpy_array(b"ab", "obj")
+    assert result.dtype.kind == "S"
+
+    obj = _BrokenDLPackList([[1.0, 2.0]])
+    result = czekitout.convert.to_real_numpy_matrix(obj, "obj")
+    assert result.tolist() == [[1.0, 2.0]]
+
+    source = np.array([[True, False]])
+    func = czekitout.convert.to_bool_numpy_matrix
+    assert np.shares_memory(func(memoryview(source), "obj"), source)
+    func_3d = czekitout.convert.to_bool_numpy_array_3d
+    source_3d = source[None]
+    assert np.shares_memory(func_3d(memoryview(source_3d), "obj"), source)
+    obj = memoryview(np.array([[1, 0]], dtype=np.uint8))
+    result = func(obj, "obj")
+    assert (result.dtype == bool) and (result.tolist() == [[True, False]])
+
+    source = np.array([[1+2j, 3-4j]])
+    func = czekitout.convert.to_complex_numpy_matrix
+    result = func(_DLPackExporter(source), "obj", copy=False)
+    assert np.shares_memory(result, source)
+
+    return None
+
+
+
+def test_1_of_packed_bool_output():
+    mask = (np.arange(3*4*13).reshape((3, 4, 13)) % 3) == 0
+    func = czekitout.convert.to_bool_numpy_array_3d
+
+    for obj in (mask, mask.tolist(), memoryview(mask.astype(np.uint8))):
+        result = func(obj, "mask", packed=True)
+        assert isinstance(result, czekitout.packed.PackedBoolArray)
+        assert result.shape == mask.shape
+        assert result.nbytes == 3*4*2
+        assert np.array_equal(result.unpack(), mask)
+
+    large_mask = np.ones((16, 64, 64), dtype=bool)
+    obj = large_mask.tolist()
+    tracemalloc.start()
+    func(obj, "large_mask", packed=True)
+    _, peak_num_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak_num_bytes < large_mask.nbytes // 2
+
+    out = np.empty((3, 4, 2), dtype=np.uint8)
+    result = func(mask, "mask", packed=True, out=out)
+    assert result.data is out
+    result = func(mask, "mask", packed=True, order="F", align=64)
+    assert result.data.flags.f_contiguous
+    assert np.array_equal(result.unpack(), mask)
+
+    func = czekitout.convert.to_bool_numpy_matrix
+    result = func(mask[0].tolist(), "mask", packed=True)
+    assert np.array_equal(result.unpack(), mask[0])
+    assert func([], "mask", packed=True).shape == (0,)
+
+    invalid_kwargs_sets = ({"obj": [[True], [True, False]]},
+                           {"obj": mask[0], "copy": False},
+                           {"obj": mask[0], "out": np.empty((3, 4), bool)},
+                           {"obj": mask[0], "packed": None})
+    for invalid_kwargs in invalid_kwargs_sets:
+        kwargs = {"obj_name": "mask", "packed": True, **invalid_kwargs}
+        with pytest.raises((TypeError, ValueError)):
+            func(**kwargs)
+
+    func = czekitout.convert.to_bool_numpy_array_3d
+    ragged_objs = ([[[True, False], [True]], [[True, False], [False, True]]],
+                   [[[True, False], [True, False]], [[True, False]]])
+    for ragged_obj in ragged_objs:
+        with pytest.raises(czekitout.errors.ValidationValueError) as err_info:
+            func(ragged_obj, "mask", packed=True)
+        assert "``mask``" in str(err_info.value)
+
+    return None
+
+
+
+def test_1_of_masked_arrays():
+    data = np.array([[1.0, np.nan, -2.0], [3.0, 4.0, 5.0]])
+    obj = np.ma.MaskedArray(data, mask=(np.isnan(data) | (data < 0)))
+    func = czekitout.convert.to_nonnegative_numpy_matrix
+
+    with pytest.raises((TypeError, ValueError)):
+        func(obj, "obj")
+
+    obj_without_nan = np.ma.MaskedArray(np.nan_to_num(np.abs(data)),
+                                         mask=obj.mask)
+    result = func(obj_without_nan, "obj")
+    assert type(result) is np.ndarray
+    assert np.shares_memory(result, obj_without_nan.data)
+    assert czekitout.isa.nonnegative_numpy_matrix(result)
+
+    result = func(obj, "obj", preserve_mask=True)
+    assert isinstance(result, np.ma.MaskedArray)
+    assert np.shares_memory(result.data, data)
+    assert np.shares_memory(result.mask, obj.mask)
+
+    result = func(obj, "obj", preserve_mask=True, copy=True)
+    assert not np.shares_memory(result.data, data)
+    assert not np.shares_memory(result.mask, obj.mask)
+    assert np.array_equal(result.mask, obj.mask)
+
+    func = czekitout.convert.to_real_numpy_array
+    out = np.empty((2, 3), dtype=np.float32)
+    result = func(obj, "obj", preserve_mask=True, out=out)
+    assert np.shares_memory(result.data, out)
+    assert result.tolist() == [[1.0, None, None], [3.0, 4.0, 5.0]]
+
+    obj = np.ma.MaskedArray([1000, 1, 2], mask=[True, False, False])
+    result = func(obj, "obj", dtype_policy="minimal_lossless", copy=True)
+    assert result.tolist() == [1000, 1, 2]
+
+    obj = np.ma.MaskedArray([1.0, 2.0])
+    result = func(obj, "obj", preserve_mask=True, copy=True)
+    assert result.mask is np.ma.nomask
+
+    kwargs = {"obj": np.ma.MaskedArray([[True]]),
+              "obj_name": "obj",
+              "packed": True,
+              "preserve_mask": True}
+    with pytest.raises(ValueError):
+        czekitout.convert.to_bool_numpy_matrix(**kwargs)
+
+    with pytest.raises(TypeError):
+        func(obj, "obj", preserve_mask=None)
+
+    return None
+
+
+
+def test_2_of_masked_arrays():
+    obj = np.ma.MaskedArray([1.0, -5.0, np.nan, 3.0], mask=[0, 1, 1, 0])
+    funcs_and_isa_funcs = ((czekitout.convert.to_real_numpy_array,
+                            czekitout.isa.real_numpy_array),
+                           (czekitout.convert.to_nonnegative_numpy_array,
+                            czekitout.isa.nonnegative_numpy_array))
+
+    for func, isa_func in funcs_and_isa_funcs:
+        with pytest.raises((TypeError, ValueError)):
+            func(obj, "obj")
+
+        result = func(obj, "obj", preserve_mask=True)
+        assert isinstance(result, np.ma.MaskedArray)
+        assert isa_func(result)
+
+        valid_obj = np.ma.MaskedArray([1.0, 5.0, 2.0, 3.0], mask=obj.mask)
+        result = func(valid_obj, "obj")
+        assert type(result) is np.ndarray
+        assert isa_func(result)
+
+    return None
+
+
+
 ###########################
 ## Define error messages ##
 ###########################
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.decorators`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For inspecting the signatures of functions.
+import inspect
+
+
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For the top-level namespace of the package.
+import czekitout
+
+# For enabling and disabling validation stripping.
+import czekitout.config
+
+# For validating objects.
+import czekitout.check
+
+# For decorating functions.
+import czekitout.decorators
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+@czekitout.validated(a="to_positive_float",
+                     b=czekitout.check.if_str_like,
+                     c="to_str_from_str_like",
+                     d="to_int",
+                     e="if_bool")
+def _func_to_decorate(a, /, b="x", c=None, *args, d=1, e=False, **kwargs):
+    return a, b, c, args, d, e, kwargs
+
+
+
+class _ClassWithDecoratedMethod():
+    @czekitout.validated(x="to_float")
+    def method(self, x):
+        return x
+
+
+
+@pytest.fixture
+def restore_validation_stripping():
+    enabled = czekitout.config.get_validation_stripping()
+    yield None
+    czekitout.config.set_validation_stripping(enabled)
+
+    return None
+
+
+
+def test_1_of_validated():
+    func_to_test = _func_to_decorate
+
+    assert czekitout.validated is czekitout.decorators.validated
+    assert func_to_test.__name__ == "_func_to_decorate"
+    assert (tuple(inspect.signature(func_to_test).parameters)
+            == ("a", "b", "c", "args", "d", "e", "kwargs"))
+
+    expected_result = (2.0, "x", None, tuple(), 1, False, dict())
+    assert func_to_test(2) == expected_result
+
+    expected_result = (2.0, b"y", "z", (5,), 3, 1, {"f": "6"})
+    kwargs = {"d": 3.0, "e": 1, "f": "6"}
+    assert func_to_test("2", b"y", b"z", 5, **kwargs) == expected_result
+
+    expected_result = (2.0, "y", None, tuple(), 1, False, dict())
+    assert func_to_test(2, b="y") == expected_result
+
+    with pytest.raises(ValueError) as err_info:
+        func_to_test(-2)
+    expected_err_msg = "The object ``a`` must be a positive real number."
+    assert str(err_info.value) == expected_err_msg
+
+    with pytest.raises(TypeError):
+        func_to_test(2, b=3)
+    with pytest.raises(TypeError):
+        func_to_test(2, 3)
+    with pytest.raises(TypeError):
+        func_to_test(2, e="a")
+
+    obj = _ClassWithDecoratedMethod()
+    assert obj.method(3) == 3.0
+    assert type(obj.method(x=3)) is float
+
+    return None
+
+
+
+def test_2_of_validated(restore_validation_stripping):
+    func_to_test = _func_to_decorate
+
+    czekitout.config.set_validation_stripping(True)
+    expected_result = (-2, 3, None, tuple(), 1, False, dict())
+    assert func_to_test(-2, 3) == expected_result
+
+    czekitout.config.set_validation_stripping(False)
+    with pytest.raises(ValueError):
+        func_to_test(-2, 3)
+
+    return None
+
+
+
+def test_3_of_validated():
+    def func(a, *args, b=1, **kwargs):
+        return None
+
+    for param_name in ("args", "kwargs", "c"):
+        decorator = czekitout.validated(**{param_name: "to_float"})
+        with pytest.raises(ValueError) as err_info:
+            decorator(func)
+        assert "``{}``".format(param_name) in str(err_info.value)
+
+    assert czekitout.validated(a="to_float", b="to_int")(func)(2) is None
+
+    with pytest.raises(TypeError):
+        czekitout.validated(a=3)
+
+    with pytest.raises(TypeError):
+        czekitout.validated(a="to_float")(3)
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.errors`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For pickling and unpickling exceptions.
+import pickle
+
+
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For validating objects.
+import czekitout.check
+
+# For enabling error aggregation.
+import czekitout.config
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+def test_1_of_ValidationError():
+    cls_set = (czekitout.errors.ValidationTypeError,
+               czekitout.errors.ValidationValueError)
+    builtin_exception_set = (TypeError, ValueError)
+
+    unformatted_err_msg = czekitout.check._if_float_err_msg_1
+    obj_name = "obj"
+    expected_err_msg = unformatted_err_msg.format(obj_name)
+
+    zip_obj = zip(cls_set, builtin_exception_set)
+    for cls, builtin_exception in zip_obj:
+        exception = cls(unformatted_err_msg, obj_name)
+
+        assert isinstance(exception, czekitout.errors.ValidationError)
+        assert isinstance(exception, builtin_exception)
+        assert exception.unformatted_err_msg == unformatted_err_msg
+        assert exception.format_args == (obj_name,)
+        assert exception._err_msg is None
+        assert str(exception) == expected_err_msg
+        assert exception._err_msg == expected_err_msg
+        assert str(exception) == expected_err_msg
+        assert exception.args == (expected_err_msg,)
+        assert exception.args[0] == str(exception)
+        assert repr(exception) == "{}({!r})".format(cls.__name__,
+                                                    expected_err_msg)
+
+        unpickled_exception = pickle.loads(pickle.dumps(exception))
+        assert type(unpickled_exception) is cls
+        assert str(unpickled_exception) == expected_err_msg
+        assert unpickled_exception.format_args == (obj_name,)
+
+    return None
+
+
+
+def test_2_of_ValidationError():
+    unformatted_err_msg = czekitout.check._if_positive_float_seq_err_msg_1
+
+    kwargs = {"obj": [1, -2], "obj_name": "obj"}
+    with pytest.raises(czekitout.errors.ValidationValueError) as err_info:
+        czekitout.check.if_positive_float_seq(**kwargs)
+    assert err_info.value.unformatted_err_msg == unformatted_err_msg
+    assert str(err_info.value) == unformatted_err_msg.format("obj")
+
+    kwargs = {"obj": [1, "a"], "obj_name": "obj"}
+    with pytest.raises(czekitout.errors.ValidationTypeError) as err_info:
+        czekitout.check.if_positive_float_seq(**kwargs)
+    assert str(err_info.value) == unformatted_err_msg.format("obj")
+
+    return None
+
+
+
+def test_1_of_SchemaValidationError():
+    cls_alias = czekitout.errors.SchemaValidationError
+
+    unformatted_err_msg = "The object ``{}`` is invalid:\n{}"
+    errors = {"a": czekitout.errors.ValidationTypeError("Error ``{}``.", "a"),
+              "b": czekitout.errors.ValidationValueError("Error ``{}``.", "b")}
+    exception = cls_alias(unformatted_err_msg, "params", errors)
+
+    expected_err_msg = ("The object ``params`` is invalid:\n"
+                        "    * Error ``a``.\n"
+                        "    * Error ``b``.")
+
+    assert isinstance(exception, TypeError)
+    assert isinstance(exception, ValueError)
+    assert exception.errors is errors
+    assert exception.format_args == ("params", errors)
+    assert str(exception) == expected_err_msg
+    assert str(exception) == expected_err_msg
+
+    unpickled_exception = pickle.loads(pickle.dumps(exception))
+    assert type(unpickled_exception) is cls_alias
+    assert str(unpickled_exception) == expected_err_msg
+    assert tuple(unpickled_exception.errors.keys()) == ("a", "b")
+
+    return None
+
+
+
+def test_3_of_ValidationError():
+    kwargs = {"obj": [1, "a", -2, None], "obj_name": "obj"}
+    with pytest.raises(czekitout.errors.ValidationTypeError) as err_info:
+        czekitout.check.if_nonnegative_float_seq(**kwargs)
+    assert err_info.value.num_invalid_elems is None
+    assert err_info.value.invalid_elem_indices is None
+    assert err_info.value.invalid_elems is None
+
+    with czekitout.config.local_error_aggregation():
+        with pytest.raises(czekitout.errors.ValidationTypeError) as err_info:
+            czekitout.check.if_nonnegative_float_seq(**kwargs)
+    exception = err_info.value
+    assert exception.num_invalid_elems == 3
+    assert exception.invalid_elem_indices.tolist() == [1, 2, 3]
+    assert exception.invalid_elems == ("a", -2, None)
+
+    unformatted_err_msg = czekitout.check._if_nonnegative_float_seq_err_msg_1
+    expected_err_msg = (unformatted_err_msg.format("obj")
+                        + " The invalid elements are at the indices ``[1, 2, "
+                        "3]``, and are ``['a', -2, None]``.")
+    assert str(exception) == expected_err_msg
+
+    unpickled_exception = pickle.loads(pickle.dumps(exception))
+    assert unpickled_exception.invalid_elems == ("a", -2, None)
+    assert str(unpickled_exception) == expected_err_msg
+
+    return None
+
+
+
+def test_4_of_ValidationError():
+    max_num = czekitout.config.get_max_num_reported_invalid_elems()
+    czekitout.config.set_max_num_reported_invalid_elems(2)
+
+    kwargs = {"obj": np.arange(10) + 0.5, "obj_name": "obj"}
+    with czekitout.config.local_error_aggregation():
+        with pytest.raises(czekitout.errors.ValidationTypeError) as err_info:
+            czekitout.check.if_int_seq(**kwargs)
+    exception = err_info.value
+    assert exception.num_invalid_elems == 10
+    assert exception.invalid_elem_indices.tolist() == [0, 1]
+    assert exception.invalid_elems == (0.5, 1.5)
+    assert str(exception).endswith("There are 10 invalid elements in total, "
+                                   "the first 2 of which are at the indices "
+                                   "``[0, 1]``, and are ``[0.5, 1.5]``.")
+
+    czekitout.config.set_max_num_reported_invalid_elems(max_num)
+
+    return None
+
+
+
+def test_5_of_ValidationError():
+    check_func_names_and_objs = \
+        (("if_str_like_seq", ["a", 1, "b"], [1]),
+         ("if_float_seq", (1, 2j, 3), [1]),
+         ("if_positive_float_seq", [1, 0, -1], [1, 2]),
+         ("if_positive_int_seq", [1, 0, 2.5], [1, 2]),
+         ("if_nonnegative_int_seq", [1, -1, 2], [1]),
+         ("if_bool_seq", np.array([0, 1, 2]), [2]),
+         ("if_pairs_of_floats", [(1, 2), (3, 4j)], [1]),
+         ("if_pairs_of_ints", [(1, 2), (3,), (4, 5)], [1]),
+         ("if_pairs_of_ints", [(1, 2.5), (3, 4)], [0]),
+         ("if_pairs_of_nonnegative_ints", [(1, -2), (3, 4)], [0]),
+         ("if_nonnegative_numpy_array", np.array([[1, -1], [-2, 2]]), [1, 2]),
+         ("if_nonnegative_numpy_matrix", np.array([[-1, 1]]), [0]))
+
+    for check_func_name, obj, expected_indices in check_func_names_and_objs:
+        check_func = getattr(czekitout.check, check_func_name)
+        with czekitout.config.local_error_aggregation():
+            with pytest.raises((TypeError, ValueError)) as err_info:
+                check_func(obj, "obj")
+        exception = err_info.value
+        assert exception.invalid_elem_indices.tolist() == expected_indices
+
+    for obj in (None, 5, (elem for elem in (1, "a"))):
+        with czekitout.config.local_error_aggregation():
+            with pytest.raises(TypeError) as err_info:
+                czekitout.check.if_float_seq(obj, "obj")
+        assert err_info.value.invalid_elem_indices is None
+
+    return None
+
+
+
+def test_6_of_ValidationError():
+    with pytest.raises(TypeError) as err_info:
+        try:
+            czekitout.check.if_float("a", "obj")
+        except TypeError as err:
+            err.args = ("In the config: " + err.args[0],)
+            raise
+    exception = err_info.value
+
+    expected_err_msg = ("In the config: "
+                        "The object ``obj`` must be a real number.")
+    assert exception.args == (expected_err_msg,)
+    assert str(exception) == expected_err_msg
+    expected_repr = "ValidationTypeError({!r})".format(expected_err_msg)
+    assert repr(exception) == expected_repr
+
+    unpickled_exception = pickle.loads(pickle.dumps(exception))
+    assert unpickled_exception.args == (expected_err_msg,)
+    assert str(unpickled_exception) == expected_err_msg
+
+    exception.args = ("a", 1)
+    assert exception.args == ("a", 1)
+    assert str(exception) == str(("a", 1))
+
+    exception.args = []
+    assert exception.args == tuple()
+    assert str(exception) == ""
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.incremental`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For overriding the validation level.
+import czekitout.config
+
+# For type-checking objects.
+import czekitout.isa
+
+# For validating numpy arrays incrementally.
+import czekitout.incremental
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+def test_1_of_GrowingArrayValidator(monkeypatch):
+    buffer = np.zeros((10, 2))
+    kwargs = {"buffer": buffer,
+              "obj_name": "buffer",
+              "check_func_name": "if_nonnegative_numpy_matrix"}
+    validator = czekitout.incremental.GrowingArrayValidator(**kwargs)
+    assert validator.buffer is buffer
+    assert validator.num_validated_elems == 0
+
+    scanned_sizes = []
+    nonnegative_numpy_array = czekitout.isa.nonnegative_numpy_array
+
+    def recording_nonnegative_numpy_array(obj):
+        scanned_sizes.append(len(obj))
+        result = nonnegative_numpy_array(obj)
+
+        return result
+
+    monkeypatch.setattr(validator,
+                        "_elem_isa_func",
+                        recording_nonnegative_numpy_array)
+
+    for num_elems in range(1, 5):
+        buffer[num_elems-1] = num_elems
+        result = validator.check(num_elems)
+        assert np.shares_memory(result, buffer)
+        assert len(result) == num_elems
+    assert scanned_sizes == [1, 1, 1, 1]
+    assert validator.num_validated_elems == 4
+
+    assert len(validator.check(2)) == 2
+    assert validator.num_validated_elems == 4
+
+    buffer[4:7] = ((1, 1), (-1, 1), (1, 1))
+    with pytest.raises(ValueError) as err_info:
+        validator.check(7)
+    assert "``buffer[4:7]``" in str(err_info.value)
+    assert validator.num_validated_elems == 4
+
+    with czekitout.config.local_validation_level("fast"):
+        validator.check(7)
+    assert validator.num_validated_elems == 4
+
+    buffer[5] = 0
+    validator.check(7)
+    assert validator.num_validated_elems == 7
+
+    validator.reset(9)
+    assert validator.num_validated_elems == 7
+    validator.reset(5)
+    assert validator.num_validated_elems == 5
+    validator.reset()
+    assert validator.num_validated_elems == 0
+
+    for num_elems in (-1, 11, 2.5):
+        with pytest.raises((TypeError, ValueError)):
+            validator.check(num_elems)
+
+    return None
+
+
+
+def test_2_of_GrowingArrayValidator():
+    buffer = np.arange(4.0)
+    kwargs = {"buffer": buffer,
+              "obj_name": "buffer",
+              "check_func_name": "if_real_numpy_array_1d"}
+    validator = czekitout.incremental.GrowingArrayValidator(**kwargs)
+    validator.check(4)
+
+    new_buffer = np.zeros(8)
+    new_buffer[:4] = buffer
+    validator.rebind(new_buffer)
+    assert validator.buffer is new_buffer
+    assert validator.num_validated_elems == 4
+
+    validator.rebind(buffer[:2])
+    assert validator.num_validated_elems == 2
+
+    invalid_buffers = (np.zeros((2, 2)), np.array(1.0), [1.0], np.array(["a"]))
+    for invalid_buffer in invalid_buffers:
+        with pytest.raises(TypeError):
+            validator.rebind(invalid_buffer)
+
+    kwargs["check_func_name"] = "if_bool"
+    with pytest.raises(ValueError):
+        czekitout.incremental.GrowingArrayValidator(**kwargs)
+
+    return None
+
+
+
+def test_1_of_FrameStackValidator():
+    frames = np.arange(3*2*4, dtype=np.float32).reshape((3, 2, 4))
+
+    kwargs = {"obj_name": "stack",
+              "frame_convert_func_name": "to_nonnegative_numpy_matrix"}
+    validator = czekitout.incremental.FrameStackValidator(**kwargs)
+    assert (validator.frame_shape, validator.dtype) == (None, None)
+    assert validator.stack is None
+
+    frame = frames[0]
+    assert validator.push(frame) is frame
+    assert validator.frame_shape == (2, 4)
+    assert validator.dtype == np.float32
+
+    with pytest.raises(ValueError) as err_info:
+        validator.push(-frames[1])
+    assert "``stack[1]``" in str(err_info.value)
+    assert validator.num_frames == 1
+
+    with pytest.raises(ValueError) as err_info:
+        validator.push(frames[1, :1])
+    assert "``stack[1]``" in str(err_info.value)
+
+    with pytest.raises(TypeError):
+        validator.push(frames[1].astype(np.complex64))
+
+    validator.push(frames[1].astype(np.float64))
+    with czekitout.config.local_validation_level("off"):
+        validator.push(frames[2, :1])
+    assert validator.num_frames == 3
+
+    return None
+
+
+
+def test_2_of_FrameStackValidator():
+    frames = np.arange(3*2*4, dtype=np.float32).reshape((3, 2, 4))
+    out = np.zeros((2, 2, 4))
+
+    kwargs = {"obj_name": "stack",
+              "frame_convert_func_name": "to_real_numpy_matrix",
+              "frame_shape": (2, 4),
+              "dtype": "float64",
+              "out": out}
+    validator = czekitout.incremental.FrameStackValidator(**kwargs)
+    assert validator.stack.shape == (0, 2, 4)
+
+    result = validator.push(frames[0])
+    assert np.shares_memory(result, out)
+    assert np.array_equal(result, frames[0])
+
+    with pytest.raises(ValueError):
+        validator.push(frames[1, :1])
+    with pytest.raises(TypeError):
+        validator.push(frames[1] + 1j)
+
+    validator.push(frames[1].tolist())
+    assert np.array_equal(validator.stack, frames[:2])
+
+    with pytest.raises(ValueError) as err_info:
+        validator.push(frames[2])
+    assert "``stack``" in str(err_info.value)
+    assert validator.num_frames == 2
+
+    kwargs = {"obj_name": "stack",
+              "frame_convert_func_name": "to_bool_numpy_matrix",
+              "frame_shape": (2, 4),
+              "dtype": bool}
+    validator = czekitout.incremental.FrameStackValidator(**kwargs)
+    validator.push(np.ones((2, 4), dtype=bool))
+    with pytest.raises(ValueError):
+        validator.push(np.ones((4, 2), dtype=bool))
+
+    kwargs = {"obj_name": "stack",
+              "frame_convert_func_name": "to_complex_numpy_matrix",
+              "dtype": np.float32}
+    validator = czekitout.incremental.FrameStackValidator(**kwargs)
+    with pytest.raises(TypeError):
+        validator.push(frames[0] + 1j)
+
+    invalid_kwargs_sets = ({"frame_convert_func_name": "to_bool"},
+                           {"dtype": "not a dtype"},
+                           {"out": np.zeros((2, 4))},
+                           {"out": np.broadcast_to(0.0, (2, 2, 4))},
+                           {"out": np.zeros((2, 4, 2))},
+                           {"out": out, "dtype": np.float32})
+    for invalid_kwargs in invalid_kwargs_sets:
+        kwargs = {"obj_name": "stack",
+                  "frame_convert_func_name": "to_real_numpy_matrix",
+                  "frame_shape": (2, 4),
+                  **invalid_kwargs}
+        with pytest.raises((TypeError, ValueError)):
+            czekitout.incremental.FrameStackValidator(**kwargs)
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.io`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For importing ``czekitout`` in a fresh interpreter.
+import subprocess
+import sys
+
+
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For getting and overriding the validation level.
+import czekitout.config
+
+# For loading and converting numpy arrays stored in files.
+import czekitout.io
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+def test_1_of_lazy_import():
+    code = ("import sys, czekitout; "
+            "assert 'sqlite3' not in sys.modules; "
+            "czekitout.io.NpzArchive; "
+            "assert 'sqlite3' in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    return None
+
+
+
+def test_1_of_from_file_funcs(tmp_path, monkeypatch):
+    monkeypatch.setattr(czekitout.io, "_max_num_bytes_per_chunk", 64)
+
+    path = tmp_path / "stack.npy"
+    stack = np.arange(2*3*4, dtype=np.float32).reshape((2, 3, 4))
+    np.save(path, stack)
+
+    func = czekitout.io.to_real_numpy_array_3d_from_file
+    result = func(path)
+    assert isinstance(result, np.memmap)
+    assert not result.flags.writeable
+    assert result.dtype == np.float32
+    assert np.array_equal(result, stack)
+
+    result = func(str(path), mmap=False, dtype_policy="float64", copy=True)
+    assert not isinstance(result, np.memmap)
+    assert result.dtype == np.float64
+    assert np.array_equal(result, stack)
+
+    np.save(path, np.asfortranarray(stack))
+    assert np.array_equal(func(path), stack)
+
+    for validation_level in ("fast", "off"):
+        with czekitout.config.local_validation_level(validation_level):
+            assert np.array_equal(func(path), stack)
+
+    np.save(path, np.array(1.5))
+    func = czekitout.io.to_real_numpy_array_from_file
+    assert func(path) == 1.5
+
+    np.save(path, np.zeros((0, 2)))
+    func = czekitout.io.to_real_two_column_numpy_matrix_from_file
+    assert func(path).shape == (0, 2)
+
+    np.save(path, np.ones((2, 2), dtype=bool))
+    func = czekitout.io.to_bool_numpy_matrix_from_file
+    assert func(path).all()
+
+    return None
+
+
+
+def test_2_of_from_file_funcs(tmp_path, monkeypatch):
+    monkeypatch.setattr(czekitout.io, "_max_num_bytes_per_chunk", 64)
+
+    path = tmp_path / "stack.npy"
+    np.save(path, np.zeros((2, 3, 4)))
+
+    func_names = ("to_real_numpy_matrix_from_file",
+                  "to_bool_numpy_array_3d_from_file",
+                  "to_complex_numpy_array_from_file")
+    for func_name in func_names:
+        func = getattr(czekitout.io, func_name)
+        with pytest.raises(TypeError) as err_info:
+            func(path)
+        assert "(2, 3, 4)" in str(err_info.value)
+
+    stack = np.zeros((20, 3, 4))
+    stack[17, 1, 2] = np.nan
+    np.save(path, stack)
+    with pytest.raises(TypeError) as err_info:
+        czekitout.io.to_real_numpy_array_3d_from_file(path)
+    assert str(path) in str(err_info.value)
+
+    stack[17, 1, 2] = -1
+    np.save(path, stack)
+    with pytest.raises(ValueError):
+        czekitout.io.to_nonnegative_numpy_array_from_file(path)
+    with czekitout.config.local_validation_level("fast"):
+        czekitout.io.to_nonnegative_numpy_array_from_file(path)
+
+    path.write_bytes(b"not a .npy file")
+    for validation_level in ("full", "off"):
+        with czekitout.config.local_validation_level(validation_level):
+            with pytest.raises(ValueError):
+                czekitout.io.to_numpy_array_from_file(path)
+
+    np.save(path, np.array([None, 1]))
+    with pytest.raises(ValueError):
+        czekitout.io.to_numpy_array_from_file(path)
+
+    with pytest.raises(TypeError):
+        czekitout.io.to_numpy_array_from_file(None)
+
+    return None
+
+
+
+def test_1_of_NpzArchive(tmp_path):
+    path = tmp_path / "archive.npz"
+    image = np.arange(6.0).reshape((2, 3))
+    mask = np.array([[True, False]])
+    np.savez(path, image=image, mask=mask, labels=np.array([[-1, 2]]))
+
+    member_specs = {"image": "to_real_numpy_matrix",
+                    "mask": "to_bool_numpy_matrix",
+                    "labels": "to_nonnegative_numpy_matrix"}
+    with czekitout.io.NpzArchive(path, member_specs) as archive:
+        assert sorted(archive) == ["image", "labels", "mask"]
+        assert len(archive) == 3
+        assert "image" in archive
+        assert archive._member_arrays == dict()
+
+        assert np.array_equal(archive["image"], image)
+        assert archive["image"] is archive["image"]
+        assert np.array_equal(archive["mask"], mask)
+        assert list(archive._member_arrays) == ["image", "mask"]
+
+        with pytest.raises(ValueError) as err_info:
+            archive["labels"]
+        assert "labels" in str(err_info.value)
+
+        with pytest.raises(KeyError):
+            archive["missing"]
+
+    assert np.array_equal(archive["image"], image)
+
+    with czekitout.io.NpzArchive(str(path)) as archive:
+        assert np.array_equal(archive["labels"], [[-1, 2]])
+
+    np.savez(path, image=np.array([None]))
+    archive = czekitout.io.NpzArchive(path, {"image": "to_numpy_array"})
+    with pytest.raises(ValueError):
+        archive["image"]
+    archive = czekitout.io.NpzArchive(path)
+    with pytest.raises(ValueError):
+        archive["image"]
+    archive.close()
+
+    invalid_member_specs_sets = ({"image": "to_float"}, 3)
+    for invalid_member_specs in invalid_member_specs_sets:
+        with pytest.raises((TypeError, ValueError)):
+            czekitout.io.NpzArchive(path, invalid_member_specs)
+
+    path = tmp_path / "archive.npy"
+    np.save(path, image)
+    with pytest.raises(ValueError):
+        czekitout.io.NpzArchive(path)
+
+    return None
+
+
+
+@pytest.fixture
+def validation_cache_path(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    czekitout.config.set_validation_cache_path(path)
+    yield path
+    czekitout.config.set_validation_cache_path(None)
+
+    return None
+
+
+
+def test_1_of_validation_cache(tmp_path, monkeypatch, validation_cache_path):
+    num_chunk_checks = [0]
+    check_elems_chunk_by_chunk = czekitout.io._check_elems_chunk_by_chunk
+
+    def counting_check_elems_chunk_by_chunk(*args):
+        num_chunk_checks[0] += 1
+        check_elems_chunk_by_chunk(*args)
+
+        return None
+
+    kwargs = {"target": czekitout.io,
+              "name": "_check_elems_chunk_by_chunk",
+              "value": counting_check_elems_chunk_by_chunk}
+    monkeypatch.setattr(**kwargs)
+
+    path = tmp_path / "image.npy"
+    image = np.arange(6.0).reshape((2, 3))
+    np.save(path, image)
+
+    func = czekitout.io.to_nonnegative_numpy_matrix_from_file
+    for _ in range(3):
+        assert np.array_equal(func(path), image)
+    assert num_chunk_checks[0] == 1
+
+    czekitout.io.to_real_numpy_matrix_from_file(path)
+    assert num_chunk_checks[0] == 2
+
+    with czekitout.config.local_validation_level("fast"):
+        assert np.array_equal(func(path, mmap=False), image)
+    assert num_chunk_checks[0] == 2
+
+    image[0, 0] = -1
+    np.save(path, image)
+    with pytest.raises(ValueError):
+        func(path)
+    with pytest.raises(ValueError):
+        func(path)
+    assert num_chunk_checks[0] == 4
+
+    path.unlink()
+    with pytest.raises(OSError):
+        func(path)
+
+    archive_path = tmp_path / "archive.npz"
+    np.savez(archive_path, image=np.abs(image), labels=image)
+    member_specs = {"image": "to_nonnegative_numpy_matrix",
+                    "labels": "to_real_numpy_matrix"}
+    for _ in range(2):
+        with czekitout.io.NpzArchive(archive_path, member_specs) as archive:
+            assert np.array_equal(archive["image"], np.abs(image))
+            assert np.array_equal(archive["labels"], image)
+    assert num_chunk_checks[0] == 6
+
+    return None
+
+
+
+def test_2_of_validation_cache(tmp_path, validation_cache_path):
+    path = tmp_path / "image.npy"
+    np.save(path, np.zeros((2, 3)))
+
+    validation_cache = czekitout.io._current_validation_cache()
+    assert validation_cache is czekitout.io._current_validation_cache()
+    validation_cache._connection.close()
+    czekitout.io.to_real_numpy_matrix_from_file(path)
+    del czekitout.io._validation_caches[str(validation_cache_path)]
+
+    not_a_database_path = tmp_path / "not_a_database.sqlite"
+    not_a_database_path.write_bytes(b"not a database" * 16)
+    unusable_paths = (tmp_path / "missing_dir" / "cache.sqlite",
+                      tmp_path,
+                      not_a_database_path)
+    for validation_cache_path in unusable_paths:
+        czekitout.config.set_validation_cache_path(validation_cache_path)
+        with pytest.warns(RuntimeWarning):
+            result = czekitout.io.to_real_numpy_matrix_from_file(path)
+        assert np.array_equal(result, np.zeros((2, 3)))
+        assert czekitout.io._current_validation_cache() is None
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
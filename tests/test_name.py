@@ -21,6 +21,11 @@ r"""Contains tests for the module :mod:`czekitout.name`.
 ## Load libraries/packages/modules ##
 #####################################
 
+# For explicitly triggering garbage collection.
+import gc
+
+
+
 # For general array handling.
 import numpy as np
 
@@ -63,6 +68,42 @@ def test_1_of_fully_qualified_class_name():
 
 
 
+def test_1_of_fully_qualified_class_names():
+    module_alias = czekitout.name
+    func_alias = module_alias.fully_qualified_class_names
+
+    objs_or_clss = ([1, 2], tuple, np.polynomial.polynomial.Polynomial)
+    expected_result = ("list",
+                       "tuple",
+                       "numpy.polynomial.polynomial.Polynomial")
+    assert func_alias(objs_or_clss) == expected_result
+    assert func_alias(tuple()) == tuple()
+
+    return None
+
+
+
+def test_2_of_fully_qualified_class_name():
+    module_alias = czekitout.name
+    func_alias = module_alias.fully_qualified_class_name
+    cache = module_alias._fully_qualified_class_name_cache
+
+    cls = type("LocalCls", (), {})
+    expected_result = __name__ + ".LocalCls"
+    
+    assert func_alias(cls) == expected_result
+    assert cache[cls] == expected_result
+    assert func_alias(cls()) == expected_result
+
+    num_cached_classes = len(cache)
+    del cls
+    gc.collect()
+    assert len(cache) == num_cached_classes-1
+
+    return None
+
+
+
 ###########################
 ## Define error messages ##
 ###########################
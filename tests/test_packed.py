@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.packed`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For storing boolean arrays with one bit per element.
+import czekitout.packed
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+def test_1_of_PackedBoolArray():
+    mask = (np.arange(2*3*11).reshape((2, 3, 11)) % 4) == 1
+    data = np.packbits(mask, axis=-1)
+    packed_array = czekitout.packed.PackedBoolArray(data, mask.shape)
+
+    assert packed_array.data is data
+    assert (packed_array.shape, packed_array.ndim) == ((2, 3, 11), 3)
+    assert (packed_array.size, packed_array.nbytes) == (66, 12)
+    assert packed_array.dtype == bool
+    assert len(packed_array) == 2
+    assert repr(packed_array) == "PackedBoolArray(shape=(2, 3, 11))"
+
+    assert np.array_equal(packed_array.unpack(), mask)
+    assert np.array_equal(np.asarray(packed_array), mask)
+    assert np.array_equal(np.asarray(packed_array, dtype=int), mask)
+    with pytest.raises(ValueError):
+        np.asarray(packed_array, copy=False)
+
+    for key in (1, (1, slice(0, 2)), (slice(None), np.int64(2))):
+        result = packed_array[key]
+        assert isinstance(result, czekitout.packed.PackedBoolArray)
+        assert np.shares_memory(result.data, data)
+        assert np.array_equal(result.unpack(), mask[key])
+
+    keys = ((1, 2, 3), (0, slice(1, 3), slice(2, 9, 3)), (Ellipsis, 4), mask)
+    for key in keys:
+        result = packed_array[key]
+        assert isinstance(result, (np.ndarray, np.bool_))
+        assert np.array_equal(result, mask[key])
+
+    return None
+
+
+
+def test_2_of_PackedBoolArray():
+    data = np.zeros((2, 2), dtype=np.uint8)
+
+    invalid_args_sets = ((data, (2, 17)),
+                         (data, (2, 16, 1)),
+                         (data.astype(np.int8), (2, 16)),
+                         (data.tolist(), (2, 16)),
+                         (data, ()),
+                         (data, None),
+                         (np.zeros((1,), dtype=np.uint8), (-7,)))
+    for invalid_args in invalid_args_sets:
+        with pytest.raises(TypeError):
+            czekitout.packed.PackedBoolArray(*invalid_args)
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
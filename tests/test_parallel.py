@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.parallel`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For explicitly running the garbage collector.
+import gc
+
+# For creating weak references to objects.
+import weakref
+
+# For creating simple namespaces.
+import types
+
+# For mocking pools of processes.
+import concurrent.futures
+
+# For attaching to shared memory blocks.
+import multiprocessing.shared_memory
+
+# For importing ``czekitout`` in a fresh interpreter.
+import subprocess
+import sys
+
+
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For converting objects.
+import czekitout.convert
+
+# For setting context-local settings.
+import czekitout.config
+
+# For converting many objects to numpy arrays in parallel.
+import czekitout.parallel
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+def test_1_of_lazy_import():
+    code = ("import sys, czekitout; "
+            "assert 'multiprocessing' not in sys.modules; "
+            "czekitout.parallel.convert; "
+            "assert 'multiprocessing.shared_memory' in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    return None
+
+
+
+def test_1_of_convert():
+    objs = (np.arange(6.0).reshape((2, 3)),
+            [[1, 2], [3, 4]],
+            np.ones((3, 3), dtype=np.int32),
+            np.zeros((0, 2)))
+    expected_arrays = tuple(czekitout.convert.to_real_numpy_matrix(obj, "obj")
+                            for obj
+                            in objs)
+
+    for mode in ("serial", "thread", "process"):
+        kwargs = {"objs": (obj for obj in objs),
+                  "obj_name": "objs",
+                  "convert_func_name": "to_real_numpy_matrix",
+                  "mode": mode,
+                  "max_workers": 2}
+        arrays = czekitout.parallel.convert(**kwargs)
+
+        assert len(arrays) == len(expected_arrays)
+        for array, expected_array in zip(arrays, expected_arrays):
+            assert array.dtype == expected_array.dtype
+            assert np.array_equal(array, expected_array)
+
+    owner_ref = weakref.ref(arrays[0].base)
+    view = arrays[0][1:]
+    del array
+    del arrays
+    gc.collect()
+    assert owner_ref() is not None
+    assert view.tolist() == [[3.0, 4.0, 5.0]]
+
+    del view
+    gc.collect()
+    assert owner_ref() is None
+
+    return None
+
+
+
+def test_2_of_convert():
+    objs = (np.ones((2, 2)), -np.ones((2, 2)), [[-1]], [[1]])
+
+    for mode in ("serial", "thread", "process"):
+        kwargs = {"objs": objs,
+                  "obj_name": "objs",
+                  "convert_func_name": "to_nonnegative_numpy_matrix",
+                  "mode": mode}
+        with pytest.raises(ValueError) as err_info:
+            czekitout.parallel.convert(**kwargs)
+        assert "``objs[1]``" in str(err_info.value)
+
+    objs = (np.array([None, 1], dtype=object),)
+    arrays = czekitout.parallel.convert(objs, "objs", "to_numpy_array")
+    assert arrays[0].dtype == object
+    assert arrays[0].tolist() == [None, 1]
+
+    return None
+
+
+
+def test_3_of_convert():
+    kwargs = {"objs": ((1, 2),),
+              "obj_name": "objs",
+              "convert_func_name": "to_real_numpy_array"}
+
+    for key, value in (("objs", 1), ("obj_name", 1), ("mode", None)):
+        with pytest.raises(TypeError):
+            czekitout.parallel.convert(**{**kwargs, key: value})
+
+    for key, value in (("convert_func_name", "to_float"),
+                       ("mode", "processes"),
+                       ("max_workers", 0)):
+        with pytest.raises(ValueError):
+            czekitout.parallel.convert(**{**kwargs, key: value})
+
+    return None
+
+
+
+def test_4_of_convert(monkeypatch):
+    mock_os = types.SimpleNamespace(name="nt")
+    monkeypatch.setattr(czekitout.parallel, "os", mock_os)
+    czekitout.parallel._shut_down_reusable_process_pool()
+
+    objs = (np.ones((2, 2)), [[1, 2]])
+    arrays = czekitout.parallel.convert(objs, "objs", "to_real_numpy_matrix")
+    assert [array.tolist() for array in arrays] == [[[1, 1], [1, 1]], [[1, 2]]]
+
+    return None
+
+
+
+class _MockExecutor():
+    def __init__(self, submission_exception, result_exception=None):
+        self.submission_exception = submission_exception
+        self.result_exception = result_exception
+        self.num_submissions = 0
+
+    def submit(self, func, *args):
+        if self.num_submissions == 2:
+            raise self.submission_exception
+        self.num_submissions += 1
+        future = concurrent.futures.Future()
+        if self.result_exception is None:
+            future.set_result(func(*args))
+        else:
+            future.set_exception(self.result_exception)
+        return future
+
+
+
+def test_5_of_convert(monkeypatch):
+    block_names = []
+    share_array = czekitout.parallel._share_array
+
+    def _mock_share_array(array):
+        block, spec = share_array(array)
+        block_names.append(block.name)
+        return block, spec
+
+    mock_executor = _MockExecutor(submission_exception=RuntimeError)
+    monkeypatch.setattr(czekitout.parallel, "_process_pool", mock_executor)
+    monkeypatch.setattr(czekitout.parallel, "_share_array", _mock_share_array)
+
+    objs = (np.ones(2), np.ones(2, dtype=np.int32), np.ones(2))
+    with pytest.raises(RuntimeError):
+        czekitout.parallel.convert(objs, "objs", "to_complex_numpy_array")
+    assert czekitout.parallel._process_pool is mock_executor
+
+    assert len(block_names) == 5
+    for block_name in block_names:
+        with pytest.raises(FileNotFoundError):
+            multiprocessing.shared_memory.SharedMemory(name=block_name)
+
+    return None
+
+
+
+def test_6_of_convert(monkeypatch):
+    BrokenProcessPool = concurrent.futures.process.BrokenProcessPool
+    mock_executors = (_MockExecutor(submission_exception=BrokenProcessPool),
+                      _MockExecutor(submission_exception=RuntimeError,
+                                    result_exception=BrokenProcessPool()))
+
+    for num_objs, mock_executor in zip((3, 2), mock_executors):
+        monkeypatch.setattr(czekitout.parallel, "_process_pool", mock_executor)
+        objs = ([1], [2], [3])[:num_objs]
+        with pytest.raises(BrokenProcessPool):
+            czekitout.parallel.convert(objs, "objs", "to_real_numpy_array")
+        assert czekitout.parallel._process_pool is None
+
+    return None
+
+
+
+def test_7_of_convert():
+    objs = (np.arange(4.0), [1.0, 2.0])
+
+    for mode in ("serial", "thread", "process"):
+        with czekitout.config.local_dtype_policy("float32"):
+            arrays = czekitout.parallel.convert(objs,
+                                                "objs",
+                                                "to_real_numpy_array_1d",
+                                                mode)
+        assert [array.dtype for array in arrays] == [np.float32, np.float32]
+
+    with czekitout.config.local_validation_level("off"):
+        arrays = czekitout.parallel.convert(([-1.0],),
+                                            "objs",
+                                            "to_nonnegative_numpy_array")
+    assert arrays[0].tolist() == [-1.0]
+
+    return None
+
+
+
+def test_8_of_convert():
+    objs = ([1.0],)
+    func_name = "to_real_numpy_array"
+
+    czekitout.parallel.convert(objs, "objs", func_name, max_workers=1)
+    process_pool = czekitout.parallel._process_pool
+    czekitout.parallel.convert(objs, "objs", func_name, max_workers=1)
+    assert czekitout.parallel._process_pool is process_pool
+
+    czekitout.parallel.convert(objs, "objs", func_name, max_workers=2)
+    assert czekitout.parallel._process_pool is not process_pool
+
+    return None
+
+
+
+def test_1_of_convert_in_worker():
+    obj = np.arange(4.0)
+    input_block, spec = czekitout.parallel._share_array(obj)
+    input_blocks = {input_block.name: input_block}
+
+    settings = czekitout.parallel._current_settings()
+
+    args = ("to_real_numpy_array_1d", spec, "obj", settings)
+    output_spec = czekitout.parallel._convert_in_worker(*args)
+    assert output_spec is spec
+
+    args = ("to_real_numpy_matrix", spec, "obj", settings)
+    with pytest.raises(TypeError):
+        czekitout.parallel._convert_in_worker(*args)
+
+    args = ("to_complex_numpy_array", spec, "obj", settings)
+    complex_spec = czekitout.parallel._convert_in_worker(*args)
+    assert complex_spec.block_name != input_block.name
+    array = czekitout.parallel._array_of_worker_result(complex_spec,
+                                                       input_blocks)
+    assert np.array_equal(array, obj.astype(complex))
+    assert input_blocks == {input_block.name: input_block}
+
+    array = czekitout.parallel._array_of_worker_result(output_spec,
+                                                       input_blocks)
+    assert isinstance(array.base, czekitout.parallel._SharedArrayOwner)
+    assert array.base.block is input_block
+    assert np.array_equal(array, obj)
+    assert input_blocks == dict()
+
+    block_names = (input_block.name, complex_spec.block_name)
+    for block_name in block_names:
+        with pytest.raises(FileNotFoundError):
+            multiprocessing.shared_memory.SharedMemory(name=block_name)
+
+    return None
+
+
+
+def test_2_of_convert_in_worker():
+    settings = czekitout.parallel._current_settings()
+
+    args = ("to_real_numpy_array", [1, 2], "obj", settings)
+    output_spec = czekitout.parallel._convert_in_worker(*args)
+    array = czekitout.parallel._array_of_worker_result(output_spec, dict())
+    assert array.tolist() == [1, 2]
+
+    args = ("to_numpy_array", np.array([None], dtype=object), "obj", settings)
+    array = czekitout.parallel._convert_in_worker(*args)
+    assert array.tolist() == [None]
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
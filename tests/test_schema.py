@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.schema`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For raising exceptions with lazily formatted error messages.
+import czekitout.errors
+
+# For converting objects.
+import czekitout.convert
+
+# For validating and converting dictionary-like objects.
+import czekitout.schema
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+def test_1_of_Schema():
+    cls_alias = czekitout.schema.Schema
+
+    specs = {"a": "to_positive_float",
+             "b": "if_str_like",
+             "c": czekitout.convert.to_real_numpy_array,
+             "d": lambda obj, obj_name: 2*obj}
+    schema = cls_alias(specs=specs)
+
+    assert schema.allow_extra_keys is False
+    assert schema.specs["a"] is czekitout.convert.to_positive_float
+    assert schema.specs["d"] is specs["d"]
+
+    obj = {"d": 3, "c": (1, 2), "b": b"x", "a": "2"}
+    result = schema(obj=obj, obj_name="params")
+    assert tuple(result.keys()) == ("a", "b", "c", "d")
+    assert result["a"] == 2.0
+    assert result["b"] == b"x"
+    assert np.all(result["c"] == np.array((1.0, 2.0)))
+    assert result["d"] == 6
+
+    result = schema(obj=tuple(obj.items()), obj_name="params")
+    assert result["d"] == 6
+
+    with pytest.raises(TypeError):
+        schema(obj=3, obj_name="params")
+
+    return None
+
+
+
+def test_2_of_Schema():
+    cls_alias = czekitout.schema.Schema
+
+    specs = {"a": "to_positive_float",
+             "b": "if_str_like",
+             "c": "to_real_numpy_array"}
+    schema = cls_alias(specs=specs)
+
+    obj = {"a": -1, "c": "x", "e": 1, "f": 2}
+    with pytest.raises(czekitout.errors.SchemaValidationError) as err_info:
+        schema(obj=obj, obj_name="params")
+
+    exception = err_info.value
+    assert isinstance(exception, TypeError)
+    assert isinstance(exception, ValueError)
+    assert tuple(exception.errors.keys()) == ("a", "b", "c", "e", "f")
+    assert isinstance(exception.errors["a"], ValueError)
+    assert isinstance(exception.errors["b"], ValueError)
+    assert isinstance(exception.errors["c"], TypeError)
+    assert isinstance(exception.errors["e"], ValueError)
+
+    err_msg = str(exception)
+    assert err_msg.startswith("The object ``params`` failed validation")
+    for err in exception.errors.values():
+        assert str(err) in err_msg
+
+    schema = cls_alias(specs=specs, allow_extra_keys=True)
+    obj = {"a": 1, "b": "x", "c": 1, "e": 1}
+    result = schema(obj=obj, obj_name="params")
+    assert tuple(result.keys()) == ("a", "b", "c", "e")
+    assert result["e"] == 1
+
+    obj = {"a": 1, "c": 1, "e": 1}
+    with pytest.raises(czekitout.errors.SchemaValidationError) as err_info:
+        schema(obj=obj, obj_name="params")
+    assert tuple(err_info.value.errors.keys()) == ("b",)
+
+    return None
+
+
+
+def test_3_of_Schema():
+    cls_alias = czekitout.schema.Schema
+
+    for specs in (None, {1: "to_float"}):
+        with pytest.raises(TypeError):
+            cls_alias(specs=specs)
+
+    with pytest.raises(ValueError) as err_info:
+        cls_alias(specs={"a": "to_floats"})
+    assert "``a``" in str(err_info.value)
+
+    with pytest.raises(TypeError):
+        cls_alias(specs={"a": 3})
+
+    with pytest.raises(TypeError):
+        cls_alias(specs={"a": "to_float"}, allow_extra_keys=None)
+
+    return None
+
+
+
+def test_1_of_RecordSchema():
+    dtype = [("x", "f8"), ("y", "f8"), ("intensity", "f4"), ("flags", "u1")]
+    field_specs = {"x": "if_real_numpy_array_1d",
+                   "intensity": "if_nonnegative_numpy_array"}
+    record_schema = czekitout.schema.RecordSchema(dtype, field_specs)
+    assert record_schema.dtype == np.dtype(dtype)
+    assert list(record_schema.field_specs) == ["x", "intensity"]
+
+    records = [{"flags": 1, "intensity": 3.5, "y": 2.0, "x": 1.0},
+               (4.0, 5.0, 6.0, 0),
+               np.array([(7.0, 8.0, 9.0, 1)], dtype=dtype)[0]]
+    result = record_schema(records, "peaks")
+    assert result.dtype == np.dtype(dtype)
+    assert result["x"].tolist() == [1.0, 4.0, 7.0]
+    assert result["flags"].tolist() == [1, 0, 1]
+
+    assert record_schema(result, "peaks") is result
+    assert record_schema((), "peaks").shape == (0,)
+
+    extended_dtype = dtype + [("label", "U4")]
+    extended_result = np.zeros((2,), dtype=extended_dtype)
+    assert record_schema(extended_result, "peaks") is extended_result
+
+    result["x"][1] = np.nan
+    result["intensity"][2] = -1
+    with pytest.raises(czekitout.errors.SchemaValidationError) as err_info:
+        record_schema(result, "peaks")
+    assert list(err_info.value.errors) == ["x", "intensity"]
+    assert "``peaks['x']``" in str(err_info.value)
+
+    with pytest.raises(czekitout.errors.SchemaValidationError) as err_info:
+        record_schema(np.zeros((2,), dtype=dtype[1:]), "peaks")
+    assert list(err_info.value.errors) == ["x"]
+
+    return None
+
+
+
+def test_2_of_RecordSchema():
+    dtype = [("x", "f8"), ("flags", "u1")]
+    record_schema = czekitout.schema.RecordSchema(dtype)
+    assert record_schema.field_specs == dict()
+
+    invalid_objs = ([(1.0, 2, 3)], [{"x": 1.0}], ["ab"], [("ab", 1)])
+    for invalid_obj in invalid_objs:
+        with pytest.raises(TypeError) as err_info:
+            record_schema(invalid_obj, "peaks")
+        assert "``peaks[0]``" in str(err_info.value)
+
+    for invalid_obj in (3, iter([(1.0, 2)])):
+        with pytest.raises(TypeError):
+            record_schema(invalid_obj, "peaks")
+
+    for invalid_dtype in ("f8", "not a dtype"):
+        with pytest.raises(TypeError):
+            czekitout.schema.RecordSchema(invalid_dtype)
+
+    with pytest.raises(ValueError):
+        czekitout.schema.RecordSchema(dtype, {"y": "if_float"})
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################
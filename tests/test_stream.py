@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Matthew Fitzpatrick.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/gpl-3.0.html>.
+r"""Contains tests for the module :mod:`czekitout.stream`.
+
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For creating unbounded iterators.
+import itertools
+
+
+
+# For general array handling.
+import numpy as np
+
+# For operations related to unit tests.
+import pytest
+
+
+
+# For validating and converting the elements of iterables lazily.
+import czekitout.stream
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+
+
+def test_1_of_Stream():
+    stream = czekitout.stream.Stream(obj_name="obj",
+                                     iterable=itertools.count(),
+                                     elem_spec="to_positive_float")
+    assert iter(stream) is stream
+    assert stream.num_elems_pulled == 0
+
+    with pytest.raises(ValueError) as err_info:
+        next(stream)
+    assert "``obj[0]``" in str(err_info.value)
+
+    assert next(stream) == 1.0
+    assert type(next(stream)) is float
+    assert stream.num_elems_pulled == 3
+
+    elems = (elem for elem in (1, 2, "a", 4))
+    stream = czekitout.stream.Stream(elems, "obj", "to_float")
+    assert next(stream) == 1.0
+    assert next(stream) == 2.0
+    with pytest.raises(TypeError) as err_info:
+        next(stream)
+    assert "``obj[2]``" in str(err_info.value)
+    assert list(stream) == [4.0]
+
+    return None
+
+
+
+def test_2_of_Stream():
+    kwargs = {"iterable": ("a", "b"), "obj_name": "obj"}
+
+    stream = czekitout.stream.Stream(elem_spec="if_str_like", **kwargs)
+    assert list(stream) == ["a", "b"]
+
+    elem_spec = lambda obj, obj_name: obj.upper()
+    stream = czekitout.stream.Stream(elem_spec=elem_spec, **kwargs)
+    assert list(stream) == ["A", "B"]
+
+    with pytest.raises(ValueError):
+        czekitout.stream.Stream(elem_spec="to_foo", **kwargs)
+
+    kwargs = {"iterable": 1, "obj_name": "obj", "elem_spec": "if_str_like"}
+    with pytest.raises(TypeError):
+        czekitout.stream.Stream(**kwargs)
+
+    kwargs = {"iterable": (), "obj_name": 1, "elem_spec": "if_str_like"}
+    with pytest.raises(TypeError):
+        czekitout.stream.Stream(**kwargs)
+
+    return None
+
+
+
+def test_1_of_chunks():
+    stream = czekitout.stream.Stream(itertools.count(), "obj", "to_int")
+    chunks = stream.chunks(chunk_size=4)
+
+    for chunk_idx in range(3):
+        chunk = next(chunks)
+        assert isinstance(chunk, np.ndarray)
+        assert chunk.tolist() == list(range(4*chunk_idx, 4*chunk_idx+4))
+    assert stream.num_elems_pulled == 12
+
+    elems = (elem for elem in (1, 2.5, 3, 4, 5))
+    stream = czekitout.stream.Stream(elems, "obj", "to_int")
+    with pytest.raises(TypeError) as err_info:
+        next(stream.chunks(3))
+    assert "``obj[1]``" in str(err_info.value)
+    assert stream.num_elems_pulled == 2
+    assert [chunk.tolist() for chunk in stream.chunks(3)] == [[3, 4, 5]]
+    assert stream.num_elems_pulled == 5
+
+    elems = iter((1, 2, -3, 4, 5, 6, 7))
+    stream = czekitout.stream.Stream(elems, "obj", "to_positive_int")
+    with pytest.raises(ValueError) as err_info:
+        list(stream.chunks(4))
+    assert "``obj[2]``" in str(err_info.value)
+    assert list(stream) == [4, 5, 6, 7]
+
+    elems = iter(("a", 1, "b", "c", "d"))
+    stream = czekitout.stream.Stream(elems, "obj", "if_str_like")
+    with pytest.raises(TypeError):
+        next(stream.chunks(3))
+    assert list(stream.chunks(3)) == [["b", "c", "d"]]
+    assert stream.num_elems_pulled == 5
+
+    elems = (2**70, 1)
+    chunks = czekitout.stream.Stream(elems, "obj", "to_int").chunks(3)
+    assert next(chunks).tolist() == [2**70, 1]
+
+    elems = ("a", "b", "c")
+    chunks = czekitout.stream.Stream(elems, "obj", "if_str_like").chunks(2)
+    assert list(chunks) == [["a", "b"], ["c"]]
+
+    for chunk_size in (0, 1.5, None):
+        with pytest.raises((TypeError, ValueError)):
+            czekitout.stream.Stream(elems, "obj", "to_int").chunks(chunk_size)
+
+    return None
+
+
+
+###########################
+## Define error messages ##
+###########################